@@ -0,0 +1,81 @@
+import argparse
+import json
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Запуск как скрипта (python benchmarks/bench_dataframe.py) из корня проекта
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.bench_storage import RESULTS_DIR, build_store, git_revision, measure, store_calls  # noqa: E402
+from src.dataframe_handler import DataFrameFileHandler  # noqa: E402
+from src.file_handler import FileHandler  # noqa: E402
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+KEYWORDS = ["python", "разработчик"]
+SALARY_RANGE = (100000.0, 200000.0)
+
+
+def run_handler(name: str, handler: FileHandler, size: int) -> List[Dict[str, Any]]:
+    """Измеряет фильтрацию хранилища; name добавляется к названию операции."""
+    calls = store_calls(size)
+    return [
+        measure(f"{name}.filter_vacancies", size, calls, size, lambda _: handler.filter_vacancies(KEYWORDS)),
+        measure(
+            f"{name}.filter_by_salary", size, calls, size, lambda _: handler.filter_vacancies_by_salary(SALARY_RANGE)
+        ),
+    ]
+
+
+def run_masks(handler: DataFrameFileHandler, size: int) -> List[Dict[str, Any]]:
+    """Измеряет только векторные маски, без превращения строк результата в словари."""
+    calls = store_calls(size)
+    return [
+        measure("dataframe.keywords_mask", size, calls, size, lambda _: handler.keywords_mask(KEYWORDS)),
+        measure("dataframe.salary_mask", size, calls, size, lambda _: handler.salary_mask(SALARY_RANGE)),
+    ]
+
+
+def run_size(size: int, workdir: Path) -> List[Dict[str, Any]]:
+    """Строит оба хранилища из одних и тех же данных и измеряет загрузку и фильтрацию."""
+    json_handler = build_store(str(workdir / f"vacancies_{size}.json"), size)
+    frame_filename = str(workdir / f"vacancies_{size}.pkl")
+    DataFrameFileHandler(frame_filename)._save_frame(DataFrameFileHandler.records_to_frame(json_handler._load_data()))
+
+    results = [
+        measure("json.load", size, 3, size, lambda _: json_handler._load_data()),
+        measure("dataframe.load", size, 3, size, lambda _: DataFrameFileHandler(frame_filename)._load_frame()),
+    ]
+    frame_handler = DataFrameFileHandler(frame_filename)
+    results += run_handler("json", json_handler, size)
+    results += run_handler("dataframe", frame_handler, size)
+    results += run_masks(frame_handler, size)
+    return results
+
+
+def main() -> None:
+    """Сравнение JSONFileHandler и DataFrameFileHandler на синтетических данных разного объёма."""
+    parser = argparse.ArgumentParser(description="Бенчмарк хранилища DataFrame против JSON.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Размеры данных")
+    parser.add_argument("--output", default=None, help="Файл для результатов (по умолчанию benchmarks/results/)")
+    args = parser.parse_args()
+
+    report: Dict[str, Any] = {
+        "meta": {"timestamp": datetime.now().isoformat(timespec="seconds"), "revision": git_revision()},
+        "results": [],
+    }
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in args.sizes:
+            report["results"].extend(run_size(size, Path(workdir)))
+
+    output = Path(args.output) if args.output else RESULTS_DIR / f"dataframe_{datetime.now():%Y%m%d_%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w", encoding="utf-8") as file:
+        json.dump(report, file, ensure_ascii=False, indent=4)
+    print(f"\nРезультаты сохранены в {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+import argparse
+import contextlib
+import io
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# Запуск как скрипта (python benchmarks/bench_storage.py) из корня проекта
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.generator import generate_vacancies, generate_vacancy  # noqa: E402
+from src.file_handler import JSONFileHandler  # noqa: E402
+from src.helpers import clean_html  # noqa: E402
+from src.vacancy import Vacancy  # noqa: E402
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Возвращает перцентиль по отсортированному списку значений (метод ближайшего ранга)."""
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def store_calls(size: int) -> int:
+    """Число повторов операций над всем хранилищем: меньше для больших хранилищ, но не меньше трёх."""
+    return max(3, min(50, 200_000 // size))
+
+
+def measure(
+    operation: str, size: int, calls: int, records_per_call: int, func: Callable[[int], Any]
+) -> Dict[str, Any]:
+    """
+    Измеряет операцию: задержку каждого вызова, пропускную способность и пиковую память.
+    Пиковая память измеряется отдельным вызовом под tracemalloc, чтобы трассировка не искажала время.
+    :param operation: Название операции.
+    :param size: Размер хранилища или число записей.
+    :param calls: Число измеряемых вызовов.
+    :param records_per_call: Сколько записей обрабатывает один вызов (для пропускной способности в записях/с).
+    :param func: Функция, принимающая номер вызова.
+    :return: Словарь с результатами.
+    """
+    latencies = []
+    for call in range(calls):
+        started = time.perf_counter()
+        func(call)
+        latencies.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    func(calls)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latencies_ms = sorted(latency * 1000 for latency in latencies)
+    total = sum(latencies)
+    result = {
+        "operation": operation,
+        "size": size,
+        "calls": calls,
+        "calls_per_s": round(calls / total, 3) if total else None,
+        "records_per_s": round(calls * records_per_call / total, 1) if total else None,
+        "p50_ms": round(percentile(latencies_ms, 0.5), 4),
+        "p95_ms": round(percentile(latencies_ms, 0.95), 4),
+        "p99_ms": round(percentile(latencies_ms, 0.99), 4),
+        "peak_memory_mb": round(peak / 1024 / 1024, 2),
+    }
+    print(
+        f"{operation:<28} {size:>9} | {result['records_per_s']:>12} зап/с | p50 {result['p50_ms']:>10} мс | "
+        f"p99 {result['p99_ms']:>10} мс | пик {result['peak_memory_mb']:>8} МБ"
+    )
+    return result
+
+
+def build_store(filename: str, size: int) -> JSONFileHandler:
+    """
+    Создаёт хранилище из синтетических вакансий в том виде, в каком их сохраняет add_vacancy:
+    каждая вакансия проходит JSONFileHandler._prepare_vacancy (очистка HTML, основы слов, поля зарплаты).
+    """
+    data = []
+    for vacancy in generate_vacancies(size, seed=size):
+        JSONFileHandler._prepare_vacancy(vacancy)
+        data.append(vacancy)
+    handler = JSONFileHandler(filename)
+    handler._save_data(data)
+    return handler
+
+
+def run_record_operations(size: int) -> List[Dict[str, Any]]:
+    """Измеряет операции над отдельными записями: очистку HTML и создание Vacancy."""
+    html_descriptions = [v["description"] for v in generate_vacancies(size, seed=size)]
+    raw_vacancies = list(generate_vacancies(size, seed=size))
+    return [
+        measure("clean_html", size, 3, size, lambda _: [clean_html(text) for text in html_descriptions]),
+        measure(
+            "Vacancy.__init__",
+            size,
+            3,
+            size,
+            lambda _: [Vacancy(v["title"], v["link"], v["salary"], v["description"]) for v in raw_vacancies],
+        ),
+    ]
+
+
+def run_store_operations(size: int, workdir: Path) -> List[Dict[str, Any]]:
+    """Измеряет операции над хранилищем: фильтрацию и добавление вакансии."""
+    handler = build_store(str(workdir / f"vacancies_{size}.json"), size)
+    calls = store_calls(size)
+    results = [
+        measure("filter_vacancies", size, calls, size, lambda _: handler.filter_vacancies(["python", "разработчик"])),
+        measure(
+            "filter_vacancies_by_salary",
+            size,
+            calls,
+            size,
+            lambda _: handler.filter_vacancies_by_salary((100000, 200000)),
+        ),
+    ]
+
+    def add_vacancy_quietly(call: int) -> None:
+        # add_vacancy печатает сообщение на каждую вакансию; в отчёте бенчмарка оно не нужно
+        with contextlib.redirect_stdout(io.StringIO()):
+            handler.add_vacancy(generate_vacancy(size * 10 + call))
+
+    results.append(measure("add_vacancy", size, calls, 1, add_vacancy_quietly))
+    return results
+
+
+def git_revision() -> Optional[str]:
+    """Возвращает хеш текущего коммита, если проект находится в git-репозитории."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(current: Dict[str, Any], baseline_path: str) -> None:
+    """Печатает отношение медианной задержки текущего прогона к сохранённому (больше 1 — замедление)."""
+    with open(baseline_path, encoding="utf-8") as file:
+        baseline = json.load(file)
+    previous = {(r["operation"], r["size"]): r for r in baseline["results"]}
+    print(f"\nСравнение с {baseline_path} ({baseline['meta'].get('revision')}):")
+    for result in current["results"]:
+        old = previous.get((result["operation"], result["size"]))
+        if old and old["p50_ms"]:
+            ratio = result["p50_ms"] / old["p50_ms"]
+            marker = "  <-- возможное замедление" if ratio > 1.2 else ""
+            print(f"{result['operation']:<28} {result['size']:>9} | p50 x{ratio:.2f}{marker}")
+
+
+def main() -> None:
+    """Бенчмарк хранилища, фильтрации и добавления вакансий на синтетических данных разного объёма."""
+    parser = argparse.ArgumentParser(description="Бенчмарк операций с вакансиями.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Размеры данных")
+    parser.add_argument("--output", default=None, help="Файл для результатов (по умолчанию benchmarks/results/)")
+    parser.add_argument("--compare", default=None, help="Файл с результатами предыдущего прогона для сравнения")
+    args = parser.parse_args()
+
+    report: Dict[str, Any] = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": [],
+    }
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in args.sizes:
+            report["results"].extend(run_record_operations(size))
+            report["results"].extend(run_store_operations(size, Path(workdir)))
+
+    output = Path(args.output) if args.output else RESULTS_DIR / f"bench_{datetime.now():%Y%m%d_%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w", encoding="utf-8") as file:
+        json.dump(report, file, ensure_ascii=False, indent=4)
+    print(f"\nРезультаты сохранены в {output}")
+
+    if args.compare:
+        compare(report, args.compare)
+
+
+if __name__ == "__main__":
+    main()
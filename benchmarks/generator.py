@@ -0,0 +1,105 @@
+import random
+from typing import Any, Dict, Iterator
+
+ROLES = [
+    "Разработчик Python",
+    "Backend-разработчик",
+    "Frontend-разработчик",
+    "Java-разработчик",
+    "Аналитик данных",
+    "Тестировщик",
+    "Инженер-конструктор",
+    "Системный администратор",
+    "DevOps-инженер",
+    "Менеджер проектов",
+    "Бухгалтер",
+    "Специалист технической поддержки",
+    "Data Scientist",
+    "Дизайнер интерфейсов",
+    "Водитель-экспедитор",
+]
+LEVELS = ["Junior", "Middle", "Senior", "Ведущий", "Старший", "Главный", ""]
+SKILLS = [
+    "Python",
+    "Django",
+    "PostgreSQL",
+    "Java",
+    "Spring",
+    "JavaScript",
+    "React",
+    "Docker",
+    "Kubernetes",
+    "SQL",
+    "1С",
+    "AutoCAD",
+    "Excel",
+    "Linux",
+    "Git",
+    "машинного обучения",
+]
+PHRASES = [
+    "Опыт работы {skill} от {years} лет",
+    "Уверенное знание {skill}",
+    "Опыт коммерческой разработки на {skill}",
+    "Понимание принципов работы {skill}",
+    "Высшее техническое образование",
+    "Умение работать в команде и разбираться в чужом коде",
+    "Готовность к командировкам",
+    "Знание английского языка на уровне чтения технической документации",
+    "Ответственность, внимательность к деталям",
+    "Опыт написания автоматических тестов",
+]
+HTML_WRAPPERS = ["{}", "<highlighttext>{}</highlighttext>", "<b>{}</b>", "<i>{}</i>", "<p>{}</p>"]
+
+
+def generate_description(rng: random.Random, html: bool = True) -> str:
+    """
+    Генерирует описание требований, похожее на фрагменты requirement из API HeadHunter.
+    :param rng: Генератор случайных чисел.
+    :param html: Оборачивать ли навыки и фразы в HTML-теги.
+    :return: Текст описания.
+    """
+    sentences = []
+    for phrase in rng.sample(PHRASES, rng.randint(2, 4)):
+        skill = rng.choice(SKILLS)
+        if html:
+            skill = rng.choice(HTML_WRAPPERS).format(skill)
+        sentence = phrase.format(skill=skill, years=rng.randint(1, 5))
+        sentences.append(rng.choice(HTML_WRAPPERS).format(sentence) if html else sentence)
+    return ". ".join(sentences) + "..."
+
+
+def generate_salary(rng: random.Random) -> Any:
+    """
+    Генерирует зарплату: логнормальное распределение с медианой около 110 000 руб.,
+    округлённое до тысяч; примерно у 15% вакансий зарплата не указана.
+    """
+    if rng.random() < 0.15:
+        return "Зарплата не указана"
+    return float(round(rng.lognormvariate(11.6, 0.45), -3))
+
+
+def generate_vacancies(count: int, seed: int = 1, html: bool = True, start_id: int = 0) -> Iterator[Dict[str, Any]]:
+    """
+    Генерирует синтетические вакансии в формате хранилища.
+    :param count: Количество вакансий.
+    :param seed: Зерно генератора (одинаковое зерно — одинаковые данные).
+    :param html: Оставлять ли HTML-теги в описании.
+    :param start_id: Начальный номер для ссылок.
+    :return: Итератор словарей с полями title, link, salary, description.
+    """
+    rng = random.Random(seed)
+    for number in range(start_id, start_id + count):
+        level = rng.choice(LEVELS)
+        role = rng.choice(ROLES)
+        yield {
+            "title": f"{level} {role}".strip(),
+            "link": f"https://hh.ru/vacancy/{100000000 + number}",
+            "salary": generate_salary(rng),
+            "description": generate_description(rng, html),
+        }
+
+
+def generate_vacancy(number: int) -> Dict[str, Any]:
+    """Генерирует одну вакансию с уникальной ссылкой по номеру (удобно для измерения добавления)."""
+    return next(generate_vacancies(1, seed=number, start_id=number))
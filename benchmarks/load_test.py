@@ -0,0 +1,73 @@
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Tuple
+from urllib.parse import quote
+from urllib.request import urlopen
+
+# Запуск как скрипта (python benchmarks/load_test.py) из корня проекта
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.bench_storage import percentile  # noqa: E402
+
+# Набор запросов, имитирующий типичную нагрузку: поиск по словам, по зарплате и top-N
+QUERIES = [
+    "/vacancies?keywords=python",
+    "/vacancies?keywords=разработчик&top=10",
+    "/vacancies?salary_min=100000&salary_max=200000",
+    "/vacancies?keywords=java+python&salary_min=150000&top=20",
+    "/vacancies?top=50",
+    "/health",
+]
+
+
+def run_request(base_url: str, path: str) -> Tuple[float, bool]:
+    """Выполняет один запрос и возвращает (задержка в секундах, успех)."""
+    started = time.perf_counter()
+    try:
+        with urlopen(base_url + quote(path, safe="/?=&+"), timeout=30) as response:
+            response.read()
+            ok = response.status == 200
+    except OSError:
+        ok = False
+    return time.perf_counter() - started, ok
+
+
+def main() -> None:
+    """Нагрузочный тест HTTP-сервиса вакансий (сервис запускается отдельно: python serve.py)."""
+    parser = argparse.ArgumentParser(description="Нагрузочный тест локального сервиса вакансий.")
+    parser.add_argument("--url", default="http://127.0.0.1:8000", help="Адрес сервиса")
+    parser.add_argument("--requests", type=int, default=2000, help="Общее число запросов")
+    parser.add_argument("--concurrency", type=int, default=16, help="Число параллельных клиентов")
+    parser.add_argument("--seed", type=int, default=1, help="Зерно для выбора запросов")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    paths = [rng.choice(QUERIES) for _ in range(args.requests)]
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        results = list(executor.map(lambda path: run_request(args.url, path), paths))
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(latency * 1000 for latency, _ in results)
+    errors = sum(1 for _, ok in results if not ok)
+    print(f"Запросов: {len(results)}, ошибок: {errors}, время: {elapsed:.2f} с")
+    print(f"Пропускная способность: {len(results) / elapsed:.1f} запросов/с")
+    print(
+        f"Задержка, мс: среднее {statistics.mean(latencies):.2f}, p50 {percentile(latencies, 0.5):.2f}, "
+        f"p95 {percentile(latencies, 0.95):.2f}, p99 {percentile(latencies, 0.99):.2f}, max {latencies[-1]:.2f}"
+    )
+
+    with urlopen(args.url + "/metrics", timeout=30) as response:
+        print("Гистограммы сервиса:")
+        print(json.dumps(json.loads(response.read()), ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
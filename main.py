@@ -1,9 +1,14 @@
 from typing import Any, Dict, List
 
-from src.api_handler import HeadHunterAPI
+from src.aggregator import VacancyAggregator
+from src.export import export_vacancies
 from src.file_handler import JSONFileHandler
 from src.helpers import clean_html, parse_salary_range
-from src.vacancy import Vacancy
+from src.ingest import IngestWorker
+from src.metrics import install_from_env
+from src.query import Query
+from src.salary_stats import salary_stats, salary_stats_by_keyword
+from src.saved_search import SavedSearchManager
 
 
 def display_vacancies(vacancies: List[Dict[str, Any]]) -> None:
@@ -26,15 +31,33 @@ def display_vacancies(vacancies: List[Dict[str, Any]]) -> None:
 
 def user_interaction() -> None:
     """Функция для взаимодействия с пользователем через консоль."""
+    # Хранилище только проверяет наличие файла; данные читаются при первом действии, а не до показа меню
     json_saver = JSONFileHandler()
+    # Загрузка из API и запись в хранилище выполняются в фоновом потоке, меню остаётся доступным.
+    # Поиск идёт одновременно во всех доступных источниках (HeadHunter, SuperJob при заданном ключе).
+    ingest_worker = IngestWorker(json_saver, VacancyAggregator())
+    # Результаты сохранённых поисков обновляются при каждом изменении хранилища
+    saved_searches = SavedSearchManager(json_saver)
 
     while True:
+        for job in ingest_worker.pop_finished():
+            print(job.summary())
+        for job in ingest_worker.active_jobs():
+            print(f"Фоновая загрузка {job.progress()}")
+
         print("\nМеню:")
-        print("1. Добавить вакансии из HeadHunter")
+        print("1. Добавить вакансии из HeadHunter и других источников (в фоне)")
         print("2. Удалить вакансию по ID")
         print("3. Фильтровать вакансии по ключевым словам")
         print("4. Фильтровать вакансии по зарплате")
         print("5. Показать все вакансии")
+        print("7. Комбинированный фильтр (ключевые слова, зарплата, топ-N)")
+        print("8. Показать фоновые загрузки")
+        print("9. Отменить фоновую загрузку")
+        print("10. Статистика зарплат")
+        print("11. Выгрузить вакансии в файл (CSV, XLSX)")
+        print("12. Сохранить поиск")
+        print("13. Открыть сохранённый поиск")
         print("6. Выйти")
 
         choice = input("Выберите действие: ").strip()
@@ -44,23 +67,8 @@ def user_interaction() -> None:
             if not search_query:
                 print("Поисковый запрос не может быть пустым.")
                 continue
-            hh_api = HeadHunterAPI()
-            try:
-                hh_vacancies = hh_api.get_vacancies(search_query)
-                for vacancy in hh_vacancies:
-                    try:
-                        vacancy_data = Vacancy(
-                            title=vacancy["title"],
-                            link=vacancy["link"],
-                            salary=vacancy.get("salary", "Зарплата не указана"),
-                            description=vacancy.get("description", "Описание отсутствует"),
-                        ).to_dict()
-                        json_saver.add_vacancy(vacancy_data)
-                        print(f"Вакансия «{vacancy['title']}» успешно добавлена.")  # Явное сообщение
-                    except ValueError as e:
-                        print(f"Ошибка при добавлении вакансии: {e}")
-            except ConnectionError as e:
-                print(f"Ошибка подключения к API: {e}")
+            job = ingest_worker.submit(search_query)
+            print(f"Загрузка [{job.job_id}] «{search_query}» поставлена в очередь.")
 
         elif choice == "2":
             vacancy_id = input("Введите ID вакансии для удаления: ").strip()
@@ -88,7 +96,84 @@ def user_interaction() -> None:
             all_vacancies = json_saver.filter_vacancies([])
             display_vacancies(all_vacancies)
 
+        elif choice == "7":
+            query = Query().keywords(*input("Введите ключевые слова (через пробел, Enter — любые): ").strip().split())
+            salary_range_input = input("Введите диапазон зарплат (минимум-максимум, Enter — любой): ").strip()
+            if salary_range_input:
+                try:
+                    query.salary(*parse_salary_range(salary_range_input))
+                except ValueError as e:
+                    print(e)
+                    continue
+            top_n_input = input("Сколько вакансий с наибольшей зарплатой показать (Enter — все): ").strip()
+            query.order_by("salary")
+            if top_n_input.isdigit():
+                query.limit(int(top_n_input))
+            display_vacancies(query.execute(json_saver))
+
+        elif choice == "8":
+            if not ingest_worker.jobs:
+                print("Фоновых загрузок нет.")
+            for job in ingest_worker.jobs:
+                print(job.summary() if job.finished else job.progress())
+
+        elif choice == "9":
+            job_id = input("Введите номер загрузки для отмены: ").strip()
+            if job_id.isdigit() and ingest_worker.cancel(int(job_id)):
+                print(f"Загрузка [{job_id}] будет отменена.")
+            else:
+                print("Активная загрузка с таким номером не найдена.")
+
+        elif choice == "10":
+            keywords = input("Введите ключевые слова (через пробел, Enter — по всем вакансиям): ").strip().split()
+            if keywords:
+                for keyword, stats in salary_stats_by_keyword(json_saver.iter_vacancies(), keywords).items():
+                    print(f"\n«{keyword}»:\n{stats.format()}")
+            else:
+                print(salary_stats(json_saver.iter_vacancies()).format())
+
+        elif choice == "11":
+            path = input("Введите имя файла (.csv или .xlsx): ").strip()
+            keywords = input("Введите ключевые слова (через пробел, Enter — любые): ").strip().split()
+            salary_range_input = input("Введите диапазон зарплат (минимум-максимум, Enter — любой): ").strip()
+            export_range = parse_salary_range(salary_range_input) if salary_range_input else None
+            try:
+                count = export_vacancies(json_saver, path, keywords=keywords, salary_range=export_range)
+                print(f"Выгружено вакансий: {count} в {path}")
+            except (ValueError, OSError) as e:
+                print(f"Не удалось выгрузить вакансии: {e}")
+
+        elif choice == "12":
+            name = input("Введите имя поиска: ").strip()
+            keywords = input("Введите ключевые слова (через пробел, Enter — любые): ").strip().split()
+            salary_range_input = input("Введите диапазон зарплат (минимум-максимум, Enter — любой): ").strip()
+            search_range = parse_salary_range(salary_range_input) if salary_range_input else None
+            try:
+                search = saved_searches.create(name, keywords, search_range)
+                print(f"Поиск сохранён: {search.describe()}")
+            except ValueError as e:
+                print(e)
+
+        elif choice == "13":
+            if not saved_searches.searches():
+                print("Сохранённых поисков нет.")
+                continue
+            for search in saved_searches.searches():
+                print(search.describe())
+            name = input("Введите имя поиска: ").strip()
+            if saved_searches.get(name) is None:
+                print("Поиск с таким именем не найден.")
+                continue
+            vacancies, new_count = saved_searches.open(name)
+            display_vacancies(vacancies)
+            print(f"Вакансий: {len(vacancies)}, новых с прошлого просмотра: {new_count}")
+
         elif choice == "6":
+            if ingest_worker.active_jobs():
+                print("Ожидание завершения фоновых загрузок...")
+            ingest_worker.shutdown()
+            for job in ingest_worker.pop_finished():
+                print(job.summary())
             print("Выход из программы.")  # Явное сообщение
             break
 
@@ -97,4 +182,5 @@ def user_interaction() -> None:
 
 
 if __name__ == "__main__":
+    install_from_env()
     user_interaction()
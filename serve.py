@@ -0,0 +1,29 @@
+import argparse
+
+from src.file_handler import JSONFileHandler
+from src.metrics import install_from_env
+from src.service import create_server
+
+
+def main() -> None:
+    """Запускает локальный HTTP-сервис запросов к хранилищу вакансий."""
+    parser = argparse.ArgumentParser(description="Локальный JSON API над хранилищем вакансий.")
+    parser.add_argument("--host", default="127.0.0.1", help="Адрес для прослушивания")
+    parser.add_argument("--port", type=int, default=8000, help="Порт")
+    parser.add_argument("--workers", type=int, default=8, help="Размер пула потоков-обработчиков")
+    parser.add_argument("--file", default="data/vacancies.json", help="JSON-файл с вакансиями")
+    args = parser.parse_args()
+    install_from_env()
+
+    server = create_server(JSONFileHandler(args.file), args.host, args.port, args.workers)
+    print(f"Вакансий загружено: {len(server.service)}. Сервис доступен на http://{args.host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("Остановка сервиса.")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Dict, List, Optional
+
+from src.api_handler import APIHandler, create_api_handlers
+from src.dedup import NearDuplicateDetector, duplicate_scope, vacancy_signature
+from src.metrics import increment, timed
+from src.vacancy import Vacancy
+
+
+class SourceReport:
+    """Итог запроса к одному источнику: сколько вакансий получено, за какое время и чем закончился запрос."""
+
+    OK = "готово"
+    TIMEOUT = "превышено время ожидания"
+    FAILED = "ошибка"
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.status = self.OK
+        self.received = 0
+        self.elapsed = 0.0
+        self.error_message = ""
+
+    def __str__(self) -> str:
+        details = f": {self.error_message}" if self.error_message else ""
+        return f"{self.name}: {self.status}, получено {self.received} за {self.elapsed:.2f} с{details}"
+
+
+class VacancyAggregator:
+    """
+    Поиск вакансий сразу во всех источниках.
+    Источники опрашиваются одновременно в пуле потоков, поэтому общее время поиска определяется
+    самым медленным источником, а не суммой. Источник, не ответивший за свой таймаут, пропускается.
+    Результаты приводятся к формату Vacancy.to_dict() и очищаются от повторов: одинаковых ссылок
+    и почти одинаковых вакансий, опубликованных на разных площадках.
+    У агрегатора есть метод get_vacancies, поэтому его можно передать в IngestWorker вместо одного API.
+    """
+
+    def __init__(
+        self,
+        sources: Optional[Dict[str, APIHandler]] = None,
+        timeout: float = 10.0,
+        timeouts: Optional[Dict[str, float]] = None,
+        threshold: float = 0.8,
+    ) -> None:
+        """
+        :param sources: Источники «имя — обработчик» (по умолчанию все доступные из реестра API_REGISTRY).
+        :param timeout: Таймаут ожидания источника по умолчанию, секунд.
+        :param timeouts: Таймауты отдельных источников, секунд.
+        :param threshold: Порог сходства для почти одинаковых вакансий.
+        """
+        self._sources = sources if sources is not None else create_api_handlers()
+        self._timeout = timeout
+        self._timeouts = timeouts or {}
+        self._threshold = threshold
+        self.last_reports: List[SourceReport] = []
+
+    @property
+    def sources(self) -> List[str]:
+        return list(self._sources)
+
+    def _fetch_all(self, keyword: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Опрашивает все источники одновременно и ждёт каждый не дольше его таймаута."""
+        reports = {name: SourceReport(name) for name in self._sources}
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        if not self._sources:
+            self.last_reports = []
+            return results
+
+        executor = ThreadPoolExecutor(max_workers=len(self._sources), thread_name_prefix="aggregator")
+        started = time.monotonic()
+        futures = {name: executor.submit(api.get_vacancies, keyword) for name, api in self._sources.items()}
+        try:
+            for name, future in futures.items():
+                report = reports[name]
+                deadline = started + self._timeouts.get(name, self._timeout)
+                try:
+                    results[name] = future.result(timeout=max(0.0, deadline - time.monotonic()))
+                    report.received = len(results[name])
+                except FutureTimeoutError:
+                    report.status = SourceReport.TIMEOUT
+                    increment(f"aggregator.{name}.timeouts")
+                except Exception as e:
+                    # Ошибка одного источника не должна лишать пользователя результатов остальных
+                    report.status = SourceReport.FAILED
+                    report.error_message = str(e)
+                report.elapsed = time.monotonic() - started
+        finally:
+            # Зависший запрос не задерживает ответ: поток завершится сам по таймауту HTTP-запроса
+            executor.shutdown(wait=False, cancel_futures=True)
+        self.last_reports = list(reports.values())
+        return results
+
+    def _merge(self, results: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Приводит вакансии к формату Vacancy и убирает повторы между источниками (в порядке источников)."""
+        detector = NearDuplicateDetector(self._threshold)
+        seen_links = set()
+        merged = []
+        for name in self._sources:
+            for item in results.get(name, []):
+                try:
+                    # Дополнительные поля источника (например, 'employer') сохраняются
+                    vacancy = {**item, **Vacancy.from_dict(item).to_dict()}
+                except (KeyError, ValueError):
+                    continue  # Вакансия без названия или с некорректной ссылкой
+                if vacancy["link"] in seen_links:
+                    continue
+                signature, scope = vacancy_signature(vacancy), duplicate_scope(vacancy)
+                if detector.find(signature, scope) is not None:
+                    increment("aggregator.near_duplicates")
+                    continue
+                seen_links.add(vacancy["link"])
+                detector.add(vacancy["link"], signature, scope)
+                vacancy["source"] = name
+                merged.append(vacancy)
+        return merged
+
+    @timed("aggregator.search")
+    def get_vacancies(self, keyword: str) -> List[Dict[str, Any]]:
+        """
+        Ищет вакансии по ключевому слову во всех источниках.
+        Итоги по каждому источнику сохраняются в last_reports.
+        :param keyword: Ключевое слово для поиска вакансий.
+        :return: Список вакансий без повторов, с полем 'source' (имя источника).
+        """
+        return self._merge(self._fetch_all(keyword))
@@ -1,14 +1,47 @@
+import os
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Union, cast
-
-import requests
+from typing import Any, Callable, Dict, List, Optional, Type, Union, cast
 
 from src.helpers import clean_html
+from src.metrics import increment, timed
+
+# Зарегистрированные источники вакансий: имя -> класс обработчика API
+API_REGISTRY: Dict[str, Type["APIHandler"]] = {}
+
+
+def register_api(name: str) -> Callable[[Type["APIHandler"]], Type["APIHandler"]]:
+    """
+    Декоратор, добавляющий класс обработчика API в реестр источников под указанным именем.
+    :param name: Имя источника, например "hh".
+    """
+
+    def decorator(cls: Type["APIHandler"]) -> Type["APIHandler"]:
+        API_REGISTRY[name] = cls
+        return cls
+
+    return decorator
+
+
+def create_api_handlers() -> Dict[str, "APIHandler"]:
+    """
+    Создаёт обработчики всех зарегистрированных источников, которые можно использовать
+    в текущем окружении (например, SuperJob — только при заданном ключе API).
+    :return: Словарь «имя источника — обработчик» в порядке регистрации.
+    """
+    return {name: cls() for name, cls in API_REGISTRY.items() if cls.is_available()}
 
 
 class APIHandler(ABC):
     """Абстрактный класс для работы с API платформ с вакансиями."""
 
+    # Таймаут одного HTTP-запроса к API, секунд
+    timeout: float = 10.0
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """Возвращает True, если источник можно использовать без дополнительной настройки."""
+        return True
+
     @abstractmethod
     def connect(self, url: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -30,6 +63,7 @@ class APIHandler(ABC):
         pass
 
 
+@register_api("hh")
 class HeadHunterAPI(APIHandler):
     """
     Класс для работы с API HeadHunter.
@@ -38,6 +72,11 @@ class HeadHunterAPI(APIHandler):
 
     _BASE_URL = "https://api.hh.ru/vacancies"
 
+    def __init__(self, base_url: Optional[str] = None) -> None:
+        """:param base_url: Адрес API (по умолчанию _BASE_URL; другой адрес удобен для тестового сервера)."""
+        self._base_url = base_url or self._BASE_URL
+
+    @timed("api.connect")
     def connect(self, url: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """
         Подключение к API HeadHunter.
@@ -47,7 +86,10 @@ class HeadHunterAPI(APIHandler):
         :return: Словарь с данными ответа API HeadHunter.
         :raises ConnectionError: Если запрос вернул статус, отличный от 200.
         """
-        response = requests.get(url, params=params)
+        # requests и его зависимости импортируются при первом запросе, а не при запуске программы
+        import requests
+
+        response = requests.get(url, params=params, timeout=self.timeout)
         if response.status_code != 200:
             raise ConnectionError(f"Ошибка подключения к API HeadHunter: {response.status_code} - {response.text}")
 
@@ -65,32 +107,119 @@ class HeadHunterAPI(APIHandler):
 
         return "Зарплата не указана"
 
+    @staticmethod
+    def _get_salary_range(item_salary: Dict[str, Any] | None) -> Dict[str, Any] | None:
+        """
+        Возвращает зарплатную вилку вакансии целиком: границы, валюту и признак зарплаты до вычета налогов.
+        В рубли вилка переводится при сохранении вакансии (src.salary.normalize_salary).
+        """
+        if not item_salary:
+            return None
+        return {key: item_salary.get(key) for key in ("from", "to", "currency", "gross")}
+
     def get_vacancies(self, keyword: str) -> List[Dict[str, Any]]:
         """
         Получение вакансий с hh.ru по ключевому слову.
         :param keyword: Ключевое слово для поиска вакансий.
         :return: Список словарей, где каждый словарь представляет вакансию
-                 с полями 'title', 'link', 'salary', 'description'.
+                 с полями 'title', 'link', 'salary', 'salary_range', 'employer', 'description'.
+        :raises ConnectionError: Если API ответил ошибкой; ошибки сети (таймаут и т. п.) передаются как есть,
+                                 чтобы вызывающий код (VacancyAggregator, IngestWorker) сообщил о них.
         """
         # Получение вакансий только с указанной зарплатой
         params = {"text": keyword, "per_page": 100, "only_with_salary": True}
-        try:
-            data = self.connect(self._BASE_URL, params)
-            vacancies_list = []
-            for item in data.get("items", []):
-                vacancy = {
-                    "title": item.get("name", "Название не указано"),
-                    "link": item.get("alternate_url", "Ссылка не указана"),
-                    "salary": self._get_formatted_salary(item.get("salary")),
-                    "description": clean_html(item.get("snippet", {}).get("requirement", "Описание отсутствует")),
+        data = self.connect(self._base_url, params)
+        vacancies_list = []
+        for item in data.get("items", []):
+            vacancy = {
+                "title": item.get("name", "Название не указано"),
+                "link": item.get("alternate_url", "Ссылка не указана"),
+                "salary": self._get_formatted_salary(item.get("salary")),
+                "salary_range": self._get_salary_range(item.get("salary")),
+                "employer": (item.get("employer") or {}).get("name"),
+                "description": clean_html(item.get("snippet", {}).get("requirement", "Описание отсутствует")),
+            }
+            vacancies_list.append(vacancy)
+        increment("api.vacancies_received", len(vacancies_list))
+        return vacancies_list
+
+
+@register_api("superjob")
+class SuperJobAPI(APIHandler):
+    """
+    Класс для работы с API SuperJob.
+    Для запросов нужен ключ приложения из переменной окружения SUPERJOB_API_KEY.
+    """
+
+    _BASE_URL = "https://api.superjob.ru/2.0/vacancies/"
+    API_KEY_ENV = "SUPERJOB_API_KEY"
+    # Коды валют SuperJob -> коды валют HeadHunter, которые использует src.salary
+    _CURRENCIES = {"rub": "RUR", "usd": "USD", "eur": "EUR", "uah": "UAH", "uzs": "UZS"}
+
+    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None) -> None:
+        """
+        :param api_key: Ключ приложения SuperJob (по умолчанию из SUPERJOB_API_KEY).
+        :param base_url: Адрес API (по умолчанию _BASE_URL).
+        """
+        self._api_key = api_key or os.environ.get(self.API_KEY_ENV, "")
+        self._base_url = base_url or self._BASE_URL
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return bool(os.environ.get(cls.API_KEY_ENV))
+
+    @timed("api.connect")
+    def connect(self, url: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Подключение к API SuperJob.
+        :param url: URL-адрес для подключения.
+        :param params: Параметры запроса, например, 'keyword'.
+        :return: Словарь с данными ответа API SuperJob.
+        :raises ConnectionError: Если запрос вернул статус, отличный от 200.
+        """
+        import requests
+
+        response = requests.get(url, params=params, headers={"X-Api-App-Id": self._api_key}, timeout=self.timeout)
+        if response.status_code != 200:
+            raise ConnectionError(f"Ошибка подключения к API SuperJob: {response.status_code} - {response.text}")
+        return cast(Dict[str, Any], response.json())
+
+    def _get_salary_range(self, item: Dict[str, Any]) -> Dict[str, Any] | None:
+        """Возвращает зарплатную вилку в формате HeadHunter; 0 в SuperJob означает, что граница не указана."""
+        salary_from = item.get("payment_from") or None
+        salary_to = item.get("payment_to") or None
+        if salary_from is None and salary_to is None:
+            return None
+        currency = str(item.get("currency") or "rub").lower()
+        return {
+            "from": salary_from,
+            "to": salary_to,
+            "currency": self._CURRENCIES.get(currency, currency.upper()),
+            "gross": None,
+        }
+
+    def get_vacancies(self, keyword: str) -> List[Dict[str, Any]]:
+        """
+        Получение вакансий с superjob.ru по ключевому слову.
+        :param keyword: Ключевое слово для поиска вакансий.
+        :return: Список словарей в том же формате, что у HeadHunterAPI.
+        :raises ConnectionError: Если API ответил ошибкой (например, 403 при неверном ключе).
+        """
+        params = {"keyword": keyword, "count": 100, "no_agreement": 1}
+        data = self.connect(self._base_url, params)
+        vacancies_list = []
+        for item in data.get("objects", []):
+            salary_range = self._get_salary_range(item)
+            salary = salary_range["from"] or salary_range["to"] if salary_range else "Зарплата не указана"
+            vacancies_list.append(
+                {
+                    "title": item.get("profession", "Название не указано"),
+                    "link": item.get("link", "Ссылка не указана"),
+                    "salary": salary,
+                    "salary_range": salary_range,
+                    "employer": item.get("firm_name"),
+                    "description": clean_html(item.get("candidat") or "Описание отсутствует"),
                 }
-                vacancies_list.append(vacancy)
-            return vacancies_list
-
-        except ConnectionError as e:
-            print(f"Произошла ошибка при получении вакансий HeadHunter: {e}")
-            return []
-        except Exception as e:
-            # Общий перехват исключений для обработки непредвиденных ошибок при обработке данных
-            print(f"Произошла непредвиденная ошибка при обработке вакансий HeadHunter: {e}")
-            return []
+            )
+        increment("api.vacancies_received", len(vacancies_list))
+        return vacancies_list
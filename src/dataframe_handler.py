@@ -0,0 +1,250 @@
+import math
+import os
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.dedup import NearDuplicateDetector
+from src.file_handler import FileHandler, JSONFileHandler, file_version, select_new_vacancies, write_temp_bytes
+from src.helpers import clean_html
+from src.metrics import increment, timed
+from src.salary import NOT_SPECIFIED, apply_salary_fields
+from src.tokenizer import query_patterns, token_string
+
+if TYPE_CHECKING:
+    import pandas as pd  # type: ignore[import-untyped]
+
+# Поля вакансии, которые хранятся отдельными типизированными столбцами; остальные поля
+# (salary_range, employer, duplicate_of, id и т. п.) хранятся словарём в столбце "extra".
+SALARY_COLUMNS = ("salary_from", "salary_to", "salary_rub")
+TYPED_COLUMNS = ("title", "link") + SALARY_COLUMNS + ("description", "tokens")
+COLUMNS = TYPED_COLUMNS + ("extra",)
+# Поле salary не хранится: оно восстанавливается из salary_rub
+DERIVED_FIELDS = ("salary",)
+# Сколько строк DataFrame превращается в словари за один шаг в iter_vacancies
+ITER_CHUNK_SIZE = 10_000
+
+
+def _optional_float(value: Any) -> Optional[float]:
+    """Превращает NaN из столбца зарплаты обратно в None."""
+    return None if value is None or math.isnan(value) else value
+
+
+class DataFrameFileHandler(FileHandler):
+    """
+    Хранилище вакансий в виде DataFrame pandas для массовой обработки.
+    Названия хранятся категориальным столбцом, зарплаты — столбцами float64 (NaN — не указана),
+    основы слов описания — строкой " основа1 основа2 ", поэтому фильтры выполняются векторными
+    операциями над столбцами, а не циклом по словарям.
+    DataFrame держится в памяти и сохраняется в бинарный файл pickle после каждого изменения.
+    Файл pickle при чтении может выполнить произвольный код: открывайте только свои файлы.
+    """
+
+    def __init__(self, filename: str = "data/vacancies.pkl") -> None:
+        super().__init__()
+        self._filename = filename
+        self._lock = threading.RLock()
+        self._frame: Optional["pd.DataFrame"] = None  # Загружается при первом обращении
+
+    @staticmethod
+    def records_to_frame(records: Iterable[Dict[str, Any]]) -> "pd.DataFrame":
+        """
+        Строит DataFrame хранилища из словарей вакансий.
+        Поля, которые JSONFileHandler вычисляет при добавлении (зарплата в рублях, основы слов),
+        дополняются, если их нет, поэтому подходят и вакансии из старых JSON-файлов.
+        :param records: Словари вакансий.
+        :return: DataFrame со столбцами COLUMNS.
+        """
+        import pandas as pd
+
+        columns: Dict[str, List[Any]] = {name: [] for name in COLUMNS}
+        for record in records:
+            if "salary_rub" not in record:
+                record = apply_salary_fields(dict(record))
+            tokens = record.get("tokens")
+            if isinstance(tokens, list):
+                tokens = f" {' '.join(tokens)} "
+            elif not isinstance(tokens, str):
+                tokens = token_string(clean_html(record.get("description") or "Описание отсутствует"))
+            for name in ("title", "link", "description") + SALARY_COLUMNS:
+                columns[name].append(record.get(name))
+            columns["tokens"].append(tokens)
+            columns["extra"].append(
+                {key: value for key, value in record.items() if key not in TYPED_COLUMNS + DERIVED_FIELDS}
+            )
+
+        frame = pd.DataFrame(columns, columns=list(COLUMNS))
+        frame["title"] = frame["title"].astype("category")
+        for name in SALARY_COLUMNS:
+            frame[name] = frame[name].astype("float64")
+        return frame
+
+    @staticmethod
+    def frame_to_records(frame: "pd.DataFrame") -> List[Dict[str, Any]]:
+        """
+        Превращает строки DataFrame в словари вакансий в том же виде, что возвращает JSONFileHandler.
+        :param frame: DataFrame со столбцами COLUMNS.
+        :return: Список словарей.
+        """
+        records = []
+        for title, link, salary_from, salary_to, salary_rub, description, tokens, extra in zip(
+            *(frame[name].tolist() for name in COLUMNS)
+        ):
+            salary_rub = _optional_float(salary_rub)
+            record = {
+                "title": title,
+                "link": link,
+                "salary": salary_rub if salary_rub is not None else NOT_SPECIFIED,
+                "salary_from": _optional_float(salary_from),
+                "salary_to": _optional_float(salary_to),
+                "salary_rub": salary_rub,
+                "description": description,
+                "tokens": tokens,
+            }
+            record.update(extra)
+            records.append(record)
+        return records
+
+    def version(self) -> Optional[Tuple[int, int, int]]:
+        """Метка файла хранилища: номер inode, время изменения и размер (file_version)."""
+        return file_version(self._filename)
+
+    @timed("dataframe.load")
+    def _load_frame(self) -> "pd.DataFrame":
+        """Возвращает DataFrame хранилища, при первом обращении читая его из файла."""
+        if self._frame is None:
+            import pandas as pd
+
+            try:
+                self._frame = pd.read_pickle(self._filename)
+            except FileNotFoundError:
+                self._frame = self.records_to_frame([])
+            increment("storage.records_loaded", len(self._frame))
+        return self._frame
+
+    @timed("dataframe.save")
+    def _save_frame(self, frame: "pd.DataFrame") -> None:
+        """Сохраняет DataFrame во временный файл и атомарно заменяет им файл хранилища."""
+        directory = os.path.dirname(os.path.abspath(self._filename))
+        os.makedirs(directory, exist_ok=True)
+        os.replace(write_temp_bytes(directory, frame.to_pickle), self._filename)
+        self._frame = frame
+        increment("storage.records_saved", len(frame))
+
+    def _append(self, records: List[Dict[str, Any]]) -> None:
+        import pandas as pd
+
+        frame = pd.concat([self._load_frame(), self.records_to_frame(records)], ignore_index=True)
+        # При объединении категориальных столбцов с разными категориями pandas возвращает object
+        frame["title"] = frame["title"].astype("category")
+        self._save_frame(frame)
+
+    def count(self) -> int:
+        """Возвращает количество вакансий в хранилище."""
+        return len(self._load_frame())
+
+    def add_vacancy(self, vacancy_data: Dict[str, Any]) -> None:
+        """Добавляет вакансию в хранилище."""
+        JSONFileHandler._prepare_vacancy(vacancy_data)
+
+        with self._lock:
+            frame = self._load_frame()
+            if vacancy_data in self.frame_to_records(frame[frame["link"] == vacancy_data["link"]]):
+                return  # Проверка на дубликаты
+            self._append([vacancy_data])
+            print(f"Вакансия '{vacancy_data['title']}' успешно добавлена.")
+            self._notify(self.ADDED, [vacancy_data])
+
+    def add_vacancies(
+        self, vacancies: List[Dict[str, Any]], near_duplicates: str = "group", threshold: float = 0.8
+    ) -> int:
+        """
+        Добавляет несколько вакансий одним объединением DataFrame и одной записью файла.
+        :param vacancies: Список словарей с данными о вакансиях.
+        :param near_duplicates: Что делать с почти одинаковыми вакансиями: "group", "skip" или "keep".
+        :param threshold: Порог сходства, начиная с которого вакансии считаются почти одинаковыми.
+        :return: Количество добавленных вакансий.
+        """
+        for vacancy_data in vacancies:
+            JSONFileHandler._prepare_vacancy(vacancy_data)
+
+        with self._lock:
+            frame = self._load_frame()
+            # Для проверки точных дубликатов в словари превращаются только строки с теми же ссылками,
+            # а все вакансии читаются, только если индекс сигнатур нужно построить заново
+            links = {vacancy_data["link"] for vacancy_data in vacancies}
+            existing = self.frame_to_records(frame[frame["link"].isin(links)])
+            detector = self._near_duplicate_detector(self.iter_vacancies(), near_duplicates, threshold)
+            if detector is None and near_duplicates != "keep":
+                detector = NearDuplicateDetector.from_vacancies(self.iter_vacancies(), threshold)
+            selected = select_new_vacancies(existing, vacancies, near_duplicates, threshold, detector)
+            if selected:
+                self._append(selected)
+            self._remember_detector_version()
+            self._notify(self.ADDED, selected)
+            return len(selected)
+
+    def delete_vacancy(self, vacancy_id: int) -> None:
+        """Удаляет вакансию по ID."""
+        with self._lock:
+            frame = self._load_frame()
+            mask = frame["extra"].map(lambda extra: extra.get("id") == vacancy_id).astype(bool)
+            if mask.any():
+                removed = self.frame_to_records(frame[mask])
+                self._save_frame(frame[~mask].reset_index(drop=True))
+                self._notify(self.DELETED, removed)
+        print(f"Вакансия с ID {vacancy_id} удалена.")
+
+    def keywords_mask(self, filter_words: List[str]) -> "pd.Series":
+        """
+        Возвращает булеву маску вакансий, в описании которых есть хотя бы одно из ключевых слов.
+        Условие то же, что в matches_keywords: все основы слова из запроса есть среди основ описания.
+        """
+        import pandas as pd
+
+        frame = self._load_frame()
+        tokens = frame["tokens"]
+        mask = pd.Series(False, index=frame.index)
+        for term in query_patterns(tuple(filter_words)):
+            term_mask = pd.Series(True, index=frame.index)
+            for pattern in term:
+                term_mask &= tokens.str.contains(pattern, regex=False)
+            mask |= term_mask
+        return mask
+
+    def salary_mask(self, salary_range: Tuple[float, float]) -> "pd.Series":
+        """
+        Возвращает булеву маску вакансий, чья зарплатная вилка пересекается с диапазоном (как matches_salary).
+        """
+        frame = self._load_frame()
+        min_salary, max_salary = salary_range
+        low = frame["salary_from"].fillna(frame["salary_to"])
+        high = frame["salary_to"].fillna(frame["salary_from"])
+        return (low <= max_salary) & (high >= min_salary)
+
+    @timed("filter.keywords")
+    def filter_vacancies(self, filter_words: List[str]) -> List[Dict[str, Any]]:
+        """
+        Фильтрует вакансии по ключевым словам в описании.
+        :param filter_words: Список ключевых слов (пустой список — все вакансии).
+        :return: Список словарей с отфильтрованными вакансиями.
+        """
+        frame = self._load_frame()
+        if not filter_words:
+            return self.frame_to_records(frame)
+        return self.frame_to_records(frame[self.keywords_mask(filter_words)])
+
+    @timed("filter.salary")
+    def filter_vacancies_by_salary(self, salary_range: Tuple[float, float]) -> List[Dict[str, Any]]:
+        """
+        Фильтрует вакансии по диапазону зарплат.
+        :param salary_range: Кортеж (min_salary, max_salary).
+        :return: Список отфильтрованных вакансий.
+        """
+        frame = self._load_frame()
+        return self.frame_to_records(frame[self.salary_mask(salary_range)])
+
+    def iter_vacancies(self) -> Iterator[Dict[str, Any]]:
+        """Последовательно возвращает вакансии, превращая строки в словари блоками по ITER_CHUNK_SIZE."""
+        frame = self._load_frame()
+        for start in range(0, len(frame), ITER_CHUNK_SIZE):
+            yield from self.frame_to_records(frame.iloc[start: start + ITER_CHUNK_SIZE])
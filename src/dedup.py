@@ -0,0 +1,144 @@
+import random
+import zlib
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from src.helpers import salary_bounds
+from src.tokenizer import normalize, tokenize
+
+# Число хеш-функций MinHash и разбиение сигнатуры на полосы для LSH.
+# 8 полос по 4 значения: пары со сходством 0.8 становятся кандидатами с вероятностью ~98%,
+# а пары со сходством 0.3 — лишь с вероятностью ~6%.
+NUM_PERM = 32
+NUM_BANDS = 8
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_rng = random.Random(20240216)  # Фиксированное зерно: сигнатуры должны совпадать между запусками
+_PERMUTATIONS = [(_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME)) for _ in range(NUM_PERM)]
+
+
+def shingles(text: str) -> Set[str]:
+    """
+    Разбивает текст на шинглы — пары соседних основ слов.
+    Для текста из одного слова шинглом считается само слово.
+    :param text: Исходный текст.
+    :return: Множество шинглов.
+    """
+    tokens = tokenize(text)
+    if len(tokens) < 2:
+        return set(tokens)
+    return {f"{first} {second}" for first, second in zip(tokens, tokens[1:])}
+
+
+def minhash_signature(text: str) -> List[int]:
+    """
+    Вычисляет MinHash-сигнатуру текста из NUM_PERM 32-битных чисел.
+    Доля совпадающих позиций двух сигнатур оценивает сходство Жаккара их множеств шинглов.
+    :param text: Исходный текст.
+    :return: Список из NUM_PERM чисел.
+    """
+    hashes = [zlib.crc32(shingle.encode("utf-8")) for shingle in shingles(text)]
+    if not hashes:
+        return [_MAX_HASH] * NUM_PERM
+    return [min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes) for a, b in _PERMUTATIONS]
+
+
+def vacancy_signature(vacancy: Dict[str, Any]) -> List[int]:
+    """Вычисляет сигнатуру вакансии по названию и описанию."""
+    return minhash_signature(f"{vacancy.get('title') or ''} {vacancy.get('description') or ''}")
+
+
+def duplicate_scope(vacancy: Dict[str, Any]) -> str:
+    """
+    Возвращает часть ключа сходства, которая должна совпасть точно: работодателя и зарплатную вилку в рублях.
+    Вакансии с одинаковым текстом, но от разных работодателей или с разной зарплатой — разные вакансии.
+    :param vacancy: Словарь с данными о вакансии.
+    :return: Строка «работодатель|от-до».
+    """
+    bounds = salary_bounds(vacancy)
+    salary = f"{bounds[0]:.0f}-{bounds[1]:.0f}" if bounds is not None else "-"
+    return f"{normalize(str(vacancy.get('employer') or ''))}|{salary}"
+
+
+def signature_similarity(first: List[int], second: List[int]) -> float:
+    """Оценивает сходство двух сигнатур как долю совпадающих позиций."""
+    if not first or len(first) != len(second):
+        return 0.0
+    return sum(a == b for a, b in zip(first, second)) / len(first)
+
+
+class NearDuplicateDetector:
+    """
+    Поиск почти одинаковых вакансий с помощью MinHash и LSH.
+    Сигнатура делится на полосы; вакансии с одинаковой областью (duplicate_scope), совпавшие хотя бы
+    в одной полосе, считаются кандидатами, и только для них вычисляется сходство.
+    Поиск не требует перебора всех ранее добавленных вакансий.
+    """
+
+    def __init__(self, threshold: float = 0.8) -> None:
+        if not 0 < threshold <= 1:
+            raise ValueError("Порог сходства должен быть в диапазоне (0; 1].")
+        self._threshold = threshold
+        self._rows = NUM_PERM // NUM_BANDS
+        self._buckets: List[Dict[Tuple[Any, ...], List[str]]] = [{} for _ in range(NUM_BANDS)]
+        self._signatures: Dict[str, List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    @property
+    def threshold(self) -> float:
+        return self._threshold
+
+    @classmethod
+    def from_vacancies(cls, vacancies: Iterable[Dict[str, Any]], threshold: float = 0.8) -> "NearDuplicateDetector":
+        """
+        Строит индекс по сохранённым вакансиям; вакансии с полем 'duplicate_of' пропускаются,
+        чтобы группа повторов всегда указывала на исходную вакансию.
+        :param vacancies: Вакансии хранилища.
+        :param threshold: Порог сходства.
+        :return: Заполненный индекс.
+        """
+        detector = cls(threshold)
+        for vacancy in vacancies:
+            if vacancy.get("duplicate_of"):
+                continue
+            # Сигнатура могла быть сохранена в записи более ранней версией программы
+            signature = vacancy.get("signature")
+            if not isinstance(signature, list) or len(signature) != NUM_PERM:
+                signature = vacancy_signature(vacancy)
+            detector.add(vacancy.get("link", ""), signature, duplicate_scope(vacancy))
+        return detector
+
+    def _bands(self, signature: List[int], scope: str) -> List[Tuple[Any, ...]]:
+        return [(scope,) + tuple(signature[i * self._rows: (i + 1) * self._rows]) for i in range(NUM_BANDS)]
+
+    def add(self, key: str, signature: List[int], scope: str = "") -> None:
+        """
+        Добавляет сигнатуру в индекс.
+        :param key: Идентификатор вакансии (например, ссылка).
+        :param signature: MinHash-сигнатура вакансии.
+        :param scope: Область сравнения (duplicate_scope): похожими считаются только вакансии с той же областью.
+        """
+        self._signatures[key] = signature
+        for buckets, band in zip(self._buckets, self._bands(signature, scope)):
+            buckets.setdefault(band, []).append(key)
+
+    def find(self, signature: List[int], scope: str = "") -> Optional[Tuple[str, float]]:
+        """
+        Ищет наиболее похожую вакансию со сходством не ниже порога.
+        :param signature: MinHash-сигнатура проверяемой вакансии.
+        :param scope: Область сравнения (duplicate_scope).
+        :return: Кортеж (ключ, сходство) или None, если похожих вакансий нет.
+        """
+        candidates = {
+            key
+            for buckets, band in zip(self._buckets, self._bands(signature, scope))
+            for key in buckets.get(band, [])
+        }
+        best: Optional[Tuple[str, float]] = None
+        for key in sorted(candidates):
+            similarity = signature_similarity(signature, self._signatures[key])
+            if similarity >= self._threshold and (best is None or similarity > best[1]):
+                best = (key, similarity)
+        return best
@@ -0,0 +1,140 @@
+import argparse
+import csv
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.file_handler import FileHandler, JSONFileHandler
+from src.helpers import matches_keywords, matches_salary, parse_salary_range
+from src.metrics import increment, timed
+from src.salary import normalize_salary
+
+EXPORT_FIELDS = ("title", "link", "salary_from", "salary_to", "salary_rub", "description")
+FORMATS = ("csv", "xlsx")
+# Максимум строк данных на листе Excel (1 048 576 минус строка заголовка)
+XLSX_MAX_ROWS = 1_048_575
+
+
+def iter_filtered(
+    file_handler: FileHandler,
+    keywords: Optional[List[str]] = None,
+    salary_range: Optional[Tuple[float, float]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Потоково отбирает вакансии хранилища по тем же условиям, что и filter_vacancies/filter_vacancies_by_salary.
+    :param file_handler: Хранилище вакансий.
+    :param keywords: Ключевые слова (None или пустой список — любые).
+    :param salary_range: Диапазон зарплат (None — любой, в том числе без зарплаты).
+    :return: Итератор подходящих вакансий.
+    """
+    for vacancy in file_handler.iter_vacancies():
+        if salary_range is not None and not matches_salary(vacancy, salary_range):
+            continue
+        if matches_keywords(vacancy, keywords or []):
+            yield vacancy
+
+
+def vacancy_row(vacancy: Dict[str, Any]) -> List[Any]:
+    """Возвращает строку выгрузки в порядке EXPORT_FIELDS; зарплата вакансий старого формата нормализуется."""
+    salary = vacancy
+    if "salary_rub" not in vacancy:
+        salary = normalize_salary(vacancy.get("salary"), vacancy.get("salary_range"))
+    return [
+        vacancy.get("title"),
+        vacancy.get("link"),
+        salary.get("salary_from"),
+        salary.get("salary_to"),
+        salary.get("salary_rub"),
+        vacancy.get("description"),
+    ]
+
+
+@timed("export.csv")
+def export_csv(vacancies: Iterable[Dict[str, Any]], path: str) -> int:
+    """
+    Записывает вакансии в CSV построчно.
+    :param vacancies: Итерируемый набор вакансий.
+    :param path: Путь к файлу.
+    :return: Количество записанных вакансий.
+    """
+    count = 0
+    # utf-8-sig — чтобы Excel правильно открывал кириллицу
+    with open(path, "w", encoding="utf-8-sig", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(EXPORT_FIELDS)
+        for vacancy in vacancies:
+            writer.writerow(vacancy_row(vacancy))
+            count += 1
+    return count
+
+
+@timed("export.xlsx")
+def export_xlsx(vacancies: Iterable[Dict[str, Any]], path: str) -> int:
+    """
+    Записывает вакансии в XLSX в режиме write-only: строки сразу уходят во временный файл,
+    поэтому память не растёт с числом вакансий. Если строк больше, чем помещается на лист, создаётся следующий.
+    :param vacancies: Итерируемый набор вакансий.
+    :param path: Путь к файлу.
+    :return: Количество записанных вакансий.
+    """
+    from openpyxl import Workbook  # type: ignore[import-untyped]
+
+    workbook = Workbook(write_only=True)
+    sheet = None
+    count = 0
+    for vacancy in vacancies:
+        if count % XLSX_MAX_ROWS == 0:
+            sheet = workbook.create_sheet(f"Вакансии {count // XLSX_MAX_ROWS + 1}")
+            sheet.append(EXPORT_FIELDS)
+        sheet.append(vacancy_row(vacancy))  # type: ignore[union-attr]
+        count += 1
+    if sheet is None:
+        workbook.create_sheet("Вакансии 1").append(EXPORT_FIELDS)
+    workbook.save(path)
+    return count
+
+
+EXPORTERS = {"csv": export_csv, "xlsx": export_xlsx}
+
+
+def export_vacancies(
+    file_handler: FileHandler,
+    path: str,
+    export_format: Optional[str] = None,
+    keywords: Optional[List[str]] = None,
+    salary_range: Optional[Tuple[float, float]] = None,
+) -> int:
+    """
+    Выгружает вакансии хранилища в файл, не загружая их все в память.
+    :param file_handler: Хранилище вакансий.
+    :param path: Путь к файлу.
+    :param export_format: "csv" или "xlsx"; по умолчанию определяется по расширению файла.
+    :param keywords: Ключевые слова для отбора.
+    :param salary_range: Диапазон зарплат для отбора.
+    :return: Количество выгруженных вакансий.
+    :raises ValueError: Если формат не поддерживается.
+    """
+    export_format = (export_format or Path(path).suffix.lstrip(".")).lower()
+    if export_format not in EXPORTERS:
+        raise ValueError(f"Формат выгрузки '{export_format}' не поддерживается. Доступны: {', '.join(FORMATS)}.")
+    count = EXPORTERS[export_format](iter_filtered(file_handler, keywords, salary_range), path)
+    increment("export.records", count)
+    return count
+
+
+def main() -> None:
+    """Командная строка: python -m src.export vacancies.csv --keywords python --salary 100000-200000"""
+    parser = argparse.ArgumentParser(description="Выгрузка вакансий в CSV или XLSX.")
+    parser.add_argument("output", help="Файл для выгрузки (формат по расширению: .csv, .xlsx)")
+    parser.add_argument("--format", choices=FORMATS, default=None, help="Формат, если расширение другое")
+    parser.add_argument("--file", default="data/vacancies.json", help="JSON-файл с вакансиями")
+    parser.add_argument("--keywords", nargs="*", default=[], help="Ключевые слова")
+    parser.add_argument("--salary", default=None, help="Диапазон зарплат: минимум-максимум")
+    args = parser.parse_args()
+
+    salary_range = parse_salary_range(args.salary) if args.salary else None
+    count = export_vacancies(JSONFileHandler(args.file), args.output, args.format, args.keywords, salary_range)
+    print(f"Выгружено вакансий: {count} в {args.output}")
+
+
+if __name__ == "__main__":
+    main()
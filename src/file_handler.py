@@ -1,14 +1,68 @@
 import json
+import os
+import re
+import tempfile
+import threading
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import IO, Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
 
-from src.helpers import clean_html
+from src.dedup import NearDuplicateDetector, duplicate_scope, vacancy_signature
+from src.helpers import clean_html, matches_keywords, matches_salary
+from src.metrics import increment, timed
+from src.salary import apply_salary_fields
+from src.tokenizer import token_string
+
+# Пробелы и запятые между элементами JSON-массива
+_SEPARATORS = re.compile(r"[\s,]*")
+
+
+# Служебные поля, которые вычисляются при добавлении и не нужны при выводе вакансий
+# (signature хранили в записях ранние версии программы)
+INTERNAL_FIELDS = ("tokens", "signature")
+
+# Подписчик на изменения хранилища: получает событие ("added" или "deleted") и изменённые вакансии
+ChangeListener = Callable[[str, List[Dict[str, Any]]], None]
 
 
 class FileHandler(ABC):
     """Абстрактный класс для работы с файлами."""
 
+    ADDED = "added"
+    DELETED = "deleted"
+
+    def __init__(self) -> None:
+        self._listeners: List[ChangeListener] = []
+        # Индекс сигнатур для поиска почти одинаковых вакансий и версия хранилища, которой он соответствует
+        self._detector: Optional[NearDuplicateDetector] = None
+        self._detector_version: Optional[Hashable] = None
+
+    def version(self) -> Optional[Hashable]:
+        """
+        Возвращает метку состояния хранилища, которая меняется при каждой записи, в том числе другим процессом.
+        :return: Метка или None, если хранилище не умеет её вычислять.
+        """
+        return None
+
+    def subscribe(self, listener: ChangeListener) -> None:
+        """
+        Подписывает функцию на изменения хранилища.
+        Функция вызывается после каждого добавления или удаления только с изменёнными вакансиями.
+        :param listener: Функция (событие, список вакансий).
+        """
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener: ChangeListener) -> None:
+        """Отписывает функцию от изменений хранилища."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _notify(self, event: str, vacancies: List[Dict[str, Any]]) -> None:
+        """Сообщает подписчикам об изменении, если что-то действительно изменилось."""
+        if vacancies:
+            for listener in list(self._listeners):
+                listener(event, vacancies)
+
     @abstractmethod
     def add_vacancy(self, vacancy_data: Dict[str, Any]) -> None:
         """Добавляет вакансию в файл."""
@@ -29,14 +83,158 @@ class FileHandler(ABC):
         """Фильтрует вакансии по диапазону зарплат."""
         pass
 
+    def _near_duplicate_detector(
+        self, existing: Iterable[Dict[str, Any]], near_duplicates: str, threshold: float
+    ) -> Optional[NearDuplicateDetector]:
+        """
+        Возвращает индекс сигнатур хранилища для select_new_vacancies.
+        Индекс строится по хранилищу один раз и дальше только дополняется добавленными вакансиями; заново
+        он строится, если хранилище изменилось в обход add_vacancies (version() не совпадает с версией
+        после последней записи). После успешной записи нужно вызвать _remember_detector_version().
+        :param existing: Вакансии хранилища (читаются, только если индекс нужно построить заново).
+        :param near_duplicates: Режим обработки почти одинаковых вакансий; для "keep" индекс не нужен.
+        :param threshold: Порог сходства.
+        :return: Индекс или None.
+        """
+        version = self.version()
+        if near_duplicates == "keep" or version is None:
+            self._detector = None
+            return None
+        if self._detector is None or self._detector_version != version or self._detector.threshold != threshold:
+            self._detector = NearDuplicateDetector.from_vacancies(existing, threshold)
+        # Пока запись не завершена, индекс может содержать вакансии, которых нет в хранилище
+        self._detector_version = None
+        return self._detector
+
+    def _remember_detector_version(self) -> None:
+        """Отмечает, что индекс сигнатур соответствует текущему состоянию хранилища."""
+        if self._detector is not None:
+            self._detector_version = self.version()
+
+    def add_vacancies(
+        self, vacancies: List[Dict[str, Any]], near_duplicates: str = "group", threshold: float = 0.8
+    ) -> int:
+        """
+        Добавляет несколько вакансий.
+        Базовая реализация добавляет вакансии по одной и не ищет почти одинаковые вакансии.
+        :param vacancies: Список словарей с данными о вакансиях.
+        :param near_duplicates: Что делать с почти одинаковыми вакансиями: "group", "skip" или "keep".
+        :param threshold: Порог сходства, начиная с которого вакансии считаются почти одинаковыми.
+        :return: Количество обработанных вакансий.
+        """
+        for vacancy_data in vacancies:
+            self.add_vacancy(vacancy_data)
+        return len(vacancies)
+
+    def iter_vacancies(self) -> Iterator[Dict[str, Any]]:
+        """Последовательно возвращает все вакансии хранилища."""
+        yield from self.filter_vacancies([])
+
+
+def select_new_vacancies(
+    existing: List[Dict[str, Any]],
+    vacancies: List[Dict[str, Any]],
+    near_duplicates: str = "group",
+    threshold: float = 0.8,
+    detector: Optional[NearDuplicateDetector] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Отбирает из новых вакансий те, которые нужно добавить в хранилище.
+    Точные дубликаты пропускаются всегда. Почти одинаковые вакансии (повторные публикации с другой ссылкой
+    и мелкими правками текста, но от того же работодателя и с той же зарплатой) находятся через MinHash/LSH.
+    :param existing: Вакансии хранилища, среди которых ищутся точные дубликаты (достаточно вакансий
+                     с теми же ссылками, если передан detector).
+    :param vacancies: Новые вакансии, подготовленные JSONFileHandler._prepare_vacancy.
+    :param near_duplicates: "group" — добавить с полем 'duplicate_of' (ссылка на исходную вакансию),
+                            "skip" — не добавлять почти одинаковые вакансии,
+                            "keep" — добавлять без проверки.
+    :param threshold: Порог сходства, начиная с которого вакансии считаются почти одинаковыми.
+    :param detector: Индекс сигнатур хранилища; дополняется добавленными вакансиями.
+                     Если не передан, строится по existing.
+    :return: Список вакансий для добавления.
+    """
+    if near_duplicates not in ("skip", "group", "keep"):
+        raise ValueError(f"Неизвестный режим обработки дубликатов: '{near_duplicates}'.")
+    if near_duplicates != "keep" and detector is None:
+        detector = NearDuplicateDetector.from_vacancies(existing, threshold)
+
+    records_by_link: Dict[str, List[Dict[str, Any]]] = {}
+    for vacancy in existing:
+        records_by_link.setdefault(vacancy.get("link", ""), []).append(vacancy)
+
+    selected = []
+    for vacancy_data in vacancies:
+        same_link = records_by_link.setdefault(vacancy_data["link"], [])
+        if vacancy_data in same_link:  # Проверка на точные дубликаты
+            continue
+
+        if near_duplicates != "keep" and detector is not None:
+            signature, scope = vacancy_signature(vacancy_data), duplicate_scope(vacancy_data)
+            match = detector.find(signature, scope)
+            if match is not None and near_duplicates == "skip":
+                continue
+            if match is not None:
+                vacancy_data["duplicate_of"] = match[0]
+            else:
+                detector.add(vacancy_data["link"], signature, scope)
+
+        selected.append(vacancy_data)
+        same_link.append(vacancy_data)
+    return selected
+
+
+def write_temp_json(directory: str, data: Any) -> str:
+    """
+    Записывает данные во временный JSON-файл в каталоге (в формате файла хранилища).
+    Временный файл затем атомарно переносится на место файла хранилища через os.replace.
+    :param directory: Каталог хранилища; временный файл должен быть на том же диске, что и файл хранилища.
+    :param data: Данные, например список вакансий.
+    :return: Имя временного файла.
+    """
+    with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=directory, suffix=".tmp", delete=False) as file:
+        json.dump(data, file, ensure_ascii=False, indent=4)
+    return file.name
+
+
+def write_temp_bytes(directory: str, write: Callable[[IO[bytes]], Any]) -> str:
+    """
+    Двоичный вариант write_temp_json: временный файл заполняет функция write (например, DataFrame.to_pickle).
+    :param directory: Каталог хранилища.
+    :param write: Функция, которая записывает данные в открытый двоичный файл.
+    :return: Имя временного файла.
+    """
+    with tempfile.NamedTemporaryFile(dir=directory, suffix=".tmp", delete=False) as file:
+        write(file)
+    return file.name
+
+
+def file_version(filename: str) -> Optional[Tuple[int, int, int]]:
+    """
+    Метка файла хранилища для FileHandler.version(): номер inode, время изменения и размер.
+    Файл при каждой записи заменяется новым через os.replace, поэтому метка меняется при любой записи.
+    :param filename: Путь к файлу.
+    :return: Метка или None, если файла нет.
+    """
+    try:
+        stat = os.stat(filename)
+    except FileNotFoundError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
 
 class JSONFileHandler(FileHandler):
     """Класс для работы с JSON-файлами."""
 
+    # Размер блока при потоковом чтении файла в iter_vacancies, символов
+    _read_chunk_size = 1 << 16
+
     #def __init__(self, filename: str = "data/test_vacancies.json") -> None:
     # Строка для тестирования. Заполняет файл test_vacancies.json
     def __init__(self, filename: str = "data/vacancies.json") -> None:
+        super().__init__()
         self._filename = filename
+        # Блокировка защищает цикл «прочитать-изменить-записать» при добавлении из фонового потока
+        self._lock = threading.RLock()
         self._ensure_file_exists()
 
     def _ensure_file_exists(self) -> None:
@@ -46,6 +244,11 @@ class JSONFileHandler(FileHandler):
             with open(self._filename, "w", encoding="utf-8") as file:
                 json.dump([], file)
 
+    def version(self) -> Optional[Tuple[int, int, int]]:
+        """Метка файла: номер inode, время изменения и размер (file_version)."""
+        return file_version(self._filename)
+
+    @timed("storage.load")
     def _load_data(self) -> List[Dict[str, Any]]:
         """Загружает данные из JSON-файла."""
         try:
@@ -53,19 +256,60 @@ class JSONFileHandler(FileHandler):
                 data = json.load(file)
                 # Убедимся, что данные - это список словарей
                 if isinstance(data, list) and all(isinstance(item, dict) for item in data):
+                    increment("storage.records_loaded", len(data))
                     return data
                 else:
                     return []  # Возвращаем пустой список, если данные некорректны
         except (FileNotFoundError, json.JSONDecodeError):
             return []
 
+    def iter_vacancies(self) -> Iterator[Dict[str, Any]]:
+        """
+        Читает вакансии из файла по одной, не загружая весь список в память.
+        Файл читается блоками, а каждый элемент массива разбирается отдельно через JSONDecoder.raw_decode.
+        Если файл содержит не список (например, сырой ответ API), вакансий нет, как и в _load_data.
+        """
+        decoder = json.JSONDecoder()
+        try:
+            file = open(self._filename, "r", encoding="utf-8")
+        except FileNotFoundError:
+            return
+        with file:
+            buffer = file.read(self._read_chunk_size).lstrip()
+            if not buffer.startswith("["):
+                return
+            position = 1
+            while True:
+                position = _SEPARATORS.match(buffer, position).end()  # type: ignore[union-attr]
+                if buffer.startswith("]", position):
+                    return
+                try:
+                    item, position = decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    # Элемент не поместился в буфер целиком — дочитываем следующий блок
+                    chunk = file.read(self._read_chunk_size)
+                    if not chunk:
+                        return
+                    buffer = buffer[position:] + chunk
+                    position = 0
+                    continue
+                if isinstance(item, dict):
+                    yield item
+
+    @timed("storage.save")
     def _save_data(self, data: List[Dict[str, Any]]) -> None:
-        """Сохраняет данные в JSON-файл."""
-        with open(self._filename, "w", encoding="utf-8") as file:
-            json.dump(data, file, ensure_ascii=False, indent=4)
+        """
+        Сохраняет данные в JSON-файл.
+        Данные пишутся во временный файл, который затем атомарно заменяет исходный,
+        поэтому одновременное чтение никогда не видит наполовину записанный файл.
+        """
+        directory = os.path.dirname(os.path.abspath(self._filename))
+        os.replace(write_temp_json(directory, data), self._filename)
+        increment("storage.records_saved", len(data))
 
-    def add_vacancy(self, vacancy_data: Dict[str, Any]) -> None:
-        """Добавляет вакансию в JSON-файл."""
+    @staticmethod
+    def _prepare_vacancy(vacancy_data: Dict[str, Any]) -> None:
+        """Проверяет поля вакансии и дополняет её данными, которые вычисляются один раз при добавлении."""
 
         # Проверка на наличие необходимых полей
         required_fields = ["title", "link", "salary", "description"]
@@ -79,19 +323,60 @@ class JSONFileHandler(FileHandler):
         # Обработка HTML
         vacancy_data["description"] = clean_html(vacancy_data["description"])
 
-        data = self._load_data()
-        if vacancy_data not in data:  # Проверка на дубликаты
-            data.append(vacancy_data)
-            self._save_data(data)
-            print(f"Вакансия '{vacancy_data['title']}' успешно добавлена.")
+        # Основы слов описания считаются один раз при добавлении и используются при фильтрации
+        vacancy_data["tokens"] = token_string(vacancy_data["description"])
+
+        # Зарплата в рублях (границы вилки и значение для сортировки) вычисляется один раз при добавлении
+        apply_salary_fields(vacancy_data)
+
+    def add_vacancy(self, vacancy_data: Dict[str, Any]) -> None:
+        """Добавляет вакансию в JSON-файл."""
+        self._prepare_vacancy(vacancy_data)
+
+        with self._lock:
+            data = self._load_data()
+            if vacancy_data not in data:  # Проверка на дубликаты
+                data.append(vacancy_data)
+                self._save_data(data)
+                print(f"Вакансия '{vacancy_data['title']}' успешно добавлена.")
+                self._notify(self.ADDED, [vacancy_data])
+
+    def add_vacancies(
+        self, vacancies: List[Dict[str, Any]], near_duplicates: str = "group", threshold: float = 0.8
+    ) -> int:
+        """
+        Добавляет несколько вакансий за одно чтение и одну запись файла.
+        Дубликаты и почти одинаковые вакансии отбираются функцией select_new_vacancies.
+        :param vacancies: Список словарей с данными о вакансиях.
+        :param near_duplicates: Что делать с почти одинаковыми вакансиями: "group", "skip" или "keep".
+        :param threshold: Порог сходства, начиная с которого вакансии считаются почти одинаковыми.
+        :return: Количество добавленных вакансий.
+        """
+        for vacancy_data in vacancies:
+            self._prepare_vacancy(vacancy_data)
+
+        with self._lock:
+            data = self._load_data()
+            detector = self._near_duplicate_detector(data, near_duplicates, threshold)
+            selected = select_new_vacancies(data, vacancies, near_duplicates, threshold, detector)
+            if selected:
+                data.extend(selected)
+                self._save_data(data)
+            self._remember_detector_version()
+            self._notify(self.ADDED, selected)
+            return len(selected)
 
     def delete_vacancy(self, vacancy_id: int) -> None:
         """Удаляет вакансию из JSON-файла по ID."""
-        data = self._load_data()
-        data = [v for v in data if v.get("id") != vacancy_id]
-        self._save_data(data)
+        with self._lock:
+            data = self._load_data()
+            removed = [v for v in data if v.get("id") == vacancy_id]
+            data = [v for v in data if v.get("id") != vacancy_id]
+            self._save_data(data)
+            self._notify(self.DELETED, removed)
         print(f"Вакансия с ID {vacancy_id} удалена.")
 
+    @timed("filter.keywords")
     def filter_vacancies(self, filter_words: List[str]) -> List[Dict]:
         """
         Фильтрует вакансии по ключевому слову в описании.
@@ -106,17 +391,9 @@ class JSONFileHandler(FileHandler):
         if not filter_words:
             return data
 
-        return [
-            v
-            for v in data
-            if isinstance(v, dict)
-            and any(
-                word.lower()
-                in (clean_html(v.get("description", "Описание отсутствует") or "Описание отсутствует")).lower()
-                for word in filter_words
-            )
-        ]
+        return [v for v in data if isinstance(v, dict) and matches_keywords(v, filter_words)]
 
+    @timed("filter.salary")
     def filter_vacancies_by_salary(self, salary_range: Tuple[float, float]) -> List[Dict[str, Any]]:
         """
         Фильтрует вакансии по диапазону зарплат.
@@ -124,12 +401,5 @@ class JSONFileHandler(FileHandler):
         :return: Список отфильтрованных вакансий.
         """
         data = self._load_data()
-        min_salary, max_salary = salary_range
-
-        return [
-            v
-            for v in data
-            if isinstance(v, dict)
-            and isinstance(v.get("salary"), (float, int))
-            and min_salary <= v["salary"] <= max_salary
-        ]
+
+        return [v for v in data if isinstance(v, dict) and matches_salary(v, salary_range)]
@@ -1,7 +1,11 @@
 import re
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from src.metrics import timed
+from src.tokenizer import query_patterns, token_string
 
+
+@timed("html.clean")
 def clean_html(raw_html: Optional[str]) -> str:
     """
     Удаляет HTML-теги из строки.
@@ -30,3 +34,70 @@ def parse_salary_range(salary_range_input: str) -> tuple:
     except ValueError:
         print("Некорректный формат диапазона зарплат. Используйте формат: минимум-максимум")
         return 0, float("inf")  # Если формат некорректный, используем весь диапазон
+
+
+def matches_keywords(vacancy: Dict[str, Any], filter_words: List[str]) -> bool:
+    """
+    Проверяет, встречается ли хотя бы одно ключевое слово в описании вакансии.
+    Сравниваются основы слов, поэтому «разработчик» находит «разработчика», а «java» не находит «javascript».
+    Если у вакансии сохранены основы описания (поле 'tokens'), описание повторно не разбирается,
+    а проверка сводится к поиску подстрок " основа " в этой строке.
+    :param vacancy: Словарь с данными о вакансии.
+    :param filter_words: Список ключевых слов.
+    :return: True, если вакансия подходит под фильтр (пустой фильтр подходит всегда).
+    """
+    if not filter_words:
+        return True
+    tokens = vacancy.get("tokens")
+    if isinstance(tokens, list):  # Вакансии, сохранённые со списком основ
+        tokens = f" {' '.join(tokens)} "
+    elif not isinstance(tokens, str):
+        tokens = token_string(clean_html(vacancy.get("description", "Описание отсутствует") or "Описание отсутствует"))
+    return any(all(pattern in tokens for pattern in term) for term in query_patterns(tuple(filter_words)))
+
+
+def salary_bounds(vacancy: Dict[str, Any]) -> Optional[Tuple[float, float]]:
+    """
+    Возвращает границы зарплатной вилки вакансии в рублях.
+    Для вакансий, сохранённых до появления полей salary_from/salary_to, используется числовое поле salary.
+    :param vacancy: Словарь с данными о вакансии.
+    :return: Кортеж (от, до) или None, если зарплата не указана. Вилка без одной из границ считается
+             одним числом.
+    """
+    if "salary_rub" in vacancy:
+        limits = (vacancy.get("salary_from"), vacancy.get("salary_to"))
+        bounds = [float(value) for value in limits if value is not None]
+        if not bounds:
+            return None
+        return bounds[0], bounds[-1]
+    salary = salary_value(vacancy)
+    return None if salary is None else (salary, salary)
+
+
+def matches_salary(vacancy: Dict[str, Any], salary_range: Tuple[float, float]) -> bool:
+    """
+    Проверяет, пересекается ли зарплатная вилка вакансии с диапазоном.
+    :param vacancy: Словарь с данными о вакансии.
+    :param salary_range: Кортеж (min_salary, max_salary).
+    :return: True, если зарплата указана и вилка пересекается с диапазоном.
+    """
+    bounds = salary_bounds(vacancy)
+    if bounds is None:
+        return False
+    min_salary, max_salary = salary_range
+    return bounds[0] <= max_salary and bounds[1] >= min_salary
+
+
+def salary_value(vacancy: Dict[str, Any]) -> Optional[float]:
+    """
+    Возвращает зарплату вакансии числом (в рублях, если вакансия сохранена с полем salary_rub).
+    :param vacancy: Словарь с данными о вакансии.
+    :return: Зарплата или None, если она не указана числом.
+    """
+    if "salary_rub" in vacancy:
+        salary_rub = vacancy["salary_rub"]
+        return None if salary_rub is None else float(salary_rub)
+    salary = vacancy.get("salary")
+    if isinstance(salary, bool) or not isinstance(salary, (float, int)):
+        return None
+    return float(salary)
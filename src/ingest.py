@@ -0,0 +1,193 @@
+import queue
+import threading
+import time
+from typing import Any, Dict, List, Optional, Protocol, Set
+
+from src.file_handler import FileHandler
+from src.vacancy import Vacancy
+
+
+class VacancySource(Protocol):
+    """Источник вакансий для IngestWorker: обработчик одного API (APIHandler) или VacancyAggregator."""
+
+    def get_vacancies(self, keyword: str) -> List[Dict[str, Any]]:
+        """
+        Возвращает вакансии по ключевому слову.
+        :raises Exception: Ошибка источника; задача загрузки завершается со статусом FAILED.
+        """
+
+
+class IngestJob:
+    """Фоновая задача загрузки вакансий по одному поисковому запросу."""
+
+    QUEUED = "в очереди"
+    FETCHING = "запрос к API"
+    PREPARING = "обработка"
+    SAVING = "запись в хранилище"
+    DONE = "завершена"
+    CANCELLED = "отменена"
+    FAILED = "ошибка"
+
+    def __init__(self, job_id: int, search_query: str) -> None:
+        self.job_id = job_id
+        self.search_query = search_query
+        self.status = self.QUEUED
+        self.total = 0
+        self.processed = 0
+        self.added = 0
+        self.errors = 0
+        self.error_message = ""
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._cancel_event = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (self.DONE, self.CANCELLED, self.FAILED)
+
+    def cancel(self) -> None:
+        """Запрашивает отмену задачи; она остановится перед обработкой следующей порции и ничего не сохранит."""
+        self._cancel_event.set()
+
+    def progress(self) -> str:
+        """Возвращает строку с текущим состоянием задачи для индикатора прогресса."""
+        line = f"[{self.job_id}] «{self.search_query}»: {self.status}"
+        if self.status == self.PREPARING and self.total:
+            line += f" {self.processed}/{self.total} ({self.processed * 100 // self.total}%)"
+        return line
+
+    def summary(self) -> str:
+        """Возвращает итоговое сообщение о завершённой задаче."""
+        duration = (self.finished_at or time.monotonic()) - (self.started_at or time.monotonic())
+        summary = (
+            f"Загрузка [{self.job_id}] «{self.search_query}» {self.status}: получено {self.total}, "
+            f"обработано {self.processed}, добавлено {self.added}, "
+            f"пропущено {self.processed - self.added - self.errors}, ошибок {self.errors}, {duration:.1f} с."
+        )
+        if self.error_message:
+            summary += f" {self.error_message}"
+        return summary
+
+
+class IngestWorker:
+    """
+    Фоновый поток, который по очереди выполняет задачи загрузки вакансий из API в хранилище.
+    Поток запускается при первой задаче, поэтому создание объекта не замедляет запуск программы.
+    """
+
+    def __init__(self, file_handler: FileHandler, api: VacancySource, chunk_size: int = 20) -> None:
+        self._file_handler = file_handler
+        self._api = api
+        self._chunk_size = chunk_size
+        self._queue: "queue.Queue[Optional[IngestJob]]" = queue.Queue()
+        self._jobs: List[IngestJob] = []
+        self._reported: Set[int] = set()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def jobs(self) -> List[IngestJob]:
+        with self._lock:
+            return list(self._jobs)
+
+    def active_jobs(self) -> List[IngestJob]:
+        """Возвращает задачи, которые ещё не завершены."""
+        return [job for job in self.jobs if not job.finished]
+
+    def submit(self, search_query: str) -> IngestJob:
+        """
+        Ставит поисковый запрос в очередь на загрузку.
+        :param search_query: Поисковый запрос.
+        :return: Созданная задача.
+        """
+        with self._lock:
+            job = IngestJob(len(self._jobs) + 1, search_query)
+            self._jobs.append(job)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="ingest-worker", daemon=True)
+                self._thread.start()
+        self._queue.put(job)
+        return job
+
+    def cancel(self, job_id: int) -> bool:
+        """
+        Отменяет задачу по номеру.
+        :param job_id: Номер задачи.
+        :return: True, если задача найдена и ещё не завершена.
+        """
+        for job in self.jobs:
+            if job.job_id == job_id and not job.finished:
+                job.cancel()
+                return True
+        return False
+
+    def pop_finished(self) -> List[IngestJob]:
+        """Возвращает завершённые задачи, о которых ещё не сообщалось пользователю."""
+        finished = []
+        with self._lock:
+            for job in self._jobs:
+                if job.finished and job.job_id not in self._reported:
+                    self._reported.add(job.job_id)
+                    finished.append(job)
+        return finished
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Останавливает фоновый поток после выполнения уже поставленных задач.
+        :param wait: Дождаться завершения потока.
+        """
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        if wait:
+            self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            job = self._queue.get()
+            if job is None:
+                break
+            self._process(job)
+
+    def _process(self, job: IngestJob) -> None:
+        job.started_at = time.monotonic()
+        try:
+            if not job.cancelled:
+                job.status = IngestJob.FETCHING
+                vacancies = self._api.get_vacancies(job.search_query)
+                job.total = len(vacancies)
+                job.status = IngestJob.PREPARING
+                self._save(job, vacancies)
+            status = IngestJob.CANCELLED if job.cancelled else IngestJob.DONE
+        except Exception as e:
+            # Ошибка одной задачи не должна останавливать поток и остальные задачи в очереди
+            status = IngestJob.FAILED
+            job.error_message = str(e)
+        job.finished_at = time.monotonic()
+        job.status = status
+
+    def _save(self, job: IngestJob, vacancies: List[Dict[str, Any]]) -> None:
+        """
+        Приводит вакансии к формату хранилища порциями по chunk_size: между порциями обновляется прогресс
+        и проверяется отмена. Все вакансии задачи сохраняются в конце одним вызовом add_vacancies,
+        то есть одной перезаписью хранилища. Отменённая задача ничего не сохраняет.
+        """
+        batch = []
+        for start in range(0, len(vacancies), self._chunk_size):
+            if job.cancelled:
+                return
+            for vacancy in vacancies[start: start + self._chunk_size]:
+                try:
+                    # Дополнительные поля источника (например, 'source' от агрегатора) сохраняются
+                    batch.append({**vacancy, **Vacancy.from_dict(vacancy).to_dict()})
+                except (KeyError, ValueError):
+                    job.errors += 1
+            job.processed += len(vacancies[start: start + self._chunk_size])
+        if not job.cancelled:
+            # Запись всей задачи — самая долгая часть, поэтому до её конца показывается отдельное состояние
+            job.status = IngestJob.SAVING
+            job.added = self._file_handler.add_vacancies(batch)
@@ -0,0 +1,204 @@
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Переменные окружения:
+# VACANCY_METRICS=json|prometheus — включает сбор метрик и их вывод при завершении программы;
+# VACANCY_METRICS_FILE=путь — файл для метрик (по умолчанию stderr);
+# VACANCY_PROFILE=cprofile|tracemalloc — профилирование всего запуска;
+# VACANCY_PROFILE_FILE=путь — файл для результатов профилирования (по умолчанию stderr).
+METRICS_ENV = "VACANCY_METRICS"
+METRICS_FILE_ENV = "VACANCY_METRICS_FILE"
+PROFILE_ENV = "VACANCY_PROFILE"
+PROFILE_FILE_ENV = "VACANCY_PROFILE_FILE"
+
+_enabled = bool(os.environ.get(METRICS_ENV))
+
+
+class MetricsRegistry:
+    """Потокобезопасное хранилище счётчиков и таймеров."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: Dict[str, float] = {}
+        self._timers: Dict[str, List[float]] = {}  # имя -> [количество, сумма, максимум] в секундах
+
+    def increment(self, name: str, value: float = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def observe(self, name: str, seconds: float) -> None:
+        with self._lock:
+            timer = self._timers.setdefault(name, [0, 0.0, 0.0])
+            timer[0] += 1
+            timer[1] += seconds
+            timer[2] = max(timer[2], seconds)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._timers.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Возвращает копию всех метрик в виде словаря."""
+        with self._lock:
+            return {
+                "counters": dict(self._counters),
+                "timers": {
+                    name: {"count": int(count), "total_s": total, "max_s": maximum}
+                    for name, (count, total, maximum) in self._timers.items()
+                },
+            }
+
+    def to_json(self) -> str:
+        return json.dumps(self.snapshot(), ensure_ascii=False, indent=4)
+
+    def to_prometheus(self) -> str:
+        """Возвращает метрики в текстовом формате Prometheus."""
+        snapshot = self.snapshot()
+        lines = []
+        for name, value in sorted(snapshot["counters"].items()):
+            metric = _prometheus_name(name) + "_total"
+            lines += [f"# TYPE {metric} counter", f"{metric} {value}"]
+        for name, timer in sorted(snapshot["timers"].items()):
+            metric = _prometheus_name(name) + "_seconds"
+            lines += [
+                f"# TYPE {metric} summary",
+                f"{metric}_count {timer['count']}",
+                f"{metric}_sum {timer['total_s']}",
+                f"# TYPE {metric}_max gauge",
+                f"{metric}_max {timer['max_s']}",
+            ]
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+
+def _prometheus_name(name: str) -> str:
+    return "vacancy_" + "".join(char if char.isalnum() else "_" for char in name)
+
+
+def enabled() -> bool:
+    """Возвращает True, если сбор метрик включён."""
+    return _enabled
+
+
+def enable(flag: bool = True) -> None:
+    """Включает или выключает сбор метрик во время работы программы."""
+    global _enabled
+    _enabled = flag
+
+
+def increment(name: str, value: float = 1) -> None:
+    """Увеличивает счётчик, если сбор метрик включён."""
+    if _enabled:
+        REGISTRY.increment(name, value)
+
+
+def timed(name: str) -> Callable[[F], F]:
+    """
+    Декоратор, измеряющий время и число вызовов функции.
+    При выключенном сборе метрик добавляет к вызову только проверку одного флага.
+    :param name: Имя таймера, например "storage.load".
+    """
+
+    def decorator(func: F) -> F:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _enabled:
+                return func(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                REGISTRY.observe(name, time.perf_counter() - started)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def _open_output(env_name: str) -> Any:
+    path = os.environ.get(env_name)
+    return open(path, "w", encoding="utf-8") if path else sys.stderr
+
+
+def dump_metrics(output_format: str = "json") -> None:
+    """
+    Выводит накопленные метрики в файл из VACANCY_METRICS_FILE или в stderr.
+    :param output_format: "json" или "prometheus".
+    """
+    text = REGISTRY.to_prometheus() if output_format == "prometheus" else REGISTRY.to_json() + "\n"
+    output = _open_output(METRICS_FILE_ENV)
+    try:
+        output.write(text)
+    finally:
+        if output is not sys.stderr:
+            output.close()
+
+
+def _start_cprofile() -> None:
+    import cProfile
+    import pstats
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+
+    def report() -> None:
+        profiler.disable()
+        output = _open_output(PROFILE_FILE_ENV)
+        try:
+            pstats.Stats(profiler, stream=output).sort_stats("cumulative").print_stats(30)
+        finally:
+            if output is not sys.stderr:
+                output.close()
+
+    atexit.register(report)
+
+
+def _start_tracemalloc() -> None:
+    import tracemalloc
+
+    tracemalloc.start()
+
+    def report() -> None:
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        output = _open_output(PROFILE_FILE_ENV)
+        try:
+            output.write(f"Пиковое потребление памяти: {peak / 1024 / 1024:.2f} МБ\n")
+            for statistic in snapshot.statistics("lineno")[:20]:
+                output.write(f"{statistic}\n")
+        finally:
+            if output is not sys.stderr:
+                output.close()
+
+    atexit.register(report)
+
+
+def install_from_env() -> Optional[str]:
+    """
+    Настраивает метрики и профилирование по переменным окружения.
+    Вызывается один раз в точке входа; без переменных окружения ничего не делает.
+    :return: Формат вывода метрик или None, если метрики выключены.
+    """
+    output_format = os.environ.get(METRICS_ENV)
+    if output_format:
+        enable()
+        atexit.register(dump_metrics, "prometheus" if output_format == "prometheus" else "json")
+
+    profile_mode = os.environ.get(PROFILE_ENV)
+    if profile_mode == "cprofile":
+        _start_cprofile()
+    elif profile_mode == "tracemalloc":
+        _start_tracemalloc()
+    return output_format or None
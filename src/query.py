@@ -0,0 +1,235 @@
+import copy
+import heapq
+from bisect import bisect_left, bisect_right
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from src.file_handler import FileHandler
+from src.helpers import matches_keywords, matches_salary, salary_bounds, salary_value
+
+ORDER_FIELDS = ("salary",)
+
+
+def _salary_key(vacancy: Dict[str, Any]) -> float:
+    """Ключ сортировки по зарплате: вакансии без числовой зарплаты считаются с зарплатой 0."""
+    salary = salary_value(vacancy)
+    return 0.0 if salary is None else salary
+
+
+class VacancyIndex:
+    """
+    Индекс по зарплате, построенный один раз по списку вакансий.
+    Хранит позиции вакансий, отсортированные по зарплате по возрастанию и по убыванию,
+    что позволяет выбирать диапазон бинарным поиском и сразу обходить его в нужном порядке.
+    Ключ индекса — нижняя граница зарплатной вилки в рублях; вилки, пересекающиеся с диапазоном,
+    находятся расширением диапазона поиска на ширину самой широкой вилки.
+    """
+
+    def __init__(self, vacancies: Iterable[Dict[str, Any]]) -> None:
+        self._vacancies: List[Dict[str, Any]] = []
+        self._upper_bounds: Dict[int, float] = {}
+        self._max_spread = 0.0
+        self._asc_keys: List[float] = []
+        self._asc_positions: List[int] = []
+        self._desc_keys: List[float] = []
+        self._desc_positions: List[int] = []
+        self._index(list(vacancies))
+
+    def _index(self, vacancies: List[Dict[str, Any]]) -> None:
+        """Добавляет вакансии в конец индекса: их ключи сортируются отдельно и сливаются с готовыми списками."""
+        salaried = []
+        for position, vacancy in enumerate(vacancies, start=len(self._vacancies)):
+            bounds = salary_bounds(vacancy)
+            if bounds is not None:
+                salaried.append((bounds[0], position))
+                self._upper_bounds[position] = bounds[1]
+                self._max_spread = max(self._max_spread, bounds[1] - bounds[0])
+        self._vacancies.extend(vacancies)
+        new_descending = sorted((-salary, position) for salary, position in salaried)
+        ascending = list(heapq.merge(zip(self._asc_keys, self._asc_positions), sorted(salaried)))
+        descending = list(heapq.merge(zip(self._desc_keys, self._desc_positions), new_descending))
+        self._asc_keys = [salary for salary, _ in ascending]
+        self._asc_positions = [position for _, position in ascending]
+        self._desc_keys = [key for key, _ in descending]
+        self._desc_positions = [position for _, position in descending]
+
+    def extended(self, vacancies: Iterable[Dict[str, Any]]) -> "VacancyIndex":
+        """
+        Возвращает новый индекс с добавленными вакансиями, не сортируя заново уже проиндексированные.
+        Исходный индекс не меняется, поэтому запросы, которые его используют, работают без блокировки.
+        :param vacancies: Новые вакансии.
+        :return: Индекс со всеми вакансиями (новые — в конце).
+        """
+        index = copy.copy(self)
+        index._vacancies = list(self._vacancies)
+        index._upper_bounds = dict(self._upper_bounds)
+        index._index(list(vacancies))
+        return index
+
+    def __len__(self) -> int:
+        return len(self._vacancies)
+
+    @property
+    def vacancies(self) -> List[Dict[str, Any]]:
+        return self._vacancies
+
+    def salary_range(self, min_salary: float, max_salary: float, descending: bool = False) -> List[int]:
+        """
+        Возвращает позиции вакансий, чья зарплатная вилка пересекается с диапазоном, упорядоченные по зарплате.
+        :param min_salary: Минимальная зарплата.
+        :param max_salary: Максимальная зарплата.
+        :param descending: Порядок обхода — по убыванию зарплаты.
+        :return: Список позиций вакансий в индексе.
+        """
+        lowest_key = min_salary - self._max_spread
+        if descending:
+            start = bisect_left(self._desc_keys, -max_salary)
+            end = bisect_right(self._desc_keys, -lowest_key)
+            candidates = self._desc_positions[start:end]
+        else:
+            start = bisect_left(self._asc_keys, lowest_key)
+            end = bisect_right(self._asc_keys, max_salary)
+            candidates = self._asc_positions[start:end]
+        if not self._max_spread:
+            return candidates
+        return [position for position in candidates if self._upper_bounds[position] >= min_salary]
+
+
+class QueryPlan:
+    """План выполнения запроса: выбранная стратегия и шаги для explain()."""
+
+    FULL_SCAN = "fused_scan"
+    SALARY_INDEX = "salary_index"
+
+    def __init__(self, strategy: str, steps: List[str]) -> None:
+        self.strategy = strategy
+        self.steps = steps
+
+    def __str__(self) -> str:
+        lines = [f"План запроса ({self.strategy}):"]
+        lines.extend(f"  {number}. {step}" for number, step in enumerate(self.steps, start=1))
+        return "\n".join(lines)
+
+
+class Query:
+    """
+    Составной запрос к хранилищу вакансий.
+    Пример: Query().keywords("python").salary(100000, 200000).order_by("salary").limit(10)
+    Все условия применяются за один проход по данным либо через индекс по зарплате, если он доступен.
+    """
+
+    def __init__(self) -> None:
+        self._keywords: List[str] = []
+        self._salary_range: Optional[Tuple[float, float]] = None
+        self._order_by: Optional[str] = None
+        self._descending = True
+        self._limit: Optional[int] = None
+
+    def keywords(self, *words: str) -> "Query":
+        """Добавляет ключевые слова (вакансия подходит, если встречается хотя бы одно)."""
+        self._keywords.extend(word for word in words if word)
+        return self
+
+    def salary(self, min_salary: float = 0, max_salary: float = float("inf")) -> "Query":
+        """Задаёт диапазон зарплат."""
+        if min_salary < 0 or max_salary < min_salary:
+            raise ValueError("Некорректный диапазон зарплат.")
+        self._salary_range = (float(min_salary), float(max_salary))
+        return self
+
+    def order_by(self, field: str, descending: bool = True) -> "Query":
+        """Задаёт сортировку результата (поддерживается только поле 'salary')."""
+        if field not in ORDER_FIELDS:
+            raise ValueError(f"Сортировка по полю '{field}' не поддерживается.")
+        self._order_by = field
+        self._descending = descending
+        return self
+
+    def limit(self, count: int) -> "Query":
+        """Ограничивает число вакансий в результате."""
+        if count < 0:
+            raise ValueError("Лимит не может быть отрицательным.")
+        self._limit = count
+        return self
+
+    def _describe_order(self) -> str:
+        direction = "по убыванию" if self._descending else "по возрастанию"
+        return f"по зарплате ({direction})"
+
+    def plan(self, source: Union[FileHandler, VacancyIndex]) -> QueryPlan:
+        """
+        Выбирает самый дешёвый способ выполнить запрос для данного источника.
+        :param source: Хранилище (FileHandler) или построенный индекс (VacancyIndex).
+        :return: План выполнения запроса.
+        """
+        keywords_step = f"Фильтр по ключевым словам: {', '.join(self._keywords)}" if self._keywords else None
+
+        if isinstance(source, VacancyIndex) and self._salary_range is not None:
+            min_salary, max_salary = self._salary_range
+            steps = [f"Диапазонный поиск по индексу зарплат [{min_salary}; {max_salary}]"]
+            if keywords_step:
+                steps.append(keywords_step + " (только для кандидатов из индекса)")
+            if self._order_by:
+                steps.append(f"Порядок {self._describe_order()} берётся из индекса без сортировки")
+            else:
+                steps.append("Восстановление исходного порядка кандидатов")
+            if self._limit is not None:
+                steps.append(f"Ранняя остановка после {self._limit} записей")
+            return QueryPlan(QueryPlan.SALARY_INDEX, steps)
+
+        conditions = [keywords_step] if keywords_step else []
+        if self._salary_range is not None:
+            conditions.append(f"зарплата в диапазоне [{self._salary_range[0]}; {self._salary_range[1]}]")
+        scan = "Один полный проход по хранилищу"
+        steps = [f"{scan} с проверкой условий: {'; '.join(conditions)}" if conditions else scan]
+        if self._order_by and self._limit is not None:
+            steps.append(f"Отбор top-{self._limit} {self._describe_order()} через кучу во время прохода")
+        elif self._order_by:
+            steps.append(f"Сортировка результата {self._describe_order()}")
+        elif self._limit is not None:
+            steps.append(f"Ранняя остановка после {self._limit} записей")
+        return QueryPlan(QueryPlan.FULL_SCAN, steps)
+
+    def explain(self, source: Union[FileHandler, VacancyIndex]) -> str:
+        """Возвращает текстовое описание плана выполнения запроса."""
+        return str(self.plan(source))
+
+    def _matches(self, vacancy: Dict[str, Any]) -> bool:
+        if not isinstance(vacancy, dict):
+            return False
+        if self._salary_range is not None and not matches_salary(vacancy, self._salary_range):
+            return False
+        return matches_keywords(vacancy, self._keywords)
+
+    def _execute_index(self, index: VacancyIndex) -> List[Dict[str, Any]]:
+        min_salary, max_salary = self._salary_range or (0.0, float("inf"))
+        descending = self._descending if self._order_by else False
+        positions = index.salary_range(min_salary, max_salary, descending=descending)
+        if not self._order_by:
+            positions = sorted(positions)
+        vacancies = index.vacancies
+        matched = (
+            vacancies[position] for position in positions if matches_keywords(vacancies[position], self._keywords)
+        )
+        return list(islice(matched, self._limit))
+
+    def _execute_scan(self, vacancies: Iterator[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        matched = (v for v in vacancies if self._matches(v))
+        if self._order_by and self._limit is not None:
+            select = heapq.nlargest if self._descending else heapq.nsmallest
+            return select(self._limit, matched, key=_salary_key)
+        if self._order_by:
+            return sorted(matched, key=_salary_key, reverse=self._descending)
+        return list(islice(matched, self._limit))
+
+    def execute(self, source: Union[FileHandler, VacancyIndex]) -> List[Dict[str, Any]]:
+        """
+        Выполняет запрос по выбранному плану.
+        :param source: Хранилище (FileHandler) или построенный индекс (VacancyIndex).
+        :return: Список подходящих вакансий.
+        """
+        if isinstance(source, VacancyIndex):
+            if self.plan(source).strategy == QueryPlan.SALARY_INDEX:
+                return self._execute_index(source)
+            return self._execute_scan(iter(source.vacancies))
+        return self._execute_scan(source.iter_vacancies())
@@ -0,0 +1,109 @@
+import re
+from typing import Any, Dict, Optional, Tuple
+
+NOT_SPECIFIED = "Зарплата не указана"
+DEFAULT_CURRENCY = "RUR"
+
+# Курсы валют к рублю для приведения зарплат к одной шкале. Таблица локальная и обновляется вручную:
+# для сравнения и фильтрации вакансий точность курса до процентов не важна, а обращение к сети при
+# каждой загрузке вакансий замедлило бы её. Коды валют — как в API HeadHunter (рубль — "RUR").
+RATES_TO_RUB = {
+    "RUR": 1.0,
+    "RUB": 1.0,
+    "USD": 92.0,
+    "EUR": 100.0,
+    "KZT": 0.19,
+    "BYR": 28.0,
+    "BYN": 28.0,
+    "UAH": 2.2,
+    "UZS": 0.0073,
+    "KGS": 1.05,
+    "AZN": 54.0,
+    "GEL": 34.0,
+}
+
+# Доля зарплаты «до вычета налогов» (gross в API HeadHunter), которая остаётся на руках после НДФЛ 13 %.
+# Вилки приводятся к сумме на руки, иначе gross- и net-зарплаты с одинаковыми числами считались бы равными.
+NET_SHARE = 0.87
+
+# Обозначения валют в текстовом виде зарплаты ("100 000-150 000 руб.", "от 2000 $")
+_CURRENCY_MARKERS = (("руб", "RUR"), ("₽", "RUR"), ("usd", "USD"), ("$", "USD"), ("eur", "EUR"), ("€", "EUR"))
+_DIGIT_GROUPS = re.compile(r"(?<=\d)[\s  ]+(?=\d)")
+_NUMBER = re.compile(r"\d+(?:[.,]\d+)?")
+
+
+def to_rub(amount: Optional[float], currency: Optional[str]) -> Optional[float]:
+    """
+    Переводит сумму в рубли по локальной таблице курсов.
+    :param amount: Сумма или None.
+    :param currency: Код валюты (None — рубли).
+    :return: Сумма в рублях или None, если сумма не указана или курс валюты неизвестен.
+    """
+    if amount is None:
+        return None
+    rate = RATES_TO_RUB.get((currency or DEFAULT_CURRENCY).upper())
+    return None if rate is None else round(float(amount) * rate, 2)
+
+
+def parse_salary_text(text: str) -> Tuple[Optional[float], Optional[float], str]:
+    """
+    Разбирает зарплату в текстовом виде: "100 000-150 000 руб.", "от 90000", "до 150 000 руб.".
+    :param text: Строка с зарплатой.
+    :return: Кортеж (от, до, код валюты); отсутствующие границы — None.
+    """
+    lowered = text.lower()
+    currency = next((code for marker, code in _CURRENCY_MARKERS if marker in lowered), DEFAULT_CURRENCY)
+    numbers = [float(number.replace(",", ".")) for number in _NUMBER.findall(_DIGIT_GROUPS.sub("", lowered))]
+    if not numbers:
+        return None, None, currency
+    if len(numbers) == 1:
+        if lowered.strip().startswith("до"):
+            return None, numbers[0], currency
+        return numbers[0], None, currency
+    return numbers[0], numbers[1], currency
+
+
+def _scaled(amount: Optional[float], share: float) -> Optional[float]:
+    return None if amount is None else float(amount) * share
+
+
+def normalize_salary(salary: Any, salary_range: Optional[Dict[str, Any]] = None) -> Dict[str, Optional[float]]:
+    """
+    Приводит зарплату к числовым полям в рублях.
+    :param salary: Зарплата в прежнем виде: число (рубли), строка или None.
+    :param salary_range: Зарплата из API HeadHunter: словарь с ключами from, to, currency, gross.
+                         Если передан, имеет приоритет над salary; при gross=True суммы пересчитываются
+                         на руки (умножаются на NET_SHARE).
+    :return: Словарь с полями salary_from, salary_to (границы вилки) и salary_rub (нижняя граница,
+             а если её нет — верхняя; по ней вакансии сортируются и считается статистика).
+    """
+    if isinstance(salary_range, dict):
+        currency = salary_range.get("currency")
+        share = NET_SHARE if salary_range.get("gross") else 1.0
+        salary_from = to_rub(_scaled(salary_range.get("from"), share), currency)
+        salary_to = to_rub(_scaled(salary_range.get("to"), share), currency)
+    elif isinstance(salary, (int, float)) and not isinstance(salary, bool):
+        salary_from, salary_to = float(salary), None
+    elif isinstance(salary, str):
+        low, high, currency = parse_salary_text(salary)
+        salary_from, salary_to = to_rub(low, currency), to_rub(high, currency)
+    else:
+        salary_from = salary_to = None
+    return {
+        "salary_from": salary_from,
+        "salary_to": salary_to,
+        "salary_rub": salary_from if salary_from is not None else salary_to,
+    }
+
+
+def apply_salary_fields(vacancy: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Дополняет словарь вакансии полями salary_from, salary_to и salary_rub, если их ещё нет.
+    Поле salary заменяется зарплатой в рублях, чтобы старый код видел ту же шкалу.
+    :param vacancy: Словарь с данными о вакансии (изменяется на месте).
+    :return: Тот же словарь.
+    """
+    if "salary_rub" not in vacancy:
+        vacancy.update(normalize_salary(vacancy.get("salary"), vacancy.get("salary_range")))
+    vacancy["salary"] = vacancy["salary_rub"] if vacancy["salary_rub"] is not None else NOT_SPECIFIED
+    return vacancy
@@ -0,0 +1,224 @@
+import math
+from bisect import bisect_right
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.helpers import matches_keywords, salary_value
+
+# Нижние границы корзин гистограммы зарплат, руб. Последняя корзина открыта сверху.
+DEFAULT_BUCKETS = (0, 30000, 50000, 75000, 100000, 150000, 200000, 300000, 500000)
+
+
+class TDigest:
+    """
+    Скетч t-digest для приближённых квантилей за один проход.
+    Значения сжимаются в центроиды (среднее, вес); у хвостов распределения центроиды мельче,
+    поэтому крайние квантили (p95, p99) точнее медианы. Два скетча можно объединить.
+    """
+
+    def __init__(self, compression: int = 100) -> None:
+        self._compression = compression
+        self._centroids: List[Tuple[float, float]] = []
+        self._buffer: List[Tuple[float, float]] = []
+        self._count = 0.0
+        self._min = math.inf
+        self._max = -math.inf
+
+    @property
+    def count(self) -> float:
+        return self._count
+
+    def add(self, value: float, weight: float = 1.0) -> None:
+        """Добавляет значение с весом."""
+        self._buffer.append((value, weight))
+        self._count += weight
+        self._min = min(self._min, value)
+        self._max = max(self._max, value)
+        if len(self._buffer) >= self._compression * 10:
+            self._compress()
+
+    def merge(self, other: "TDigest") -> None:
+        """Добавляет в скетч все значения другого скетча."""
+        other._compress()
+        for mean, weight in other._centroids:
+            self._buffer.append((mean, weight))
+            self._count += weight
+        if other._count:
+            self._min = min(self._min, other._min)
+            self._max = max(self._max, other._max)
+        self._compress()
+
+    def _compress(self) -> None:
+        if not self._buffer:
+            return
+        points = sorted(self._centroids + self._buffer)
+        self._buffer = []
+        merged: List[Tuple[float, float]] = []
+        cumulative = 0.0
+        mean, weight = points[0]
+        for next_mean, next_weight in points[1:]:
+            combined = weight + next_weight
+            q = (cumulative + combined / 2) / self._count
+            if combined <= max(1.0, 4 * self._count * q * (1 - q) / self._compression):
+                mean += (next_mean - mean) * next_weight / combined
+                weight = combined
+            else:
+                merged.append((mean, weight))
+                cumulative += weight
+                mean, weight = next_mean, next_weight
+        merged.append((mean, weight))
+        self._centroids = merged
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Возвращает приближённое значение квантиля.
+        :param q: Квантиль от 0 до 1.
+        :return: Значение квантиля или None, если значений нет.
+        """
+        self._compress()
+        if not self._centroids:
+            return None
+        target = q * self._count
+        cumulative = 0.0
+        previous_position, previous_mean = 0.0, self._min
+        for mean, weight in self._centroids:
+            position = cumulative + weight / 2
+            if target <= position:
+                if position == previous_position:
+                    return mean
+                fraction = (target - previous_position) / (position - previous_position)
+                return previous_mean + (mean - previous_mean) * fraction
+            cumulative += weight
+            previous_position, previous_mean = position, mean
+        if self._count == previous_position:
+            return self._max
+        fraction = (target - previous_position) / (self._count - previous_position)
+        return previous_mean + (self._max - previous_mean) * fraction
+
+
+class SalaryStats:
+    """
+    Статистика зарплат, вычисляемая за один проход: количество, среднее, минимум, максимум,
+    приближённые квантили (t-digest) и гистограмма с фиксированными корзинами.
+    Статистики по разным частям данных (шардам, запросам) можно объединять через merge().
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self._buckets = buckets
+        self.histogram = [0] * len(buckets)
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.skipped = 0  # Вакансии без числовой зарплаты
+        self._digest = TDigest()
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.total / self.count if self.count else None
+
+    def add(self, salary: float) -> None:
+        """Добавляет одну зарплату."""
+        self.count += 1
+        self.total += salary
+        self.min = salary if self.min is None else min(self.min, salary)
+        self.max = salary if self.max is None else max(self.max, salary)
+        self.histogram[max(0, bisect_right(self._buckets, salary) - 1)] += 1
+        self._digest.add(salary)
+
+    def add_vacancy(self, vacancy: Dict[str, Any]) -> None:
+        """Добавляет зарплату вакансии; вакансии без числовой зарплаты учитываются в skipped."""
+        salary = salary_value(vacancy)
+        if salary is None:
+            self.skipped += 1
+        else:
+            self.add(salary)
+
+    def merge(self, other: "SalaryStats") -> "SalaryStats":
+        """
+        Объединяет статистику с другой (например, полученной по другому шарду).
+        :param other: Статистика с теми же корзинами гистограммы.
+        :return: Эта же статистика (для цепочек вызовов).
+        """
+        if other._buckets != self._buckets:
+            raise ValueError("Нельзя объединить статистику с разными корзинами гистограммы.")
+        self.count += other.count
+        self.total += other.total
+        self.skipped += other.skipped
+        self.histogram = [a + b for a, b in zip(self.histogram, other.histogram)]
+        for value in (other.min, other.max):
+            if value is not None:
+                self.min = value if self.min is None else min(self.min, value)
+                self.max = value if self.max is None else max(self.max, value)
+        self._digest.merge(other._digest)
+        return self
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Возвращает приближённый квантиль зарплаты."""
+        return self._digest.quantile(q)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Возвращает статистику в виде словаря."""
+        bounds = list(self._buckets[1:]) + [math.inf]
+        return {
+            "count": self.count,
+            "skipped": self.skipped,
+            "mean": self.mean,
+            "min": self.min,
+            "max": self.max,
+            "p25": self.quantile(0.25),
+            "p50": self.quantile(0.5),
+            "p75": self.quantile(0.75),
+            "p90": self.quantile(0.9),
+            "histogram": [
+                {"from": low, "to": high, "count": count}
+                for low, high, count in zip(self._buckets, bounds, self.histogram)
+            ],
+        }
+
+    def format(self, width: int = 40) -> str:
+        """Возвращает текстовый отчёт со статистикой и гистограммой."""
+        if not self.count:
+            return f"Вакансий с указанной зарплатой нет (без зарплаты: {self.skipped})."
+        data = self.to_dict()
+        lines = [
+            f"Вакансий с зарплатой: {self.count} (без зарплаты: {self.skipped})",
+            f"Средняя: {data['mean']:.0f} руб., минимум: {self.min:.0f}, максимум: {self.max:.0f}",
+            f"Квантили: 25% — {data['p25']:.0f}, медиана — {data['p50']:.0f}, "
+            f"75% — {data['p75']:.0f}, 90% — {data['p90']:.0f}",
+        ]
+        largest = max(self.histogram)
+        for bucket in data["histogram"]:
+            if math.isinf(bucket["to"]):
+                label = f"{bucket['from']:.0f}+"
+            else:
+                label = f"{bucket['from']:.0f}-{bucket['to']:.0f}"
+            bar = "#" * (bucket["count"] * width // largest if largest else 0)
+            lines.append(f"{label:>15} | {bar} {bucket['count']}")
+        return "\n".join(lines)
+
+
+def salary_stats(vacancies: Iterable[Dict[str, Any]]) -> SalaryStats:
+    """
+    Считает статистику зарплат за один проход по вакансиям.
+    :param vacancies: Любой итерируемый набор вакансий (FileHandler.iter_vacancies(), результат get_vacancies).
+    :return: Статистика зарплат.
+    """
+    stats = SalaryStats()
+    for vacancy in vacancies:
+        stats.add_vacancy(vacancy)
+    return stats
+
+
+def salary_stats_by_keyword(vacancies: Iterable[Dict[str, Any]], keywords: List[str]) -> Dict[str, SalaryStats]:
+    """
+    Считает статистику зарплат отдельно для каждого ключевого слова за один проход.
+    :param vacancies: Итерируемый набор вакансий.
+    :param keywords: Ключевые слова.
+    :return: Словарь «ключевое слово — статистика».
+    """
+    stats = {keyword: SalaryStats() for keyword in keywords}
+    for vacancy in vacancies:
+        for keyword, keyword_stats in stats.items():
+            if matches_keywords(vacancy, [keyword]):
+                keyword_stats.add_vacancy(vacancy)
+    return stats
@@ -0,0 +1,315 @@
+import json
+import os
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.file_handler import INTERNAL_FIELDS, FileHandler, write_temp_json
+from src.helpers import matches_keywords, matches_salary
+
+
+def _version_key(version: Any) -> Any:
+    """Приводит метку состояния хранилища (FileHandler.version) к виду, в котором она хранится в JSON."""
+    return json.loads(json.dumps(version))
+
+
+class SavedSearch:
+    """
+    Сохранённый поиск: условия (ключевые слова и диапазон зарплат) и ссылки найденных вакансий.
+    В файле хранятся только ссылки и метка состояния хранилища, по которому они вычислены;
+    сами вакансии держатся в памяти после первого открытия поиска.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        keywords: List[str],
+        salary_range: Optional[Tuple[float, float]] = None,
+        links: Optional[List[str]] = None,
+        new_links: Optional[List[str]] = None,
+        store_version: Any = None,
+    ) -> None:
+        self.name = name
+        self.keywords = keywords
+        self.salary_range = salary_range
+        self.links = links or []
+        # Ссылки вакансий, появившихся в результате после последнего просмотра
+        self.new_links = set(new_links or [])
+        # Метка хранилища (FileHandler.version), которой соответствуют ссылки; None — неизвестна
+        self.store_version = store_version
+        # Вакансии результата по ссылкам; заполняются полным проходом по хранилищу (refresh)
+        self._records: Dict[str, Dict[str, Any]] = {}
+        self._resolved = False
+
+    @property
+    def new_count(self) -> int:
+        return len(self.new_links)
+
+    @property
+    def resolved(self) -> bool:
+        """True, если вакансии результата загружены в память."""
+        return self._resolved
+
+    @property
+    def results(self) -> List[Dict[str, Any]]:
+        """Вакансии результата в порядке добавления (только загруженные в память)."""
+        return [self._records[link] for link in self.links if link in self._records]
+
+    def matches(self, vacancy: Dict[str, Any]) -> bool:
+        """Проверяет, подходит ли вакансия под условия поиска."""
+        if self.salary_range is not None and not matches_salary(vacancy, self.salary_range):
+            return False
+        return matches_keywords(vacancy, self.keywords)
+
+    @staticmethod
+    def _record(vacancy: Dict[str, Any]) -> Dict[str, Any]:
+        return {k: v for k, v in vacancy.items() if k not in INTERNAL_FIELDS}
+
+    def add(self, vacancies: Iterable[Dict[str, Any]]) -> bool:
+        """
+        Добавляет в результат подходящие вакансии из добавленных в хранилище.
+        :return: True, если результат изменился.
+        """
+        links = set(self.links)
+        changed = False
+        for vacancy in vacancies:
+            link = vacancy.get("link", "")
+            if link not in links and self.matches(vacancy):
+                self.links.append(link)
+                self._records[link] = self._record(vacancy)
+                self.new_links.add(link)
+                links.add(link)
+                changed = True
+        return changed
+
+    def remove(self, vacancies: List[Dict[str, Any]]) -> bool:
+        """
+        Убирает из результата удалённые из хранилища вакансии.
+        :return: True, если результат изменился.
+        """
+        links = {vacancy.get("link", "") for vacancy in vacancies}
+        remaining = [link for link in self.links if link not in links]
+        if len(remaining) == len(self.links):
+            return False
+        self.links = remaining
+        for link in links:
+            self._records.pop(link, None)
+        self.new_links -= links
+        return True
+
+    def refresh(self, vacancies: List[Dict[str, Any]], store_version: Any) -> None:
+        """
+        Заменяет результат вакансиями, найденными полным проходом по хранилищу.
+        Вакансии, которых не было в прежнем результате, считаются новыми.
+        :param vacancies: Все подходящие вакансии хранилища.
+        :param store_version: Метка хранилища, по которому выполнен проход.
+        """
+        previous = set(self.links)
+        self._records = {}
+        for vacancy in vacancies:
+            self._records.setdefault(vacancy.get("link", ""), self._record(vacancy))
+        self.links = list(self._records)
+        self.new_links = (self.new_links | (set(self.links) - previous)) & set(self.links)
+        self.store_version = store_version
+        self._resolved = True
+
+    def describe(self) -> str:
+        """Возвращает краткое описание поиска для меню."""
+        conditions = [f"ключевые слова: {' '.join(self.keywords)}" if self.keywords else "любые ключевые слова"]
+        if self.salary_range is not None:
+            min_salary, max_salary = self.salary_range
+            upper = f"-{max_salary:.0f}" if max_salary != float("inf") else " и выше"
+            conditions.append(f"зарплата {min_salary:.0f}{upper}")
+        new = f", новых: {self.new_count}" if self.new_count else ""
+        return f"«{self.name}» ({'; '.join(conditions)}): вакансий {len(self.links)}{new}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        salary_range = None
+        if self.salary_range is not None:
+            # Бесконечность не входит в стандарт JSON, поэтому открытая верхняя граница хранится как null
+            min_salary, max_salary = self.salary_range
+            salary_range = [min_salary, None if max_salary == float("inf") else max_salary]
+        return {
+            "keywords": self.keywords,
+            "salary_range": salary_range,
+            "links": self.links,
+            "new_links": sorted(self.new_links),
+            "store_version": self.store_version,
+        }
+
+    @classmethod
+    def from_dict(cls, name: str, data: Dict[str, Any]) -> "SavedSearch":
+        salary_range = data.get("salary_range")
+        if salary_range is not None:
+            min_salary, max_salary = salary_range
+            salary_range = (min_salary, float("inf") if max_salary is None else max_salary)
+        links = data.get("links")
+        if links is None:
+            # Файл прежней версии хранил вакансии целиком; метки хранилища в нём нет, поэтому поиск пересчитается
+            links = [vacancy.get("link", "") for vacancy in data.get("results") or []]
+        return cls(
+            name, data.get("keywords", []), salary_range, links, data.get("new_links"), data.get("store_version")
+        )
+
+
+class SavedSearchManager:
+    """
+    Набор сохранённых поисков над хранилищем вакансий.
+    Файл поисков читается при первом обращении, поэтому создание менеджера не замедляет запуск программы.
+    Менеджер подписывается на изменения хранилища (FileHandler.subscribe) и при добавлении или удалении
+    вакансий проверяет только изменённые вакансии. Изменения, о которых хранилище не сообщило (запись другим
+    процессом, ShardedJSONFileHandler.rebalance, прямой вызов _save_data), обнаруживаются по метке
+    FileHandler.version(): если она не совпадает с меткой поиска, результат пересчитывается полным проходом.
+    """
+
+    def __init__(self, file_handler: FileHandler, filename: str = "data/saved_searches.json") -> None:
+        self._file_handler = file_handler
+        self._filename = filename
+        # Изменения хранилища приходят и из фонового потока загрузки
+        self._lock = threading.RLock()
+        self._searches: Optional[Dict[str, SavedSearch]] = None  # Загружаются при первом обращении
+        # Метка хранилища после последнего изменения, которое менеджер учёл сам
+        self._store_version: Any = None
+        file_handler.subscribe(self._on_change)
+
+    def _load(self) -> Dict[str, SavedSearch]:
+        try:
+            with open(self._filename, "r", encoding="utf-8") as file:
+                data = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        return {name: SavedSearch.from_dict(name, search) for name, search in data.items()}
+
+    def _all(self) -> Dict[str, SavedSearch]:
+        """Возвращает поиски, при первом обращении читая их из файла."""
+        if self._searches is None:
+            self._searches = self._load()
+        return self._searches
+
+    def _save(self) -> None:
+        """Сохраняет поиски во временный файл, который затем атомарно заменяет исходный."""
+        directory = os.path.dirname(os.path.abspath(self._filename))
+        os.makedirs(directory, exist_ok=True)
+        data = {name: search.to_dict() for name, search in self._all().items()}
+        os.replace(write_temp_json(directory, data), self._filename)
+
+    def _current_version(self) -> Any:
+        version = self._file_handler.version()
+        return None if version is None else _version_key(version)
+
+    def _sync(self, searches: List[SavedSearch], resolve: bool = False) -> None:
+        """
+        Пересчитывает одним проходом по хранилищу поиски, чья метка не совпадает с текущей меткой хранилища.
+        :param searches: Проверяемые поиски.
+        :param resolve: Пересчитать и поиски, вакансии которых ещё не загружены в память.
+        """
+        version = self._current_version()
+        stale = [
+            search
+            for search in searches
+            if version is None or search.store_version != version or (resolve and not search.resolved)
+        ]
+        # Метка запоминается и тогда, когда пересчитывать нечего: иначе после перезапуска _on_change
+        # считал бы все поиски отставшими и следующее изменение хранилища вызвало бы полный проход
+        self._store_version = version
+        if not stale:
+            return
+        found: Dict[str, List[Dict[str, Any]]] = {search.name: [] for search in stale}
+        for vacancy in self._file_handler.iter_vacancies():
+            for search in stale:
+                if search.matches(vacancy):
+                    found[search.name].append(vacancy)
+        for search in stale:
+            search.refresh(found[search.name], version)
+        self._save()
+
+    def _on_change(self, event: str, vacancies: List[Dict[str, Any]]) -> None:
+        with self._lock:
+            if self._searches is None:
+                return  # Поиски ещё не загружены: при загрузке они сверятся с хранилищем по метке
+            version = self._current_version()
+            changed = False
+            for search in self._searches.values():
+                # Поиск, отставший от хранилища, дополнять бессмысленно: он пересчитается при обращении
+                if search.store_version is None or search.store_version != self._store_version:
+                    continue
+                if event == FileHandler.ADDED:
+                    changed = search.add(vacancies) or changed
+                elif event == FileHandler.DELETED:
+                    changed = search.remove(vacancies) or changed
+                search.store_version = version
+            self._store_version = version
+            if changed:
+                self._save()
+
+    def close(self) -> None:
+        """Отписывается от изменений хранилища."""
+        self._file_handler.unsubscribe(self._on_change)
+
+    def searches(self) -> List[SavedSearch]:
+        """Возвращает сохранённые поиски в порядке создания, сверив их с хранилищем."""
+        with self._lock:
+            searches = list(self._all().values())
+            self._sync(searches)
+            return searches
+
+    def get(self, name: str) -> Optional[SavedSearch]:
+        with self._lock:
+            search = self._all().get(name)
+            if search is not None:
+                self._sync([search])
+            return search
+
+    def create(
+        self, name: str, keywords: List[str], salary_range: Optional[Tuple[float, float]] = None
+    ) -> SavedSearch:
+        """
+        Сохраняет поиск и один раз вычисляет его результат полным проходом по хранилищу.
+        Поиск с тем же именем заменяется.
+        :param name: Имя поиска.
+        :param keywords: Ключевые слова.
+        :param salary_range: Диапазон зарплат (None — любой).
+        :return: Сохранённый поиск.
+        :raises ValueError: Если имя пустое.
+        """
+        if not name:
+            raise ValueError("Имя поиска не может быть пустым.")
+        search = SavedSearch(name, keywords, salary_range)
+        with self._lock:
+            version = self._current_version()
+            found = [vacancy for vacancy in self._file_handler.iter_vacancies() if search.matches(vacancy)]
+            search.refresh(found, version)
+            search.new_links.clear()  # Всё, что найдено при создании, считается просмотренным
+            self._all()[name] = search
+            self._store_version = version
+            self._save()
+        return search
+
+    def delete(self, name: str) -> bool:
+        """Удаляет сохранённый поиск; возвращает False, если поиска с таким именем нет."""
+        with self._lock:
+            if self._all().pop(name, None) is None:
+                return False
+            self._save()
+            return True
+
+    def open(self, name: str) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Открывает сохранённый поиск и отмечает результат просмотренным.
+        Хранилище читается, только если оно изменилось без уведомления или вакансии поиска ещё не в памяти.
+        В файле поисков хранятся только ссылки, чтобы он не рос вместе с результатами и не замедлял запуск,
+        поэтому первое открытие поиска в процессе проходит по хранилищу один раз (потоково, через
+        iter_vacancies); следующие открытия берут вакансии из памяти.
+        :param name: Имя поиска.
+        :return: Кортеж (вакансии, сколько из них новых с прошлого просмотра).
+        :raises KeyError: Если поиска с таким именем нет.
+        """
+        with self._lock:
+            search = self._all()[name]
+            self._sync([search], resolve=True)
+            new_count = search.new_count
+            if new_count:
+                search.new_links.clear()
+                self._save()
+            return search.results, new_count
@@ -0,0 +1,279 @@
+import json
+import math
+import threading
+import time
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socket import socket
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from src.file_handler import INTERNAL_FIELDS, FileHandler
+from src.helpers import clean_html
+from src.metrics import increment
+from src.query import Query, VacancyIndex
+from src.tokenizer import token_string
+
+# Границы корзин гистограммы задержек в миллисекундах
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+
+class LatencyHistogram:
+    """Потокобезопасная гистограмма задержек с фиксированными корзинами."""
+
+    def __init__(self, buckets_ms: Tuple[float, ...] = LATENCY_BUCKETS_MS) -> None:
+        self._buckets_ms = buckets_ms
+        self._counts = [0] * (len(buckets_ms) + 1)  # Последняя корзина — всё, что больше верхней границы
+        self._count = 0
+        self._total_ms = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        """Добавляет одно измерение задержки в секундах."""
+        milliseconds = seconds * 1000
+        with self._lock:
+            self._counts[bisect_left(self._buckets_ms, milliseconds)] += 1
+            self._count += 1
+            self._total_ms += milliseconds
+
+    def quantile(self, q: float) -> float:
+        """
+        Оценивает квантиль задержки по корзинам (верхняя граница корзины, в которую он попадает).
+        :param q: Квантиль от 0 до 1.
+        :return: Оценка в миллисекундах (inf, если значение больше верхней границы).
+        """
+        with self._lock:
+            rank = q * self._count
+            seen = 0
+            for bound, count in zip(self._buckets_ms + (float("inf"),), self._counts):
+                seen += count
+                if count and seen >= rank:
+                    return float(bound)
+        return 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Возвращает состояние гистограммы в виде словаря для JSON-ответа."""
+        with self._lock:
+            buckets = {f"le_{bound}ms": count for bound, count in zip(self._buckets_ms, self._counts)}
+            buckets["le_inf"] = self._counts[-1]
+            count, total_ms = self._count, self._total_ms
+        return {
+            "count": count,
+            "mean_ms": round(total_ms / count, 3) if count else 0.0,
+            "p50_ms": self.quantile(0.5),
+            "p95_ms": self.quantile(0.95),
+            "p99_ms": self.quantile(0.99),
+            "buckets": buckets,
+        }
+
+
+class VacancyService:
+    """
+    Сервис запросов к хранилищу вакансий.
+    Хранилище читается один раз, индекс по зарплате строится заранее, поэтому запросы не перечитывают файл.
+    Сервис подписан на изменения хранилища: добавленные вакансии вливаются в индекс без повторного чтения,
+    а после удаления индекс строится заново. Индекс заменяется целиком, и читатели работают без блокировки.
+    """
+
+    def __init__(self, file_handler: FileHandler) -> None:
+        self._file_handler = file_handler
+        self._write_lock = threading.Lock()
+        self._index = self._build_index()
+        file_handler.subscribe(self._on_change)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    @staticmethod
+    def _with_tokens(vacancy: Dict[str, Any]) -> Dict[str, Any]:
+        """Дополняет вакансию основами слов, если их нет (старые записи); основы считаются один раз здесь."""
+        if not isinstance(vacancy.get("tokens"), str):
+            vacancy["tokens"] = token_string(clean_html(vacancy.get("description") or "Описание отсутствует"))
+        return vacancy
+
+    def _build_index(self) -> VacancyIndex:
+        """Читает хранилище и строит индекс."""
+        return VacancyIndex(self._with_tokens(vacancy) for vacancy in self._file_handler.iter_vacancies())
+
+    def _on_change(self, event: str, vacancies: List[Dict[str, Any]]) -> None:
+        if event == FileHandler.ADDED:
+            self._index = self._index.extended(self._with_tokens(vacancy) for vacancy in vacancies)
+        else:
+            self._index = self._build_index()
+
+    def search(
+        self, keywords: List[str], salary_range: Optional[Tuple[float, float]] = None, top: Optional[int] = None
+    ) -> Tuple[List[Dict[str, Any]], str]:
+        """
+        Выполняет запрос к индексу.
+        :param keywords: Ключевые слова.
+        :param salary_range: Диапазон зарплат или None.
+        :param top: Число вакансий с наибольшей зарплатой или None — все подходящие.
+        :return: Кортеж (вакансии, описание плана запроса).
+        """
+        query = Query().keywords(*keywords)
+        if salary_range is not None:
+            query.salary(*salary_range)
+        if top is not None:
+            query.order_by("salary").limit(top)
+        index = self._index
+        result = [{k: v for k, v in vacancy.items() if k not in INTERNAL_FIELDS} for vacancy in query.execute(index)]
+        return result, query.explain(index)
+
+    def ingest(self, vacancies: List[Dict[str, Any]]) -> int:
+        """
+        Добавляет вакансии в хранилище; индекс дополняется добавленными вакансиями через подписку на изменения.
+        :param vacancies: Список словарей с данными о вакансиях.
+        :return: Количество добавленных вакансий.
+        """
+        with self._write_lock:
+            return self._file_handler.add_vacancies(vacancies)
+
+
+class PooledHTTPServer(HTTPServer):
+    """HTTP-сервер, обрабатывающий запросы в пуле потоков фиксированного размера."""
+
+    def __init__(self, server_address: Tuple[str, int], service: VacancyService, workers: int = 8) -> None:
+        super().__init__(server_address, VacancyRequestHandler)
+        self.service = service
+        self.latency: Dict[str, LatencyHistogram] = {}
+        self._latency_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="vacancy-http")
+
+    def histogram(self, endpoint: str) -> LatencyHistogram:
+        """Возвращает гистограмму задержек для эндпоинта, создавая её при первом обращении."""
+        with self._latency_lock:
+            return self.latency.setdefault(endpoint, LatencyHistogram())
+
+    def process_request(self, request: Any, client_address: Any) -> None:
+        self._executor.submit(self._process_request_in_pool, request, client_address)
+
+    def _process_request_in_pool(self, request: socket, client_address: Any) -> None:
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self._executor.shutdown(wait=True)
+
+
+class VacancyRequestHandler(BaseHTTPRequestHandler):
+    """
+    Обработчик JSON API:
+    GET  /health — состояние сервиса;
+    GET  /vacancies?keywords=python+django&salary_min=100000&salary_max=200000&top=10 — поиск;
+    GET  /metrics — гистограммы задержек по эндпоинтам;
+    POST /vacancies — добавление списка вакансий.
+    """
+
+    server: PooledHTTPServer
+
+    ROUTES = {
+        ("GET", "/health"): "_get_health",
+        ("GET", "/metrics"): "_get_metrics",
+        ("GET", "/vacancies"): "_get_vacancies",
+        ("POST", "/vacancies"): "_post_vacancies",
+    }
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Отключает вывод каждого запроса в консоль: задержки собираются в гистограммах."""
+
+    def _send_json(self, status: int, payload: Any) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _timed(self, method: str) -> None:
+        started = time.perf_counter()
+        path = urlparse(self.path).path.rstrip("/") or "/"
+        handler_name = self.ROUTES.get((method, path))
+        try:
+            if handler_name is None:
+                self._send_json(404, {"error": f"Неизвестный адрес: {method} {path}"})
+            else:
+                getattr(self, handler_name)()
+        except ValueError as e:
+            self._send_json(400, {"error": str(e)})
+        except Exception:
+            # Любая другая ошибка — ответ 500, а не закрытое без ответа соединение
+            increment("service.errors")
+            self._send_json(500, {"error": "Внутренняя ошибка сервера."})
+        finally:
+            # Неизвестные адреса собираются в одну гистограмму, чтобы их число не росло бесконечно
+            endpoint = f"{method} {path}" if handler_name else "unknown"
+            self.server.histogram(endpoint).record(time.perf_counter() - started)
+
+    def do_GET(self) -> None:
+        self._timed("GET")
+
+    def do_POST(self) -> None:
+        self._timed("POST")
+
+    def _get_health(self) -> None:
+        self._send_json(200, {"status": "ok", "vacancies": len(self.server.service)})
+
+    def _get_metrics(self) -> None:
+        self._send_json(200, {endpoint: h.to_dict() for endpoint, h in sorted(self.server.latency.items())})
+
+    def _get_vacancies(self) -> None:
+        params = parse_qs(urlparse(self.path).query)
+
+        def number(name: str) -> Optional[float]:
+            values = params.get(name)
+            if not values:
+                return None
+            try:
+                value = float(values[0])
+            except ValueError:
+                value = math.nan
+            if not math.isfinite(value) or value < 0:
+                raise ValueError(f"Параметр '{name}' должен быть неотрицательным числом.")
+            return value
+
+        keywords = [word for value in params.get("keywords", []) for word in value.split()]
+        salary_min, salary_max = number("salary_min"), number("salary_max")
+        salary_range = None
+        if salary_min is not None or salary_max is not None:
+            salary_range = (salary_min or 0.0, salary_max if salary_max is not None else float("inf"))
+        top = number("top")
+        if top is not None and not top.is_integer():
+            raise ValueError("Параметр 'top' должен быть целым числом.")
+
+        vacancies, plan = self.server.service.search(keywords, salary_range, int(top) if top is not None else None)
+        self._send_json(200, {"count": len(vacancies), "plan": plan, "items": vacancies})
+
+    def _post_vacancies(self) -> None:
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            payload = json.loads(self.rfile.read(length) or b"null")
+        except json.JSONDecodeError:
+            raise ValueError("Тело запроса должно быть JSON-списком вакансий.")
+        if not isinstance(payload, list) or not all(isinstance(item, dict) for item in payload):
+            raise ValueError("Тело запроса должно быть JSON-списком вакансий.")
+        for item in payload:
+            for field in ("title", "link", "description"):
+                if not isinstance(item.get(field), str):
+                    raise ValueError(f"Поле '{field}' каждой вакансии должно быть строкой.")
+        self._send_json(200, {"added": self.server.service.ingest(payload)})
+
+
+def create_server(
+    file_handler: FileHandler, host: str = "127.0.0.1", port: int = 8000, workers: int = 8
+) -> PooledHTTPServer:
+    """
+    Создаёт HTTP-сервер над хранилищем вакансий (хранилище читается один раз при создании).
+    :param file_handler: Хранилище вакансий.
+    :param host: Адрес для прослушивания.
+    :param port: Порт (0 — выбрать свободный).
+    :param workers: Размер пула потоков-обработчиков.
+    :return: Сервер, готовый к вызову serve_forever().
+    """
+    return PooledHTTPServer((host, port), VacancyService(file_handler), workers)
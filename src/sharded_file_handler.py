@@ -0,0 +1,225 @@
+import argparse
+import os
+import threading
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from src.file_handler import FileHandler, JSONFileHandler, select_new_vacancies, write_temp_json
+
+SHARD_FILE_PATTERN = "shard_*.json"
+
+
+def default_shard_count() -> int:
+    """Возвращает число шардов по умолчанию — по количеству ядер процессора."""
+    return os.cpu_count() or 1
+
+
+def shard_index(link: str, shard_count: int) -> int:
+    """
+    Определяет номер шарда для вакансии по хешу ссылки.
+    Используется crc32, а не встроенный hash(), чтобы распределение не менялось между запусками.
+    :param link: Ссылка на вакансию.
+    :param shard_count: Количество шардов.
+    :return: Номер шарда от 0 до shard_count - 1.
+    """
+    return zlib.crc32(link.encode("utf-8")) % shard_count
+
+
+def _filter_shard_by_keywords(filename: str, filter_words: List[str]) -> List[Dict[str, Any]]:
+    """Фильтрует один шард по ключевым словам (выполняется в дочернем процессе)."""
+    return JSONFileHandler(filename).filter_vacancies(filter_words)
+
+
+def _filter_shard_by_salary(filename: str, salary_range: Tuple[float, float]) -> List[Dict[str, Any]]:
+    """Фильтрует один шард по диапазону зарплат (выполняется в дочернем процессе)."""
+    return JSONFileHandler(filename).filter_vacancies_by_salary(salary_range)
+
+
+class ShardedJSONFileHandler(FileHandler):
+    """
+    Класс для работы с хранилищем вакансий, разбитым на несколько JSON-файлов (шардов).
+    Вакансия попадает в шард по хешу ссылки, фильтрация шардов выполняется параллельно
+    в пуле процессов, а результаты объединяются в порядке номеров шардов.
+    Пул процессов создаётся при первом запросе и используется повторно; закрывается он методом close().
+    """
+
+    def __init__(self, directory: str = "data/shards", shard_count: Optional[int] = None) -> None:
+        super().__init__()
+        self._lock = threading.RLock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        existing_count = len(list(self._directory.glob(SHARD_FILE_PATTERN)))
+        # Уже созданное хранилище сохраняет своё число шардов; изменить его можно через rebalance()
+        self._shard_count = existing_count or shard_count or default_shard_count()
+        self._shards = self._open_shards()
+
+    @property
+    def shard_count(self) -> int:
+        return self._shard_count
+
+    def _open_shards(self) -> List[JSONFileHandler]:
+        """Создаёт обработчики шардов; изменения в шардах передаются подписчикам всего хранилища."""
+        shards = [JSONFileHandler(self._shard_filename(i)) for i in range(self._shard_count)]
+        for shard in shards:
+            shard.subscribe(self._notify)
+        return shards
+
+    def version(self) -> Optional[Tuple[Any, ...]]:
+        """Метка хранилища — метки всех шардов."""
+        return tuple(shard.version() for shard in self._shards)
+
+    def _shard_filename(self, index: int) -> str:
+        return str(self._directory / f"shard_{index:03d}.json")
+
+    def _shard_for(self, vacancy_data: Dict[str, Any]) -> JSONFileHandler:
+        return self._shards[shard_index(str(vacancy_data.get("link", "")), self._shard_count)]
+
+    def _run_on_shards(self, worker: Callable[..., List[Dict[str, Any]]], argument: Any) -> List[Dict[str, Any]]:
+        """
+        Запускает функцию фильтрации на всех шардах и объединяет результаты.
+        executor.map возвращает результаты в порядке шардов, поэтому порядок стабилен
+        независимо от того, какой процесс завершился первым. При одном шарде или одном ядре
+        шарды фильтруются в текущем процессе: пул дал бы только накладные расходы.
+        """
+        filenames = [self._shard_filename(i) for i in range(self._shard_count)]
+        if self._shard_count == 1 or default_shard_count() == 1:
+            return [vacancy for filename in filenames for vacancy in worker(filename, argument)]
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=min(self._shard_count, default_shard_count()))
+        result: List[Dict[str, Any]] = []
+        for shard_result in self._executor.map(worker, filenames, [argument] * self._shard_count):
+            result.extend(shard_result)
+        return result
+
+    def close(self) -> None:
+        """Останавливает пул процессов фильтрации."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def iter_vacancies(self) -> Iterator[Dict[str, Any]]:
+        """Последовательно возвращает вакансии всех шардов, читая каждый шард потоково."""
+        for shard in self._shards:
+            yield from shard.iter_vacancies()
+
+    def add_vacancy(self, vacancy_data: Dict[str, Any]) -> None:
+        """Добавляет вакансию в шард, соответствующий её ссылке."""
+        self._shard_for(vacancy_data).add_vacancy(vacancy_data)
+
+    def add_vacancies(
+        self, vacancies: List[Dict[str, Any]], near_duplicates: str = "group", threshold: float = 0.8
+    ) -> int:
+        """
+        Добавляет несколько вакансий: каждый шард читается и записывается не больше одного раза.
+        Почти одинаковые вакансии ищутся по всему хранилищу, а не внутри шарда: у повторной публикации
+        другая ссылка, поэтому она обычно попадает в другой шард.
+        :param vacancies: Список словарей с данными о вакансиях.
+        :param near_duplicates: Что делать с почти одинаковыми вакансиями: "group", "skip" или "keep".
+        :param threshold: Порог сходства, начиная с которого вакансии считаются почти одинаковыми.
+        :return: Количество добавленных вакансий.
+        """
+        for vacancy_data in vacancies:
+            JSONFileHandler._prepare_vacancy(vacancy_data)
+
+        with self._lock:
+            shard_data = [shard._load_data() for shard in self._shards]
+            existing = [vacancy for data in shard_data for vacancy in data]
+            detector = self._near_duplicate_detector(existing, near_duplicates, threshold)
+            selected = select_new_vacancies(existing, vacancies, near_duplicates, threshold, detector)
+            changed = set()
+            for vacancy_data in selected:
+                index = shard_index(vacancy_data["link"], self._shard_count)
+                shard_data[index].append(vacancy_data)
+                changed.add(index)
+            for index in sorted(changed):
+                self._shards[index]._save_data(shard_data[index])
+            self._remember_detector_version()
+            self._notify(self.ADDED, selected)
+            return len(selected)
+
+    def delete_vacancy(self, vacancy_id: int) -> None:
+        """Удаляет вакансию по ID из всех шардов."""
+        removed: List[Dict[str, Any]] = []
+        with self._lock:
+            for shard in self._shards:
+                data = shard._load_data()
+                remaining = [v for v in data if v.get("id") != vacancy_id]
+                if len(remaining) != len(data):
+                    shard._save_data(remaining)
+                    removed.extend(v for v in data if v.get("id") == vacancy_id)
+            self._notify(self.DELETED, removed)
+        print(f"Вакансия с ID {vacancy_id} удалена.")
+
+    def filter_vacancies(self, filter_words: List[str]) -> List[Dict[str, Any]]:
+        """
+        Фильтрует вакансии по ключевым словам во всех шардах параллельно.
+        :param filter_words: Список ключевых слов.
+        :return: Список отфильтрованных вакансий.
+        """
+        return self._run_on_shards(_filter_shard_by_keywords, filter_words)
+
+    def filter_vacancies_by_salary(self, salary_range: Tuple[float, float]) -> List[Dict[str, Any]]:
+        """
+        Фильтрует вакансии по диапазону зарплат во всех шардах параллельно.
+        :param salary_range: Кортеж (min_salary, max_salary).
+        :return: Список отфильтрованных вакансий.
+        """
+        return self._run_on_shards(_filter_shard_by_salary, salary_range)
+
+    def rebalance(self, shard_count: Optional[int] = None) -> None:
+        """
+        Перераспределяет вакансии по новому числу шардов.
+        Сначала все новые шарды записываются во временные файлы, и только затем они переносятся
+        на место старых через os.replace: ошибка при записи оставляет хранилище нетронутым.
+        Новые номера шардов переносятся раньше существующих, а лишние шарды удаляются последними,
+        поэтому и сбой во время переноса может оставить повторы, но не потерять вакансии.
+        :param shard_count: Новое число шардов (по умолчанию — по количеству ядер).
+        """
+        with self._lock:
+            data = [vacancy for shard in self._shards for vacancy in shard._load_data()]
+            old_count = self._shard_count
+            new_count = shard_count or default_shard_count()
+
+            buckets: List[List[Dict[str, Any]]] = [[] for _ in range(new_count)]
+            for vacancy in data:
+                buckets[shard_index(str(vacancy.get("link", "")), new_count)].append(vacancy)
+            temp_files: List[str] = []
+            try:
+                for bucket in buckets:
+                    temp_files.append(write_temp_json(str(self._directory), bucket))
+            except BaseException:
+                for temp_file in temp_files:
+                    os.remove(temp_file)
+                raise
+
+            order = sorted(range(new_count), key=lambda index: (index < old_count, index))
+            for index in order:
+                os.replace(temp_files[index], self._shard_filename(index))
+            for index in range(new_count, old_count):
+                os.remove(self._shard_filename(index))
+
+            self._shard_count = new_count
+            self._shards = self._open_shards()
+            self.close()  # Размер пула зависит от числа шардов
+        print(f"Вакансии ({len(data)}) перераспределены по {self._shard_count} шардам.")
+
+
+def main() -> None:
+    """Точка входа для команды перебалансировки: python -m src.sharded_file_handler rebalance."""
+    parser = argparse.ArgumentParser(description="Управление шардированным хранилищем вакансий.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    rebalance_parser = subparsers.add_parser("rebalance", help="Перераспределить вакансии по шардам")
+    rebalance_parser.add_argument("--directory", default="data/shards", help="Каталог с шардами")
+    rebalance_parser.add_argument("--shards", type=int, default=None, help="Новое число шардов")
+    args = parser.parse_args()
+
+    if args.command == "rebalance":
+        ShardedJSONFileHandler(args.directory).rebalance(args.shards)
+
+
+if __name__ == "__main__":
+    main()
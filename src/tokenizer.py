@@ -0,0 +1,133 @@
+import re
+from functools import lru_cache
+from typing import FrozenSet, List, Optional, Tuple
+
+# Слово — буквы и цифры; для «c++», «c#» сохраняем завершающие + и #
+_TOKEN_RE = re.compile(r"[0-9a-zа-я]+[+#]*")
+_CYRILLIC_RE = re.compile(r"[а-я]")
+
+# Регулярные выражения лёгкого стеммера Портера (Snowball) для русского языка.
+# Все окончания ищутся только в области RV — части слова после первой гласной.
+_RV_RE = re.compile(r"^(.*?[аеиоуыэюя])(.*)$")
+_PERFECTIVE_GERUND_RE = re.compile(r"((ив|ивши|ившись|ыв|ывши|ывшись)|((?<=[ая])(в|вши|вшись)))$")
+_REFLEXIVE_RE = re.compile(r"(с[яь])$")
+_ADJECTIVE_RE = re.compile(r"(ее|ие|ые|ое|ими|ыми|ей|ий|ый|ой|ем|им|ым|ом|его|ого|ему|ому|их|ых|ую|юю|ая|яя|ою|ею)$")
+_PARTICIPLE_RE = re.compile(r"((ивш|ывш|ующ)|((?<=[ая])(ем|нн|вш|ющ|щ)))$")
+_VERB_RE = re.compile(
+    r"((ила|ыла|ена|ейте|уйте|ите|или|ыли|ей|уй|ил|ыл|им|ым|ен|ило|ыло|ено|ят|ует|уют|ит|ыт|ены|ить|ыть|ишь|ую|ю)"
+    r"|((?<=[ая])(ла|на|ете|йте|ли|й|л|ем|н|ло|но|ет|ют|ны|ть|ешь|нно)))$"
+)
+_NOUN_RE = re.compile(
+    r"(а|ев|ов|ие|ье|е|иями|ями|ами|еи|ии|и|ией|ей|ой|ий|й|иям|ям|ием|ем|ам|ом|о|у|ах|иях|ях|ы|ь|ию|ью|ю|ия|ья|я)$"
+)
+_I_RE = re.compile(r"и$")
+_DERIVATIONAL_RE = re.compile(r".*[^аеиоуыэюя]+[аеиоуыэюя].*ость?$")
+_DERIVATIONAL_SUFFIX_RE = re.compile(r"ость?$")
+_SUPERLATIVE_RE = re.compile(r"(ейше|ейш)$")
+_DOUBLE_N_RE = re.compile(r"нн$")
+_SOFT_SIGN_RE = re.compile(r"ь$")
+
+
+def normalize(text: str) -> str:
+    """
+    Приводит текст к единому виду для поиска: нижний регистр (casefold) и замена «ё» на «е».
+    :param text: Исходный текст.
+    :return: Нормализованный текст.
+    """
+    return text.casefold().replace("ё", "е")
+
+
+@lru_cache(maxsize=65536)
+def stem(word: str) -> str:
+    """
+    Возвращает основу русского слова (упрощённый стеммер Snowball).
+    Слова без кириллицы (python, java, c++) возвращаются без изменений.
+    Результаты кешируются, поэтому повторяющиеся слова стеммируются один раз.
+    :param word: Нормализованное слово.
+    :return: Основа слова.
+    """
+    if not _CYRILLIC_RE.search(word):
+        return word
+    match = _RV_RE.match(word)
+    if match is None:
+        return word
+    prefix, rv = match.groups()
+
+    temp = _PERFECTIVE_GERUND_RE.sub("", rv, 1)
+    if temp == rv:
+        rv = _REFLEXIVE_RE.sub("", rv, 1)
+        temp = _ADJECTIVE_RE.sub("", rv, 1)
+        if temp != rv:
+            rv = _PARTICIPLE_RE.sub("", temp, 1)
+        else:
+            temp = _VERB_RE.sub("", rv, 1)
+            rv = _NOUN_RE.sub("", rv, 1) if temp == rv else temp
+    else:
+        rv = temp
+
+    rv = _I_RE.sub("", rv, 1)
+    if _DERIVATIONAL_RE.match(rv):
+        rv = _DERIVATIONAL_SUFFIX_RE.sub("", rv, 1)
+
+    temp = _DOUBLE_N_RE.sub("н", rv, 1)
+    if temp == rv:
+        rv = _SUPERLATIVE_RE.sub("", rv, 1)
+        temp = _DOUBLE_N_RE.sub("н", rv, 1)
+        rv = _SOFT_SIGN_RE.sub("", rv, 1) if temp == rv else temp
+    else:
+        rv = temp
+
+    return prefix + rv
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """
+    Разбивает текст на основы слов.
+    :param text: Исходный текст или None.
+    :return: Список основ слов в порядке следования.
+    """
+    if not text:
+        return []
+    return [stem(token) for token in _TOKEN_RE.findall(normalize(text))]
+
+
+def token_set(text: Optional[str]) -> List[str]:
+    """
+    Возвращает отсортированный список уникальных основ слов текста.
+    :param text: Исходный текст или None.
+    :return: Отсортированный список уникальных основ.
+    """
+    return sorted(set(tokenize(text)))
+
+
+def token_string(text: Optional[str]) -> str:
+    """
+    Возвращает уникальные основы слов текста одной строкой " основа1 основа2 ".
+    Строка сохраняется вместе с вакансией при добавлении, чтобы не разбирать описание при каждом запросе:
+    в JSON она занимает одну строку, а наличие основы проверяется поиском подстроки " основа ".
+    :param text: Исходный текст или None.
+    :return: Строка основ, окружённых пробелами.
+    """
+    return f" {' '.join(token_set(text))} "
+
+
+@lru_cache(maxsize=1024)
+def query_terms(filter_words: Tuple[str, ...]) -> Tuple[FrozenSet[str], ...]:
+    """
+    Преобразует ключевые слова запроса в наборы основ.
+    Ключевое слово из нескольких слов подходит, если в тексте есть все его основы.
+    :param filter_words: Кортеж ключевых слов.
+    :return: Кортеж наборов основ (пустые ключевые слова отбрасываются).
+    """
+    terms = (frozenset(tokenize(word)) for word in filter_words)
+    return tuple(term for term in terms if term)
+
+
+@lru_cache(maxsize=1024)
+def query_patterns(filter_words: Tuple[str, ...]) -> Tuple[Tuple[str, ...], ...]:
+    """
+    Преобразует ключевые слова запроса в подстроки " основа " для поиска в строке token_string.
+    :param filter_words: Кортеж ключевых слов.
+    :return: Кортеж наборов подстрок (по одному набору на ключевое слово).
+    """
+    return tuple(tuple(f" {stem} " for stem in sorted(term)) for term in query_terms(filter_words))
@@ -1,9 +1,10 @@
 from src.file_handler import JSONFileHandler
+from src.helpers import salary_value
 
 
 def sort_vacancies(vacancies: list, reverse: bool = True) -> list:
-    """Сортировка вакансий по зарплате."""
-    return sorted(vacancies, key=lambda v: v["salary"] or 0, reverse=reverse)
+    """Сортировка вакансий по зарплате в рублях; вакансии без зарплаты считаются с зарплатой 0."""
+    return sorted(vacancies, key=lambda v: salary_value(v) or 0, reverse=reverse)
 
 
 def save_vacancy_to_file(vacancy: dict, json_saver: JSONFileHandler) -> None:
@@ -1,25 +1,53 @@
-from typing import Optional, Union
+from typing import Any, Dict, Optional, Union
 
 from src.helpers import clean_html
+from src.metrics import timed
+from src.salary import NOT_SPECIFIED, normalize_salary
 
 
 class Vacancy:
     """Класс для представления вакансии."""
 
-    __slots__ = ["_title", "_link", "_salary", "_description"]
-
-    def __init__(self, title: str, link: str, salary: Optional[Union[float, str]], description: str) -> None:
+    __slots__ = ["_title", "_link", "_salary", "_salary_from", "_salary_to", "_salary_range", "_description"]
+
+    @timed("vacancy.init")
+    def __init__(
+        self,
+        title: str,
+        link: str,
+        salary: Optional[Union[float, str]],
+        description: str,
+        salary_range: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        :param salary: Зарплата в рублях числом или строкой ("100 000-150 000 руб.").
+        :param salary_range: Зарплатная вилка из API (from, to, currency, gross); если передана,
+                             зарплата берётся из неё с переводом в рубли.
+        """
         self._title = self._validate_title(title)
         self._link = self._validate_link(link)
 
-        # Присваиваем _salary, который может быть как float, так и str
-        if salary is None:
-            self._salary: Union[float, str] = "Зарплата не указана"  # строка, если salary None
-        else:
-            self._salary = self._validate_salary(salary)  # Присваиваем значение, которое может быть float или str
+        # Зарплата разбирается один раз; _salary — число в рублях или строка, если зарплата не указана
+        normalized = normalize_salary(salary, salary_range)
+        self._salary_from = normalized["salary_from"]
+        self._salary_to = normalized["salary_to"]
+        self._salary_range = salary_range
+        salary_rub = normalized["salary_rub"]
+        self._salary: Union[float, str] = salary_rub if salary_rub is not None else NOT_SPECIFIED
 
         self._description = self._validate_description(description)
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Vacancy":
+        """Создаёт вакансию из словаря в формате API или хранилища."""
+        return cls(
+            title=data["title"],
+            link=data["link"],
+            salary=data.get("salary", NOT_SPECIFIED),
+            description=data.get("description", "Описание отсутствует"),
+            salary_range=data.get("salary_range"),
+        )
+
     @staticmethod
     def _validate_title(title: str) -> str:
         if not title:
@@ -32,29 +60,24 @@ class Vacancy:
             raise ValueError("Некорректная ссылка.")
         return link
 
-    @staticmethod
-    def _validate_salary(salary: Optional[Union[float, str]]) -> Union[float, str]:
-        if salary is None or (isinstance(salary, str) and salary.lower() == "зарплата не указана"):
-            return "Зарплата не указана"
-        if isinstance(salary, (int, float)):
-            return float(salary)  # Приводим к float
-        try:
-            return float(salary.split("-")[0].replace(" ", "").replace("руб.", ""))
-        except (ValueError, AttributeError):
-            return "Зарплата не указана"
-
     @staticmethod
     def _validate_description(description: Optional[str]) -> str:
         cleaned_description = clean_html(description or "")
         return cleaned_description if cleaned_description else "Описание отсутствует"
 
     def to_dict(self) -> dict:
-        return {
+        data: Dict[str, Any] = {
             "title": self._title,
             "link": self._link,
             "salary": self._salary,
+            "salary_from": self._salary_from,
+            "salary_to": self._salary_to,
+            "salary_rub": self._salary_from if self._salary_from is not None else self._salary_to,
             "description": self._description,
         }
+        if self._salary_range is not None:
+            data["salary_range"] = self._salary_range
+        return data
 
     @property
     def title(self) -> str:
@@ -64,6 +87,14 @@ class Vacancy:
     def salary(self) -> Union[float, str]:
         return self._salary
 
+    @property
+    def salary_from(self) -> Optional[float]:
+        return self._salary_from
+
+    @property
+    def salary_to(self) -> Optional[float]:
+        return self._salary_to
+
     def __str__(self) -> str:
         return f"{self._title}, {self._salary} руб.\n{self._description}\nСсылка: {self._link}"
 
@@ -0,0 +1,178 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List
+
+import pytest
+
+from src.aggregator import SourceReport, VacancyAggregator
+from src.api_handler import APIHandler, HeadHunterAPI, SuperJobAPI
+
+HH_RESPONSE = {
+    "items": [
+        {
+            "name": "Python Developer",
+            "alternate_url": "https://hh.ru/vacancy/1",
+            "salary": {"from": 150000, "to": 200000, "currency": "RUR", "gross": False},
+            "employer": {"name": "Acme"},
+            "snippet": {"requirement": "Опыт разработки на <highlighttext>Python</highlighttext> от 3 лет"},
+        },
+        {
+            "name": "Java Developer",
+            "alternate_url": "https://hh.ru/vacancy/2",
+            "salary": None,
+            "snippet": {"requirement": "Знание Java и Spring"},
+        },
+    ]
+}
+SUPERJOB_RESPONSE = {
+    "objects": [
+        {
+            # Та же вакансия, что и на HeadHunter, опубликованная на другой площадке
+            "profession": "Python Developer",
+            "link": "https://www.superjob.ru/vakansii/python-1.html",
+            "payment_from": 150000,
+            "payment_to": 200000,
+            "currency": "rub",
+            "firm_name": "ACME",
+            "candidat": "Опыт разработки на Python от 3 лет",
+        },
+        {
+            "profession": "Аналитик данных",
+            "link": "https://www.superjob.ru/vakansii/analitik-2.html",
+            "payment_from": 0,
+            "payment_to": 0,
+            "currency": "rub",
+            "candidat": "SQL, pandas, визуализация данных",
+        },
+    ]
+}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Локальная замена API HeadHunter и SuperJob."""
+
+    def do_GET(self) -> None:
+        if self.path.startswith("/hh"):
+            body: Dict[str, Any] = HH_RESPONSE
+        elif self.path.startswith("/superjob") and self.headers.get("X-Api-App-Id") == "test-key":
+            body = SUPERJOB_RESPONSE
+        elif self.path.startswith("/slow"):
+            time.sleep(1.0)
+            body = HH_RESPONSE
+        else:
+            self.send_response(403)
+            self.end_headers()
+            return
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture(scope="module")
+def stub_url() -> Iterator[str]:
+    """Фикстура: адрес локального тестового сервера."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+class FailingAPI(APIHandler):
+    """Источник, который всегда завершается ошибкой."""
+
+    def connect(self, url: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        raise ConnectionError("нет соединения")
+
+    def get_vacancies(self, keyword: str) -> List[Dict[str, Any]]:
+        raise RuntimeError("источник недоступен")
+
+
+def test_superjob_api(stub_url: str) -> None:
+    """Тестирует получение и нормализацию вакансий SuperJob."""
+    vacancies = SuperJobAPI(api_key="test-key", base_url=f"{stub_url}/superjob/").get_vacancies("python")
+    assert [v["title"] for v in vacancies] == ["Python Developer", "Аналитик данных"]
+    assert vacancies[0]["salary_range"] == {"from": 150000, "to": 200000, "currency": "RUR", "gross": None}
+    assert vacancies[0]["employer"] == "ACME"
+    assert vacancies[1]["salary"] == "Зарплата не указана"
+
+
+def test_superjob_api_wrong_key(stub_url: str) -> None:
+    """Тестирует, что ошибка доступа не превращается в пустой результат."""
+    with pytest.raises(ConnectionError, match="403"):
+        SuperJobAPI(api_key="wrong", base_url=f"{stub_url}/superjob/").get_vacancies("python")
+
+
+def test_superjob_availability(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Тестирует, что SuperJob доступен только при заданном ключе."""
+    monkeypatch.delenv(SuperJobAPI.API_KEY_ENV, raising=False)
+    assert not SuperJobAPI.is_available()
+    monkeypatch.setenv(SuperJobAPI.API_KEY_ENV, "key")
+    assert SuperJobAPI.is_available()
+
+
+def test_aggregator_merges_sources(stub_url: str) -> None:
+    """Тестирует объединение источников, перевод в формат Vacancy и удаление повторов между площадками."""
+    aggregator = VacancyAggregator(
+        {
+            "hh": HeadHunterAPI(base_url=f"{stub_url}/hh"),
+            "superjob": SuperJobAPI(api_key="test-key", base_url=f"{stub_url}/superjob/"),
+        }
+    )
+    vacancies = aggregator.get_vacancies("python")
+    assert [(v["source"], v["title"]) for v in vacancies] == [
+        ("hh", "Python Developer"),
+        ("hh", "Java Developer"),
+        ("superjob", "Аналитик данных"),
+    ]
+    assert vacancies[0]["description"] == "Опыт разработки на Python от 3 лет"
+    assert vacancies[0]["employer"] == "Acme"
+    assert (vacancies[0]["salary_from"], vacancies[0]["salary_to"]) == (150000, 200000)
+    assert [report.received for report in aggregator.last_reports] == [2, 2]
+
+
+def test_aggregator_timeout(stub_url: str) -> None:
+    """Тестирует, что медленный источник пропускается по таймауту и не задерживает результат."""
+    aggregator = VacancyAggregator(
+        {
+            "slow": HeadHunterAPI(base_url=f"{stub_url}/slow"),
+            "superjob": SuperJobAPI(api_key="test-key", base_url=f"{stub_url}/superjob/"),
+        },
+        timeouts={"slow": 0.2},
+    )
+    started = time.monotonic()
+    vacancies = aggregator.get_vacancies("python")
+    assert time.monotonic() - started < 0.9
+    assert [v["source"] for v in vacancies] == ["superjob", "superjob"]
+    assert [report.status for report in aggregator.last_reports] == [SourceReport.TIMEOUT, SourceReport.OK]
+
+
+def test_aggregator_failed_source(stub_url: str) -> None:
+    """Тестирует, что ошибка одного источника не мешает остальным."""
+    aggregator = VacancyAggregator({"broken": FailingAPI(), "hh": HeadHunterAPI(base_url=f"{stub_url}/hh")})
+    assert len(aggregator.get_vacancies("python")) == 2
+    assert aggregator.last_reports[0].status == SourceReport.FAILED
+    assert "источник недоступен" in str(aggregator.last_reports[0])
+
+
+def test_aggregator_reports_api_error(stub_url: str) -> None:
+    """Тестирует, что ответ API с ошибкой попадает в отчёт источника как ошибка, а не как 0 вакансий."""
+    aggregator = VacancyAggregator(
+        {
+            "hh": HeadHunterAPI(base_url=f"{stub_url}/hh"),
+            "superjob": SuperJobAPI(api_key="wrong", base_url=f"{stub_url}/superjob/"),
+        }
+    )
+    assert len(aggregator.get_vacancies("python")) == 2
+    assert [report.status for report in aggregator.last_reports] == [SourceReport.OK, SourceReport.FAILED]
+    assert "403" in str(aggregator.last_reports[1])
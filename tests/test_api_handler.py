@@ -1,10 +1,43 @@
+from typing import Any, Dict
+
 import pytest
 
-from src.api_handler import HeadHunterAPI
+from src.api_handler import API_REGISTRY, HeadHunterAPI, SuperJobAPI, create_api_handlers
+
+HH_RESPONSE = {
+    "items": [
+        {
+            "name": "Python Developer",
+            "alternate_url": "https://hh.ru/vacancy/1",
+            "salary": {"from": 150000, "to": 200000, "currency": "RUR", "gross": False},
+            "snippet": {"requirement": "Опыт работы с <highlighttext>Python</highlighttext>"},
+        },
+        {
+            "name": "Junior Developer",
+            "alternate_url": "https://hh.ru/vacancy/2",
+            "salary": None,
+            "snippet": {"requirement": None},
+        },
+    ]
+}
+
+
+class FakeResponse:
+    """Ответ requests.get с заданным статусом и телом."""
+
+    def __init__(self, status_code: int, body: Dict[str, Any]) -> None:
+        self.status_code = status_code
+        self.text = str(body)
+        self._body = body
+
+    def json(self) -> Dict[str, Any]:
+        return self._body
 
 
 @pytest.fixture
-def hh_api() -> HeadHunterAPI:
+def hh_api(monkeypatch: pytest.MonkeyPatch) -> HeadHunterAPI:
+    """Фикстура: HeadHunterAPI, который вместо сети получает HH_RESPONSE."""
+    monkeypatch.setattr("requests.get", lambda url, params, timeout: FakeResponse(200, HH_RESPONSE))
     return HeadHunterAPI()
 
 
@@ -44,3 +77,27 @@ def test_get_vacancies_without_salary(hh_api: HeadHunterAPI) -> None:
     for vacancy in vacancies:
         if vacancy["salary"] == "Зарплата не указана":
             assert isinstance(vacancy["salary"], str)
+
+
+def test_get_vacancies_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Тестирует, что ошибка API не превращается в пустой список вакансий."""
+    monkeypatch.setattr("requests.get", lambda url, params, timeout: FakeResponse(403, {"errors": []}))
+    with pytest.raises(ConnectionError, match="403"):
+        HeadHunterAPI().get_vacancies("Python")
+
+
+def test_get_salary_range() -> None:
+    """Тестирует сохранение зарплатной вилки из ответа API целиком."""
+    salary = {"from": 1000, "to": 2000, "currency": "USD", "gross": True, "extra": 1}
+    assert HeadHunterAPI._get_salary_range(salary) == {"from": 1000, "to": 2000, "currency": "USD", "gross": True}
+    assert HeadHunterAPI._get_salary_range(None) is None
+
+
+def test_api_registry(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Тестирует реестр источников: SuperJob создаётся только при заданном ключе."""
+    assert API_REGISTRY["hh"] is HeadHunterAPI
+    assert API_REGISTRY["superjob"] is SuperJobAPI
+    monkeypatch.delenv(SuperJobAPI.API_KEY_ENV, raising=False)
+    assert list(create_api_handlers()) == ["hh"]
+    monkeypatch.setenv(SuperJobAPI.API_KEY_ENV, "key")
+    assert list(create_api_handlers()) == ["hh", "superjob"]
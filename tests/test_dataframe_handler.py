@@ -0,0 +1,104 @@
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from src.file_handler import JSONFileHandler
+
+pytest.importorskip("pandas")
+
+from src.dataframe_handler import DataFrameFileHandler  # noqa: E402
+
+
+@pytest.fixture
+def records() -> List[Dict[str, Any]]:
+    """Фикстура с вакансиями в разных форматах зарплаты."""
+    return [
+        {
+            "title": "Python Developer",
+            "link": "https://example.com/1",
+            "salary": 150000,
+            "description": "Опыт разработки на Python",
+        },
+        {
+            "title": "Python Developer",
+            "link": "https://example.com/2",
+            "salary": "100 000-250 000 руб.",
+            "description": "Разработчик Python и Django",
+        },
+        {
+            "title": "Java Developer",
+            "link": "https://example.com/3",
+            "salary": "Зарплата не указана",
+            "description": "Разработчика на Java",
+        },
+        {"title": "Тестировщик", "link": "https://example.com/4", "salary": 60000, "description": "Тесты"},
+    ]
+
+
+@pytest.fixture
+def handlers(tmp_path: Path, records: List[Dict[str, Any]]) -> tuple:
+    """Фикстура: хранилища JSON и DataFrame с одинаковыми вакансиями."""
+    json_saver = JSONFileHandler(str(tmp_path / "vacancies.json"))
+    frame_saver = DataFrameFileHandler(str(tmp_path / "vacancies.pkl"))
+    json_saver.add_vacancies([dict(record) for record in records], near_duplicates="keep")
+    frame_saver.add_vacancies([dict(record) for record in records], near_duplicates="keep")
+    return json_saver, frame_saver
+
+
+def test_frame_dtypes(handlers: tuple) -> None:
+    """Тестирует типы столбцов: категориальное название и числовые зарплаты."""
+    frame = handlers[1]._load_frame()
+    assert str(frame["title"].dtype) == "category"
+    assert str(frame["salary_rub"].dtype) == "float64"
+    assert frame["salary_rub"].isna().tolist() == [False, False, True, False]
+
+
+@pytest.mark.parametrize("filter_words", [[], ["python"], ["разработчик"], ["java", "тесты"], ["go"]])
+def test_filter_vacancies_matches_json(handlers: tuple, filter_words: List[str]) -> None:
+    """Тестирует, что фильтр по ключевым словам совпадает с JSONFileHandler."""
+    json_saver, frame_saver = handlers
+    assert frame_saver.filter_vacancies(filter_words) == json_saver.filter_vacancies(filter_words)
+
+
+@pytest.mark.parametrize("salary_range", [(0, float("inf")), (200000, 300000), (50000, 70000), (300000, 400000)])
+def test_filter_by_salary_matches_json(handlers: tuple, salary_range: tuple) -> None:
+    """Тестирует, что фильтр по пересечению зарплатной вилки совпадает с JSONFileHandler."""
+    json_saver, frame_saver = handlers
+    assert frame_saver.filter_vacancies_by_salary(salary_range) == json_saver.filter_vacancies_by_salary(salary_range)
+
+
+def test_persistence(handlers: tuple, tmp_path: Path) -> None:
+    """Тестирует сохранение в файл и чтение новым экземпляром."""
+    reopened = DataFrameFileHandler(str(tmp_path / "vacancies.pkl"))
+    assert reopened.count() == 4
+    assert list(reopened.iter_vacancies()) == handlers[0].filter_vacancies([])
+
+
+def test_add_and_delete(tmp_path: Path, records: List[Dict[str, Any]]) -> None:
+    """Тестирует добавление без дубликатов и удаление по ID."""
+    frame_saver = DataFrameFileHandler(str(tmp_path / "vacancies.pkl"))
+    frame_saver.add_vacancy(dict(records[0], id=1))
+    frame_saver.add_vacancy(dict(records[0], id=1))
+    frame_saver.add_vacancy(dict(records[3], id=2))
+    assert frame_saver.count() == 2
+    assert str(frame_saver._load_frame()["title"].dtype) == "category"
+
+    frame_saver.delete_vacancy(1)
+    assert [v["id"] for v in DataFrameFileHandler(str(tmp_path / "vacancies.pkl")).iter_vacancies()] == [2]
+
+
+def test_add_vacancies_near_duplicates(tmp_path: Path, records: List[Dict[str, Any]]) -> None:
+    """Тестирует пропуск почти одинаковых вакансий при массовом добавлении."""
+    frame_saver = DataFrameFileHandler(str(tmp_path / "vacancies.pkl"))
+    assert frame_saver.add_vacancies([dict(records[0])]) == 1
+    assert frame_saver.add_vacancies([dict(records[0], link="https://example.com/copy")], near_duplicates="skip") == 0
+
+
+def test_add_vacancies_exact_duplicates(tmp_path: Path, records: List[Dict[str, Any]]) -> None:
+    """Тестирует пропуск точных дубликатов при массовом добавлении и то, что пустое хранилище истинно."""
+    frame_saver = DataFrameFileHandler(str(tmp_path / "vacancies.pkl"))
+    assert frame_saver and frame_saver.count() == 0
+    assert frame_saver.add_vacancies([dict(record) for record in records]) == 4
+    assert frame_saver.add_vacancies([dict(records[1]), dict(records[2])]) == 0
+    assert frame_saver.count() == 4
@@ -0,0 +1,60 @@
+import pytest
+
+from src.dedup import (
+    NUM_PERM,
+    NearDuplicateDetector,
+    duplicate_scope,
+    minhash_signature,
+    shingles,
+    signature_similarity,
+)
+
+TEXT = "Python разработчик в команду платформы. Опыт работы с Django, PostgreSQL и Docker от трёх лет"
+
+
+def test_shingles() -> None:
+    """Тестирует разбиение текста на пары соседних основ."""
+    assert shingles("Опыт работы с Python") == {"оп работ", "работ с", "с python"}
+    assert shingles("Python") == {"python"}
+    assert shingles("") == set()
+
+
+def test_minhash_signature() -> None:
+    """Тестирует, что сигнатура детерминирована и отражает сходство текстов."""
+    signature = minhash_signature(TEXT)
+    assert len(signature) == NUM_PERM
+    assert signature == minhash_signature(TEXT)
+    assert signature_similarity(signature, minhash_signature(TEXT + " Удалённая работа")) >= 0.7
+    assert signature_similarity(signature, minhash_signature("Повар в ресторан, график 2/2")) < 0.3
+
+
+def test_near_duplicate_detector() -> None:
+    """Тестирует поиск почти одинаковых вакансий через LSH."""
+    detector = NearDuplicateDetector(threshold=0.7)
+    detector.add("https://example.com/1", minhash_signature(TEXT))
+    detector.add("https://example.com/2", minhash_signature("Повар в ресторан, график 2/2"))
+    assert len(detector) == 2
+
+    match = detector.find(minhash_signature(TEXT + " Удалённая работа"))
+    assert match is not None
+    assert match[0] == "https://example.com/1"
+    assert detector.find(minhash_signature("Водитель погрузчика на склад")) is None
+
+
+def test_near_duplicate_detector_threshold() -> None:
+    """Тестирует проверку порога сходства."""
+    with pytest.raises(ValueError):
+        NearDuplicateDetector(threshold=0)
+
+
+def test_duplicate_scope() -> None:
+    """Тестирует, что область сравнения учитывает работодателя и зарплатную вилку."""
+    vacancy = {"title": "Python Developer", "salary": 100000, "employer": "Acme"}
+    assert duplicate_scope(vacancy) == duplicate_scope(dict(vacancy, salary=100000.0, employer="ACME"))
+    assert duplicate_scope(vacancy) != duplicate_scope(dict(vacancy, salary=250000))
+    assert duplicate_scope(vacancy) != duplicate_scope(dict(vacancy, employer="Globex"))
+
+    detector = NearDuplicateDetector()
+    detector.add("https://example.com/1", minhash_signature(TEXT), duplicate_scope(vacancy))
+    assert detector.find(minhash_signature(TEXT), duplicate_scope(vacancy)) is not None
+    assert detector.find(minhash_signature(TEXT), duplicate_scope(dict(vacancy, salary=250000))) is None
@@ -0,0 +1,86 @@
+import csv
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from src.export import EXPORT_FIELDS, export_vacancies, iter_filtered
+from src.file_handler import JSONFileHandler
+
+
+@pytest.fixture
+def json_saver(tmp_path: Path) -> JSONFileHandler:
+    """Фикстура: хранилище с вакансиями в новом и старом формате зарплаты."""
+    saver = JSONFileHandler(str(tmp_path / "vacancies.json"))
+    records: List[Dict[str, Any]] = [
+        {
+            "title": "Python Developer",
+            "link": "https://example.com/1",
+            "salary": 150000.0,
+            "salary_from": 150000.0,
+            "salary_to": 200000.0,
+            "salary_rub": 150000.0,
+            "description": "Опыт работы с Python",
+        },
+        {"title": "Java Developer", "link": "https://example.com/2", "salary": 90000, "description": "Java"},
+        {
+            "title": "Python Junior",
+            "link": "https://example.com/3",
+            "salary": "Зарплата не указана",
+            "description": "Python для начинающих",
+        },
+    ]
+    saver._save_data(records)
+    return saver
+
+
+def test_iter_vacancies_streaming(json_saver: JSONFileHandler) -> None:
+    """Тестирует потоковое чтение файла маленькими блоками: результат совпадает с полной загрузкой."""
+    for chunk_size in (1, 5, 64):
+        json_saver._read_chunk_size = chunk_size
+        assert list(json_saver.iter_vacancies()) == json_saver._load_data()
+
+
+def test_iter_vacancies_not_a_list(tmp_path: Path) -> None:
+    """Тестирует, что файл с сырым ответом API не содержит вакансий."""
+    filename = tmp_path / "raw.json"
+    filename.write_text(json.dumps({"items": []}), encoding="utf-8")
+    assert list(JSONFileHandler(str(filename)).iter_vacancies()) == []
+
+
+def test_iter_filtered(json_saver: JSONFileHandler) -> None:
+    """Тестирует отбор по ключевым словам и пересечению зарплатной вилки."""
+    assert [v["link"] for v in iter_filtered(json_saver, ["python"])] == [
+        "https://example.com/1",
+        "https://example.com/3",
+    ]
+    assert [v["link"] for v in iter_filtered(json_saver, None, (180000, 250000))] == ["https://example.com/1"]
+
+
+def test_export_csv(json_saver: JSONFileHandler, tmp_path: Path) -> None:
+    """Тестирует выгрузку в CSV с фильтром по зарплате."""
+    path = tmp_path / "vacancies.csv"
+    assert export_vacancies(json_saver, str(path), salary_range=(50000, 300000)) == 2
+    with open(path, encoding="utf-8-sig", newline="") as file:
+        rows = list(csv.reader(file))
+    assert rows[0] == list(EXPORT_FIELDS)
+    assert rows[1][:5] == ["Python Developer", "https://example.com/1", "150000.0", "200000.0", "150000.0"]
+    assert rows[2][:5] == ["Java Developer", "https://example.com/2", "90000.0", "", "90000.0"]
+
+
+def test_export_xlsx(json_saver: JSONFileHandler, tmp_path: Path) -> None:
+    """Тестирует выгрузку в XLSX."""
+    openpyxl = pytest.importorskip("openpyxl")
+    path = tmp_path / "vacancies.xlsx"
+    assert export_vacancies(json_saver, str(path), keywords=["python"]) == 2
+    rows = list(openpyxl.load_workbook(path, read_only=True).active.iter_rows(values_only=True))
+    assert rows[0] == EXPORT_FIELDS
+    assert [row[0] for row in rows[1:]] == ["Python Developer", "Python Junior"]
+    assert rows[2][4] is None
+
+
+def test_export_unknown_format(json_saver: JSONFileHandler, tmp_path: Path) -> None:
+    """Тестирует ошибку при неизвестном формате."""
+    with pytest.raises(ValueError):
+        export_vacancies(json_saver, str(tmp_path / "vacancies.txt"))
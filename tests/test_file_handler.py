@@ -1,10 +1,11 @@
 import json
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, cast
 from unittest.mock import mock_open, patch
 
 import pytest
 
+from src.dedup import NearDuplicateDetector
 from src.file_handler import JSONFileHandler
 
 
@@ -155,3 +156,113 @@ def test_filter_vacancies_by_salary_with_none_salary(json_saver: JSONFileHandler
     filtered = json_saver.filter_vacancies_by_salary((100000.0, 200000.0))
     assert len(filtered) == 1
     assert filtered[0]["title"] == "Python Developer"
+
+
+def test_add_vacancy_stores_tokens(json_saver: JSONFileHandler) -> None:
+    """Тестирует, что основы слов описания сохраняются вместе с вакансией."""
+    json_saver.add_vacancy(
+        {
+            "title": "Backend Developer",
+            "link": "http://example.com/backend",
+            "salary": 150000.0,
+            "description": "Ищем <b>разработчика</b> на JavaScript",
+        }
+    )
+    data = json_saver._load_data()
+    assert data[0]["tokens"] == " javascript ищ на разработчик "
+
+
+def test_filter_vacancies_by_word_forms(json_saver: JSONFileHandler) -> None:
+    """Тестирует поиск с учётом словоформ и по целым словам."""
+    test_vacancies: List[Dict[str, Any]] = [
+        {
+            "title": "Backend Developer",
+            "link": "http://example.com/backend",
+            "salary": 150000.0,
+            "description": "Ищем разработчика на JavaScript",
+        },
+        {
+            "title": "Java Developer",
+            "link": "http://example.com/java",
+            "salary": 200000.0,
+            "description": "Опыт работы с Java",
+        },
+    ]
+    for vacancy in test_vacancies:
+        json_saver.add_vacancy(vacancy)
+
+    assert [v["title"] for v in json_saver.filter_vacancies(["разработчик"])] == ["Backend Developer"]
+    assert [v["title"] for v in json_saver.filter_vacancies(["Java"])] == ["Java Developer"]
+    assert [v["title"] for v in json_saver.filter_vacancies(["javascript"])] == ["Backend Developer"]
+
+
+def test_add_vacancies_near_duplicates(json_saver: JSONFileHandler) -> None:
+    """Тестирует пропуск и группировку почти одинаковых вакансий при пакетном добавлении."""
+    description = "Python разработчик в команду платформы. Опыт работы с Django, PostgreSQL и Docker от трёх лет"
+
+    def make_vacancies() -> List[Dict[str, Any]]:
+        return [
+            {"title": "Python Developer", "link": "http://example.com/1", "salary": 15e4, "description": description},
+            {
+                "title": "Python Developer",
+                "link": "http://example.com/2",
+                "salary": 150000,
+                "description": description + " Удалённая работа",
+            },
+            {"title": "Повар", "link": "http://example.com/3", "salary": 60000, "description": "График 2/2"},
+        ]
+
+    assert json_saver.add_vacancies(make_vacancies(), near_duplicates="skip") == 2
+    assert [v["link"] for v in json_saver._load_data()] == ["http://example.com/1", "http://example.com/3"]
+
+    # Повторное добавление тех же вакансий ничего не меняет
+    assert json_saver.add_vacancies(make_vacancies(), near_duplicates="skip") == 0
+
+    # По умолчанию почти одинаковые вакансии сохраняются и помечаются ссылкой на исходную
+    json_saver._save_data([])
+    assert json_saver.add_vacancies(make_vacancies()) == 3
+    data = json_saver._load_data()
+    assert data[1]["duplicate_of"] == "http://example.com/1"
+    assert "duplicate_of" not in data[2]
+    assert "signature" not in data[0]
+
+    json_saver._save_data([])
+    assert json_saver.add_vacancies(make_vacancies(), near_duplicates="keep") == 3
+
+    with pytest.raises(ValueError):
+        json_saver.add_vacancies(make_vacancies(), near_duplicates="merge")
+
+
+def test_near_duplicates_need_same_employer_and_salary(json_saver: JSONFileHandler) -> None:
+    """Тестирует, что одинаковый текст от другого работодателя или с другой зарплатой — не повтор."""
+    description = "Python разработчик в команду платформы. Опыт работы с Django, PostgreSQL и Docker от трёх лет"
+    base = {"title": "Python Developer", "salary": 100000, "description": description, "employer": "Acme"}
+    vacancies = [
+        dict(base, link="http://example.com/1"),
+        dict(base, link="http://example.com/2", salary=250000),
+        dict(base, link="http://example.com/3", employer="Globex"),
+        dict(base, link="http://example.com/4", employer="ACME"),
+    ]
+    assert json_saver.add_vacancies(vacancies, near_duplicates="skip") == 3
+    assert [v["link"] for v in json_saver._load_data()] == [f"http://example.com/{i}" for i in (1, 2, 3)]
+
+
+def test_near_duplicate_index_is_reused(monkeypatch: pytest.MonkeyPatch, json_saver: JSONFileHandler) -> None:
+    """Тестирует, что индекс сигнатур строится по хранилищу один раз и перестраивается после внешней записи."""
+    built = []
+    original = NearDuplicateDetector.from_vacancies.__func__  # type: ignore[attr-defined]
+
+    def counting_from_vacancies(cls: Any, vacancies: Any, threshold: float = 0.8) -> NearDuplicateDetector:
+        built.append(threshold)
+        return cast(NearDuplicateDetector, original(cls, vacancies, threshold))
+
+    monkeypatch.setattr(NearDuplicateDetector, "from_vacancies", classmethod(counting_from_vacancies))
+    for i in range(3):
+        json_saver.add_vacancies(
+            [{"title": f"Вакансия {i}", "link": f"http://example.com/{i}", "salary": i, "description": f"Текст {i}"}]
+        )
+    assert len(built) == 1
+
+    json_saver._save_data(json_saver._load_data()[:1])  # Запись в обход add_vacancies
+    json_saver.add_vacancies([{"title": "Ещё", "link": "http://example.com/x", "salary": 1, "description": "Ещё"}])
+    assert len(built) == 2
@@ -1,4 +1,4 @@
-from src.helpers import clean_html, parse_salary_range
+from src.helpers import clean_html, matches_keywords, matches_salary, parse_salary_range, salary_value
 
 
 def test_clean_html() -> None:
@@ -35,3 +35,41 @@ def test_parse_salary_range() -> None:
         0,
         float("inf"),
     )  # Функция должна игнорировать отрицательные числа <button class="citation-flag" data-index="1">
+
+
+def test_matches_keywords() -> None:
+    """Тестирует функцию matches_keywords."""
+    vacancy = {"title": "Python Developer", "description": "Опыт работы с <b>Python</b>"}
+    assert matches_keywords(vacancy, ["python"])
+    assert matches_keywords(vacancy, ["Java", "Python"])
+    assert not matches_keywords(vacancy, ["Java"])
+    assert matches_keywords(vacancy, [])  # Пустой фильтр подходит всегда
+    assert not matches_keywords({"description": None}, ["Python"])
+
+
+def test_matches_salary() -> None:
+    """Тестирует функцию matches_salary."""
+    assert matches_salary({"salary": 100000}, (90000, 130000))
+    assert not matches_salary({"salary": 80000}, (90000, 130000))
+    assert not matches_salary({"salary": "Зарплата не указана"}, (0, float("inf")))
+    assert not matches_salary({}, (0, float("inf")))
+
+
+def test_salary_value() -> None:
+    """Тестирует получение зарплаты числом."""
+    assert salary_value({"salary": 100000}) == 100000.0
+    assert salary_value({"salary": 1.5}) == 1.5
+    assert salary_value({"salary": "Зарплата не указана"}) is None
+    assert salary_value({"salary": True}) is None
+    assert salary_value({}) is None
+
+
+def test_matches_salary_overlap() -> None:
+    """Тестирует пересечение зарплатной вилки с диапазоном."""
+    vacancy = {"salary": 100000, "salary_from": 100000, "salary_to": 150000, "salary_rub": 100000}
+    assert matches_salary(vacancy, (140000, 200000))
+    assert matches_salary(vacancy, (50000, 100000))
+    assert not matches_salary(vacancy, (160000, 200000))
+    assert not matches_salary(vacancy, (50000, 90000))
+    assert not matches_salary({"salary_from": None, "salary_to": None, "salary_rub": None}, (0, float("inf")))
+    assert salary_value(vacancy) == 100000
@@ -0,0 +1,103 @@
+import threading
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from src.file_handler import JSONFileHandler
+from src.ingest import IngestJob, IngestWorker
+
+
+class StubAPI:
+    """Заглушка API: возвращает заданные вакансии и может ждать сигнала перед ответом."""
+
+    def __init__(self, vacancies: List[Dict[str, Any]]) -> None:
+        self.vacancies = vacancies
+        self.release = threading.Event()
+        self.release.set()
+
+    def get_vacancies(self, keyword: str) -> List[Dict[str, Any]]:
+        self.release.wait(timeout=5)
+        if keyword == "error":
+            raise RuntimeError("API недоступно")
+        return [dict(vacancy) for vacancy in self.vacancies]
+
+
+@pytest.fixture
+def json_saver(tmp_path: Path) -> JSONFileHandler:
+    """Фикстура для создания временного JSON-файла."""
+    return JSONFileHandler(filename=str(tmp_path / "vacancies.json"))
+
+
+@pytest.fixture
+def stub_api() -> StubAPI:
+    return StubAPI(
+        [
+            {
+                "title": f"Python Developer {i}",
+                "link": f"https://example.com/vacancy/{i}",
+                "salary": 100000 + i,
+                "description": f"Вакансия номер {i}: {' '.join(str(i * j) for j in range(10))}",
+            }
+            for i in range(45)
+        ]
+        + [{"title": "", "link": "https://example.com/empty", "salary": None, "description": "Без названия"}]
+    )
+
+
+def test_ingest_job(monkeypatch: pytest.MonkeyPatch, json_saver: JSONFileHandler, stub_api: StubAPI) -> None:
+    """Тестирует фоновую загрузку: прогресс, обработку порциями с одной записью хранилища и итоговое сообщение."""
+    saves: List[int] = []
+    statuses: List[str] = []
+    save_data = json_saver._save_data
+
+    def counting_save_data(data: List[Dict[str, Any]]) -> None:
+        saves.append(len(data))
+        statuses.append(job.progress())
+        save_data(data)
+
+    monkeypatch.setattr(json_saver, "_save_data", counting_save_data)
+    worker = IngestWorker(json_saver, stub_api, chunk_size=10)
+    job = worker.submit("Python")
+    assert "[1] «Python»" in job.progress()
+    worker.shutdown()
+
+    assert job.status == IngestJob.DONE
+    assert (job.total, job.processed, job.added, job.errors) == (46, 46, 45, 1)
+    assert len(json_saver._load_data()) == 45
+    assert saves == [45]
+    assert statuses == ["[1] «Python»: запись в хранилище"]
+    assert "добавлено 45" in job.summary()
+    assert worker.pop_finished() == [job]
+    assert worker.pop_finished() == []
+
+
+def test_ingest_cancel(json_saver: JSONFileHandler, stub_api: StubAPI) -> None:
+    """Тестирует отмену задачи, ожидающей ответа API, и задачи в очереди."""
+    stub_api.release.clear()
+    worker = IngestWorker(json_saver, stub_api)
+    first = worker.submit("Python")
+    second = worker.submit("Java")
+    assert len(worker.active_jobs()) == 2
+
+    assert worker.cancel(first.job_id)
+    assert worker.cancel(second.job_id)
+    assert not worker.cancel(100)
+    stub_api.release.set()
+    worker.shutdown()
+
+    assert first.status == second.status == IngestJob.CANCELLED
+    assert json_saver._load_data() == []
+    assert not worker.cancel(first.job_id)
+
+
+def test_ingest_failure(json_saver: JSONFileHandler, stub_api: StubAPI) -> None:
+    """Тестирует, что ошибка одной задачи не останавливает обработку очереди."""
+    worker = IngestWorker(json_saver, stub_api)
+    failed = worker.submit("error")
+    done = worker.submit("Python")
+    worker.shutdown()
+
+    assert failed.status == IngestJob.FAILED
+    assert "API недоступно" in failed.summary()
+    assert done.status == IngestJob.DONE
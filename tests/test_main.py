@@ -1,3 +1,5 @@
+import subprocess
+import sys
 from pathlib import Path
 from typing import Any, Dict, List
 
@@ -7,6 +9,13 @@ from main import display_vacancies, user_interaction
 from src.api_handler import HeadHunterAPI
 from src.file_handler import JSONFileHandler
 from src.helpers import parse_salary_range
+from src.saved_search import SavedSearchManager
+
+
+# Бюджет времени импорта main до появления меню, в микросекундах
+STARTUP_BUDGET_US = 200_000
+# Модули, которые должны загружаться только при первом использовании
+LAZY_MODULES = ("requests", "urllib3", "pandas", "openpyxl")
 
 
 @pytest.fixture
@@ -95,7 +104,7 @@ def test_user_interaction(
     """
     inputs = iter([
         "1",  # Выбор "Добавить вакансии из HeadHunter"
-        "Python",  # Поисковый запрос
+        "Python",  # Поисковый запрос (загрузка ставится в очередь)
         "6",  # Выход из программы
     ])
     monkeypatch.setattr("builtins.input", lambda _: next(inputs))
@@ -114,16 +123,18 @@ def test_user_interaction(
         ],
     )
 
-    # Имитация сохранения данных в файл
-    monkeypatch.setattr(JSONFileHandler, "add_vacancy", lambda self, vacancy_data: None)
+    # Сохранение во временный файл вместо data/vacancies.json
+    monkeypatch.setattr("main.JSONFileHandler", lambda: json_saver)
 
     # Запуск функции user_interaction()
     user_interaction()
 
-    # Проверка вывода
+    # Проверка вывода: загрузка выполняется в фоне, итог выводится перед выходом
     captured = capsys.readouterr()
-    assert "Вакансия «Test Vacancy» успешно добавлена." in captured.out
+    assert "Загрузка [1] «Python» поставлена в очередь." in captured.out
+    assert "Загрузка [1] «Python» завершена: получено 1, обработано 1, добавлено 1" in captured.out
     assert "Выход из программы." in captured.out
+    assert [v["title"] for v in json_saver._load_data()] == ["Test Vacancy"]
 
 
 def test_user_interaction_invalid_choice(
@@ -135,7 +146,7 @@ def test_user_interaction_invalid_choice(
     Тестирует обработку некорректного выбора в меню.
     """
     inputs = iter([
-        "7",  # Некорректный выбор
+        "14",  # Некорректный выбор
         "6",  # Выход из программы
     ])
     monkeypatch.setattr("builtins.input", lambda _: next(inputs))
@@ -171,3 +182,164 @@ def test_user_interaction_empty_search_query(
     captured = capsys.readouterr()
     assert "Поисковый запрос не может быть пустым." in captured.out
     assert "Выход из программы." in captured.out
+
+
+def test_user_interaction_combined_filter(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture,
+    json_saver: JSONFileHandler,
+) -> None:
+    """
+    Тестирует комбинированный фильтр: ключевые слова, диапазон зарплат и топ-N.
+    """
+    for i, salary in enumerate([100000, 150000, 250000]):
+        json_saver.add_vacancy(
+            {
+                "title": f"Python Developer {i}",
+                "link": f"http://example.com/python/{i}",
+                "salary": salary,
+                "description": "Опыт работы с Python",
+            }
+        )
+    monkeypatch.setattr("main.JSONFileHandler", lambda: json_saver)
+    capsys.readouterr()  # Сбрасываем сообщения о добавлении вакансий
+
+    inputs = iter([
+        "7",  # Комбинированный фильтр
+        "Python",  # Ключевые слова
+        "90000-200000",  # Диапазон зарплат
+        "1",  # Топ-1
+        "6",  # Выход из программы
+    ])
+    monkeypatch.setattr("builtins.input", lambda _: next(inputs))
+
+    user_interaction()
+
+    captured = capsys.readouterr()
+    assert "Python Developer 1" in captured.out
+    assert "Python Developer 0" not in captured.out
+    assert "Python Developer 2" not in captured.out
+
+
+def test_user_interaction_combined_filter_reversed_range(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture,
+    json_saver: JSONFileHandler,
+) -> None:
+    """
+    Тестирует, что перепутанные границы зарплат в комбинированном фильтре не прерывают работу меню.
+    """
+    inputs = iter([
+        "7",  # Комбинированный фильтр
+        "python",  # Ключевые слова
+        "200000-100000",  # Минимум больше максимума
+        "6",  # Выход из программы
+    ])
+    monkeypatch.setattr("builtins.input", lambda _: next(inputs))
+
+    user_interaction()
+
+    captured = capsys.readouterr()
+    assert "Некорректный диапазон зарплат." in captured.out
+    assert "Выход из программы." in captured.out
+
+
+def test_user_interaction_salary_stats(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture,
+    json_saver: JSONFileHandler,
+) -> None:
+    """
+    Тестирует вывод статистики зарплат по ключевому слову.
+    """
+    for i, salary in enumerate([100000, 200000]):
+        json_saver.add_vacancy(
+            {
+                "title": f"Python Developer {i}",
+                "link": f"http://example.com/python/{i}",
+                "salary": salary,
+                "description": "Опыт работы с Python",
+            }
+        )
+    monkeypatch.setattr("main.JSONFileHandler", lambda: json_saver)
+    capsys.readouterr()
+
+    inputs = iter(["10", "Python", "6"])
+    monkeypatch.setattr("builtins.input", lambda _: next(inputs))
+
+    user_interaction()
+
+    captured = capsys.readouterr()
+    assert "«Python»" in captured.out
+    assert "Вакансий с зарплатой: 2 (без зарплаты: 0)" in captured.out
+    assert "Средняя: 150000 руб." in captured.out
+
+
+def test_user_interaction_saved_search(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture,
+    tmp_path: Path,
+    json_saver: JSONFileHandler,
+) -> None:
+    """
+    Тестирует сохранение поиска и его открытие с учётом вакансий, добавленных после сохранения.
+    """
+    json_saver.add_vacancy(
+        {
+            "title": "Python Developer 0",
+            "link": "http://example.com/python/0",
+            "salary": 150000,
+            "description": "Опыт работы с Python",
+        }
+    )
+    manager = SavedSearchManager(json_saver, str(tmp_path / "saved_searches.json"))
+    monkeypatch.setattr("main.JSONFileHandler", lambda: json_saver)
+    monkeypatch.setattr("main.SavedSearchManager", lambda _: manager)
+
+    inputs = iter(["12", "python", "Python", "100000-200000", "6"])
+    monkeypatch.setattr("builtins.input", lambda _: next(inputs))
+    user_interaction()
+    assert "Поиск сохранён: «python»" in capsys.readouterr().out
+
+    json_saver.add_vacancy(
+        {
+            "title": "Python Developer 1",
+            "link": "http://example.com/python/1",
+            "salary": 120000,
+            "description": "Опыт работы с Python",
+        }
+    )
+    capsys.readouterr()
+    inputs = iter(["13", "python", "6"])
+    monkeypatch.setattr("builtins.input", lambda _: next(inputs))
+    user_interaction()
+
+    captured = capsys.readouterr()
+    assert "Python Developer 1" in captured.out
+    assert "Вакансий: 2, новых с прошлого просмотра: 1" in captured.out
+
+
+def test_startup_import_time() -> None:
+    """
+    Тестирует, что запуск до первого меню не загружает тяжёлые модули и укладывается в бюджет времени.
+    Используется вывод python -X importtime в отдельном процессе, чтобы кеш модулей pytest не влиял на результат.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=Path(__file__).resolve().parent.parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    cumulative_us: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            cumulative_us[name.strip()] = int(cumulative)
+
+    loaded_lazy_modules = [name for name in cumulative_us if name.split(".")[0] in LAZY_MODULES]
+    assert loaded_lazy_modules == []
+    assert cumulative_us["main"] < STARTUP_BUDGET_US
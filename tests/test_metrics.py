@@ -0,0 +1,77 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from src import metrics
+from src.file_handler import JSONFileHandler
+from src.vacancy import Vacancy
+
+
+@pytest.fixture
+def enabled_metrics() -> Iterator[None]:
+    """Фикстура: включает сбор метрик на время теста и очищает накопленные значения."""
+    metrics.REGISTRY.reset()
+    metrics.enable()
+    yield
+    metrics.enable(False)
+    metrics.REGISTRY.reset()
+
+
+def test_timed_disabled() -> None:
+    """Тестирует, что при выключенных метриках ничего не записывается."""
+    metrics.REGISTRY.reset()
+    assert not metrics.enabled()
+    Vacancy("Python Developer", "https://example.com", 100000, "Python")
+    metrics.increment("test.counter")
+    assert metrics.REGISTRY.snapshot() == {"counters": {}, "timers": {}}
+
+
+def test_instrumentation(enabled_metrics: None, tmp_path: Path) -> None:
+    """Тестирует таймеры и счётчики на горячих путях хранилища и Vacancy."""
+    json_saver = JSONFileHandler(filename=str(tmp_path / "vacancies.json"))
+    vacancy = Vacancy("Python Developer", "https://example.com", 100000, "Python")
+    json_saver.add_vacancies([vacancy.to_dict()])
+    json_saver.filter_vacancies(["python"])
+    json_saver.filter_vacancies_by_salary((0, 200000))
+
+    snapshot = metrics.REGISTRY.snapshot()
+    assert snapshot["timers"]["vacancy.init"]["count"] == 1
+    assert snapshot["timers"]["storage.load"]["count"] == 3
+    assert snapshot["timers"]["storage.save"]["count"] == 1
+    assert snapshot["timers"]["filter.keywords"]["count"] == 1
+    assert snapshot["timers"]["filter.salary"]["count"] == 1
+    assert snapshot["timers"]["html.clean"]["count"] >= 1
+    assert snapshot["counters"]["storage.records_saved"] == 1
+    assert snapshot["counters"]["storage.records_loaded"] == 2
+
+
+def test_prometheus_format(enabled_metrics: None) -> None:
+    """Тестирует вывод метрик в текстовом формате Prometheus."""
+    metrics.increment("api.vacancies_received", 5)
+    metrics.REGISTRY.observe("storage.load", 0.5)
+    text = metrics.REGISTRY.to_prometheus()
+    assert "# TYPE vacancy_api_vacancies_received_total counter\nvacancy_api_vacancies_received_total 5\n" in text
+    assert "vacancy_storage_load_seconds_count 1\nvacancy_storage_load_seconds_sum 0.5\n" in text
+
+
+def test_dump_on_exit(tmp_path: Path) -> None:
+    """Тестирует включение метрик переменными окружения и их сохранение при выходе из программы."""
+    metrics_file = tmp_path / "metrics.json"
+    env = dict(os.environ, VACANCY_METRICS="json", VACANCY_METRICS_FILE=str(metrics_file))
+    subprocess.run(
+        [sys.executable, str(Path(__file__).resolve().parent.parent / "main.py")],
+        cwd=tmp_path,
+        input="5\n6\n",
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    dumped = json.loads(metrics_file.read_text(encoding="utf-8"))
+    assert dumped["timers"]["filter.keywords"]["count"] == 1
+    assert dumped["timers"]["storage.load"]["count"] == 1
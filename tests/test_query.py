@@ -0,0 +1,107 @@
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from src.file_handler import JSONFileHandler
+from src.query import Query, QueryPlan, VacancyIndex
+
+
+@pytest.fixture
+def test_vacancies() -> List[Dict[str, Any]]:
+    return [
+        {"title": "Python Junior", "link": "http://example.com/1", "salary": 80000, "description": "Python, SQL"},
+        {"title": "Java Middle", "link": "http://example.com/2", "salary": 150000, "description": "Java, Spring"},
+        {"title": "Python Middle", "link": "http://example.com/3", "salary": 150000, "description": "Python, Django"},
+        {"title": "Python Senior", "link": "http://example.com/4", "salary": 250000, "description": "Python, Go"},
+        {"title": "Python Intern", "link": "http://example.com/5", "salary": "Не указана", "description": "Go"},
+    ]
+
+
+@pytest.fixture
+def json_saver(tmp_path: Path, test_vacancies: List[Dict[str, Any]]) -> JSONFileHandler:
+    """Фикстура для создания временного JSON-файла с тестовыми вакансиями."""
+    saver = JSONFileHandler(filename=str(tmp_path / "vacancies.json"))
+    saver._save_data(test_vacancies)
+    return saver
+
+
+def titles(vacancies: List[Dict[str, Any]]) -> List[str]:
+    return [v["title"] for v in vacancies]
+
+
+def test_query_fused_scan(json_saver: JSONFileHandler) -> None:
+    """Тестирует выполнение запроса одним проходом по хранилищу."""
+    query = Query().keywords("python").salary(100000, 300000)
+    assert query.plan(json_saver).strategy == QueryPlan.FULL_SCAN
+    assert titles(query.execute(json_saver)) == ["Python Middle", "Python Senior"]
+
+
+def test_query_order_and_limit(json_saver: JSONFileHandler) -> None:
+    """Тестирует сортировку по зарплате и отбор top-N."""
+    assert titles(Query().keywords("python").order_by("salary").limit(2).execute(json_saver)) == [
+        "Python Senior",
+        "Python Middle",
+    ]
+    assert titles(Query().order_by("salary", descending=False).limit(2).execute(json_saver)) == [
+        "Python Intern",
+        "Python Junior",
+    ]
+    assert titles(Query().limit(1).execute(json_saver)) == ["Python Junior"]
+
+
+def test_query_uses_salary_index(test_vacancies: List[Dict[str, Any]], json_saver: JSONFileHandler) -> None:
+    """Тестирует, что при наличии индекса выбирается диапазонный поиск с тем же результатом."""
+    index = VacancyIndex(test_vacancies)
+    queries = [
+        Query().keywords("python").salary(100000, 300000),
+        Query().salary(100000, 200000).order_by("salary"),
+        Query().salary(0, 300000).order_by("salary", descending=False).limit(3),
+    ]
+    for query in queries:
+        assert query.plan(index).strategy == QueryPlan.SALARY_INDEX
+        assert query.execute(index) == query.execute(json_saver)
+
+
+def test_salary_index_overlapping_ranges() -> None:
+    """Тестирует, что индекс находит вилки, пересекающиеся с диапазоном, как и полный проход."""
+    vacancies: List[Dict[str, Any]] = [
+        {"title": "Вилка", "salary_from": 80000.0, "salary_to": 250000.0, "salary_rub": 80000.0},
+        {"title": "Число", "salary_from": 120000.0, "salary_to": None, "salary_rub": 120000.0},
+        {"title": "Ниже", "salary_from": 50000.0, "salary_to": 90000.0, "salary_rub": 50000.0},
+        {"title": "Без зарплаты", "salary_from": None, "salary_to": None, "salary_rub": None},
+    ]
+    index = VacancyIndex(vacancies)
+    for descending in (True, False):
+        query = Query().salary(100000, 200000).order_by("salary", descending=descending)
+        assert titles(query.execute(index)) == titles(query._execute_scan(iter(vacancies)))
+    assert titles(Query().salary(100000, 200000).order_by("salary").execute(index)) == ["Число", "Вилка"]
+
+
+def test_query_explain(test_vacancies: List[Dict[str, Any]], json_saver: JSONFileHandler) -> None:
+    """Тестирует текстовое описание плана запроса."""
+    query = Query().keywords("python").salary(100000, 200000).order_by("salary").limit(5)
+    assert "через кучу" in query.explain(json_saver)
+    assert "индексу зарплат" in query.explain(VacancyIndex(test_vacancies))
+
+
+def test_query_validation() -> None:
+    """Тестирует проверку параметров запроса."""
+    with pytest.raises(ValueError):
+        Query().salary(200000, 100000)
+    with pytest.raises(ValueError):
+        Query().order_by("title")
+    with pytest.raises(ValueError):
+        Query().limit(-1)
+
+
+def test_index_extended(test_vacancies: List[Dict[str, Any]]) -> None:
+    """Тестирует, что дополненный индекс отвечает так же, как построенный заново, и не меняет исходный."""
+    index = VacancyIndex(test_vacancies[:2])
+    extended = index.extended(test_vacancies[2:])
+    rebuilt = VacancyIndex(test_vacancies)
+    assert len(index) == 2
+    for descending in (False, True):
+        assert extended.salary_range(0, float("inf"), descending) == rebuilt.salary_range(0, float("inf"), descending)
+    query = Query().salary(50000, 200000).order_by("salary").limit(3)
+    assert query.execute(extended) == query.execute(rebuilt)
@@ -0,0 +1,62 @@
+import pytest
+
+from src.salary import NOT_SPECIFIED, apply_salary_fields, normalize_salary, parse_salary_text, to_rub
+
+
+def test_to_rub() -> None:
+    """Тестирует перевод в рубли по локальной таблице курсов."""
+    assert to_rub(100000, "RUR") == 100000
+    assert to_rub(100000, None) == 100000
+    assert to_rub(1000, "usd") == 92000
+    assert to_rub(1000, "XYZ") is None
+    assert to_rub(None, "USD") is None
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("100 000-150 000 руб.", (100000, 150000, "RUR")),
+        ("от 90000", (90000, None, "RUR")),
+        ("до 150 000 руб.", (None, 150000, "RUR")),
+        ("2000-3000 USD", (2000, 3000, "USD")),
+        ("некорректная зарплата", (None, None, "RUR")),
+    ],
+)
+def test_parse_salary_text(text: str, expected: tuple) -> None:
+    """Тестирует разбор зарплаты в текстовом виде."""
+    assert parse_salary_text(text) == expected
+
+
+def test_normalize_salary() -> None:
+    """Тестирует приведение зарплаты к числовым полям в рублях."""
+    assert normalize_salary(100000) == {"salary_from": 100000, "salary_to": None, "salary_rub": 100000}
+    assert normalize_salary("до 150 000 руб.") == {"salary_from": None, "salary_to": 150000, "salary_rub": 150000}
+    assert normalize_salary(NOT_SPECIFIED)["salary_rub"] is None
+    assert normalize_salary(None)["salary_rub"] is None
+    assert normalize_salary(True)["salary_rub"] is None
+
+
+def test_normalize_salary_range() -> None:
+    """Тестирует, что вилка из API имеет приоритет над прежним полем salary и переводится в рубли."""
+    normalized = normalize_salary(1000, {"from": 1000, "to": 2000, "currency": "EUR", "gross": False})
+    assert normalized == {"salary_from": 100000, "salary_to": 200000, "salary_rub": 100000}
+
+
+def test_normalize_salary_gross() -> None:
+    """Тестирует, что зарплата до вычета налогов приводится к сумме на руки."""
+    gross = normalize_salary(None, {"from": 100000, "to": None, "currency": "RUR", "gross": True})
+    net = normalize_salary(None, {"from": 100000, "to": None, "currency": "RUR", "gross": False})
+    assert gross == {"salary_from": 87000, "salary_to": None, "salary_rub": 87000}
+    assert net["salary_rub"] == 100000
+    assert normalize_salary(None, {"from": 100000, "to": None, "currency": "RUR", "gross": None}) == net
+
+
+def test_apply_salary_fields() -> None:
+    """Тестирует дополнение словаря вакансии полями зарплаты."""
+    vacancy = apply_salary_fields({"salary": "100 000-150 000 руб."})
+    assert vacancy == {"salary": 100000, "salary_from": 100000, "salary_to": 150000, "salary_rub": 100000}
+
+    # Уже нормализованная вакансия не разбирается повторно
+    assert apply_salary_fields({"salary": "x", "salary_from": None, "salary_to": None, "salary_rub": None})[
+        "salary"
+    ] == NOT_SPECIFIED
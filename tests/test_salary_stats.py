@@ -0,0 +1,97 @@
+import random
+from typing import Any, Dict, List
+
+import pytest
+
+from src.salary_stats import SalaryStats, TDigest, salary_stats, salary_stats_by_keyword
+
+
+@pytest.fixture
+def vacancies() -> List[Dict[str, Any]]:
+    """Фикстура с вакансиями, часть из которых без зарплаты."""
+    return [
+        {"title": "Python 1", "salary": 100000, "description": "Разработчик Python"},
+        {"title": "Python 2", "salary": 200000, "description": "Python и Django"},
+        {"title": "Java", "salary": 40000, "description": "Разработчик Java"},
+        {"title": "Без зарплаты", "salary": "Зарплата не указана", "description": "Разработчик Python"},
+    ]
+
+
+def exact_quantile(values: List[float], q: float) -> float:
+    """Точный квантиль с линейной интерполяцией."""
+    ordered = sorted(values)
+    position = q * (len(ordered) - 1)
+    low = int(position)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+
+def test_salary_stats(vacancies: List[Dict[str, Any]]) -> None:
+    """Тестирует основные показатели и гистограмму."""
+    stats = salary_stats(vacancies)
+    assert stats.count == 3
+    assert stats.skipped == 1
+    assert stats.mean == pytest.approx(340000 / 3)
+    assert (stats.min, stats.max) == (40000, 200000)
+    assert stats.quantile(0.5) == pytest.approx(100000)
+    histogram = {bucket["from"]: bucket["count"] for bucket in stats.to_dict()["histogram"]}
+    assert histogram[30000] == 1
+    assert histogram[100000] == 1
+    assert histogram[200000] == 1
+    assert sum(histogram.values()) == 3
+
+
+def test_salary_stats_empty() -> None:
+    """Тестирует статистику без вакансий с зарплатой."""
+    stats = salary_stats([{"salary": "Зарплата не указана"}])
+    assert stats.mean is None
+    assert stats.quantile(0.5) is None
+    assert "нет" in stats.format()
+
+
+def test_salary_stats_by_keyword(vacancies: List[Dict[str, Any]]) -> None:
+    """Тестирует статистику по ключевым словам за один проход."""
+    stats = salary_stats_by_keyword(iter(vacancies), ["python", "java"])
+    assert stats["python"].count == 2
+    assert stats["python"].skipped == 1
+    assert stats["java"].count == 1
+    assert stats["java"].max == 40000
+
+
+def test_tdigest_accuracy() -> None:
+    """Тестирует точность квантилей на большой логнормальной выборке."""
+    rng = random.Random(1)
+    values = [rng.lognormvariate(11.6, 0.45) for _ in range(50000)]
+    digest = TDigest()
+    for value in values:
+        digest.add(value)
+    for q in (0.1, 0.25, 0.5, 0.75, 0.9, 0.99):
+        assert digest.quantile(q) == pytest.approx(exact_quantile(values, q), rel=0.01)
+    assert digest.quantile(0) == pytest.approx(min(values))
+    assert digest.quantile(1) == pytest.approx(max(values))
+
+
+def test_merge() -> None:
+    """Тестирует, что объединение статистик частей близко к статистике всех данных."""
+    rng = random.Random(2)
+    values = [float(rng.randint(20000, 400000)) for _ in range(20000)]
+    parts = [SalaryStats() for _ in range(4)]
+    for i, value in enumerate(values):
+        parts[i % 4].add(value)
+    merged = parts[0]
+    for part in parts[1:]:
+        merged.merge(part)
+    whole = SalaryStats()
+    for value in values:
+        whole.add(value)
+    assert merged.count == whole.count
+    assert merged.mean == pytest.approx(whole.mean)
+    assert (merged.min, merged.max) == (whole.min, whole.max)
+    assert merged.histogram == whole.histogram
+    assert merged.quantile(0.5) == pytest.approx(exact_quantile(values, 0.5), rel=0.01)
+
+
+def test_merge_different_buckets() -> None:
+    """Тестирует ошибку при объединении статистик с разными корзинами."""
+    with pytest.raises(ValueError):
+        SalaryStats().merge(SalaryStats(buckets=(0, 100000)))
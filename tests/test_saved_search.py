@@ -0,0 +1,154 @@
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+import pytest
+
+from src.file_handler import JSONFileHandler
+from src.saved_search import SavedSearchManager
+from src.sharded_file_handler import ShardedJSONFileHandler
+
+
+def vacancy(number: int, description: str, salary: Any = 100000, **extra: Any) -> Dict[str, Any]:
+    """Создаёт словарь вакансии с уникальной ссылкой."""
+    return {
+        "title": f"Вакансия {number}",
+        "link": f"https://example.com/{number}",
+        "salary": salary,
+        "description": description,
+        **extra,
+    }
+
+
+@pytest.fixture
+def json_saver(tmp_path: Path) -> JSONFileHandler:
+    """Фикстура: хранилище с двумя вакансиями."""
+    saver = JSONFileHandler(str(tmp_path / "vacancies.json"))
+    saver.add_vacancies(
+        [vacancy(1, "Разработчик Python", 150000), vacancy(2, "Разработчик Java", 90000)], near_duplicates="keep"
+    )
+    return saver
+
+
+@pytest.fixture
+def manager(tmp_path: Path, json_saver: JSONFileHandler) -> SavedSearchManager:
+    """Фикстура: менеджер сохранённых поисков во временном файле."""
+    return SavedSearchManager(json_saver, str(tmp_path / "saved_searches.json"))
+
+
+def titles(vacancies: List[Dict[str, Any]]) -> List[str]:
+    return [v["title"] for v in vacancies]
+
+
+def test_create_and_open(manager: SavedSearchManager) -> None:
+    """Тестирует создание поиска: результат вычисляется сразу и не содержит служебных полей."""
+    search = manager.create("python", ["python"], (100000, float("inf")))
+    assert titles(search.results) == ["Вакансия 1"]
+    assert "tokens" not in search.results[0]
+    assert manager.open("python") == (search.results, 0)
+    assert "100000 и выше" in search.describe()
+
+
+def test_incremental_add_and_delete(manager: SavedSearchManager, json_saver: JSONFileHandler) -> None:
+    """Тестирует обновление результата при добавлении и удалении вакансий и счётчик новых."""
+    manager.create("python", ["python"])
+    json_saver.add_vacancy(vacancy(3, "Python и Django", id=3))
+    json_saver.add_vacancies([vacancy(4, "Только Java"), vacancy(5, "Опыт Python")], near_duplicates="keep")
+    assert manager.get("python").new_count == 2  # type: ignore[union-attr]
+
+    results, new_count = manager.open("python")
+    assert titles(results) == ["Вакансия 1", "Вакансия 3", "Вакансия 5"]
+    assert new_count == 2
+    assert manager.open("python")[1] == 0
+
+    json_saver.delete_vacancy(3)
+    assert titles(manager.open("python")[0]) == ["Вакансия 1", "Вакансия 5"]
+
+
+def test_only_changed_records_are_checked(manager: SavedSearchManager, json_saver: JSONFileHandler) -> None:
+    """Тестирует, что при изменении хранилища вакансии не перечитываются целиком."""
+    manager.create("python", ["python"])
+    json_saver.iter_vacancies = None  # type: ignore[assignment,method-assign]
+    json_saver.filter_vacancies = None  # type: ignore[assignment,method-assign]
+    json_saver.add_vacancy(vacancy(3, "Python"))
+    assert manager.get("python").new_count == 1  # type: ignore[union-attr]
+
+
+def test_persistence(tmp_path: Path, manager: SavedSearchManager, json_saver: JSONFileHandler) -> None:
+    """Тестирует сохранение поисков между запусками: в файле только ссылки, файл читается при первом обращении."""
+    manager.create("java", ["java"], (50000, 100000))
+    manager.close()
+    stored = json.loads((tmp_path / "saved_searches.json").read_text(encoding="utf-8"))
+    assert stored["java"]["links"] == ["https://example.com/2"]
+    assert "results" not in stored["java"]
+
+    reopened = SavedSearchManager(json_saver, str(tmp_path / "saved_searches.json"))
+    assert reopened._searches is None
+    search = reopened.get("java")
+    assert search is not None
+    assert search.salary_range == (50000, 100000)
+    results, new_count = reopened.open("java")
+    assert (titles(results), new_count) == (["Вакансия 2"], 0)
+    assert "tokens" not in results[0]
+
+    json_saver.add_vacancy(vacancy(4, "Java", 70000))
+    again = SavedSearchManager(json_saver, str(tmp_path / "saved_searches.json"))
+    results, new_count = again.open("java")
+    assert titles(results) == ["Вакансия 2", "Вакансия 4"]
+    assert new_count == 1
+
+
+def test_unnotified_changes(tmp_path: Path, manager: SavedSearchManager, json_saver: JSONFileHandler) -> None:
+    """Тестирует, что изменения хранилища без уведомления (другим процессом или через _save_data) замечаются."""
+    manager.create("python", ["python"])
+    other_process = JSONFileHandler(str(tmp_path / "vacancies.json"))
+    other_process.add_vacancy(vacancy(3, "Python и Django"))
+    assert manager.get("python").new_count == 1  # type: ignore[union-attr]
+    assert titles(manager.open("python")[0]) == ["Вакансия 1", "Вакансия 3"]
+
+    json_saver._save_data([record for record in json_saver._load_data() if record["link"] != "https://example.com/1"])
+    assert titles(manager.open("python")[0]) == ["Вакансия 3"]
+
+
+def test_delete_and_validation(manager: SavedSearchManager) -> None:
+    """Тестирует удаление поиска и проверку имени."""
+    manager.create("python", ["python"])
+    assert manager.delete("python")
+    assert not manager.delete("python")
+    with pytest.raises(ValueError):
+        manager.create("", ["python"])
+    with pytest.raises(KeyError):
+        manager.open("python")
+
+
+def test_sharded_store_notifies(tmp_path: Path) -> None:
+    """Тестирует, что шардированное хранилище передаёт изменения подписчикам."""
+    sharded_saver = ShardedJSONFileHandler(str(tmp_path / "shards"), shard_count=2)
+    manager = SavedSearchManager(sharded_saver, str(tmp_path / "saved_searches.json"))
+    manager.create("python", ["python"])
+    sharded_saver.add_vacancy(vacancy(1, "Python", id=1))
+    assert manager.get("python").new_count == 1  # type: ignore[union-attr]
+    sharded_saver.delete_vacancy(1)
+    assert manager.get("python").results == []  # type: ignore[union-attr]
+
+
+def test_restart_keeps_incremental_updates(
+    tmp_path: Path, manager: SavedSearchManager, json_saver: JSONFileHandler, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Тестирует, что после перезапуска изменения хранилища учитываются без полного прохода."""
+    manager.create("python", ["python"])
+    manager.close()
+    reopened = SavedSearchManager(json_saver, str(tmp_path / "saved_searches.json"))
+    reopened.searches()
+
+    passes: List[int] = []
+    iter_vacancies = json_saver.iter_vacancies
+
+    def counting_iter_vacancies() -> Iterator[Dict[str, Any]]:
+        passes.append(1)
+        return iter_vacancies()
+
+    monkeypatch.setattr(json_saver, "iter_vacancies", counting_iter_vacancies)
+    json_saver.add_vacancies([vacancy(3, "Опыт Python")], near_duplicates="keep")
+    assert [search.new_count for search in reopened.searches()] == [1]
+    assert passes == []
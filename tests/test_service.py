@@ -0,0 +1,109 @@
+import json
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+import pytest
+
+from src.file_handler import JSONFileHandler
+from src.service import LatencyHistogram, PooledHTTPServer, create_server
+
+
+@pytest.fixture
+def server(tmp_path: Path) -> Iterator[PooledHTTPServer]:
+    """Фикстура: сервис на свободном порту над временным хранилищем с тремя вакансиями."""
+    json_saver = JSONFileHandler(filename=str(tmp_path / "vacancies.json"))
+    json_saver.add_vacancies(
+        [
+            {"title": "Python Junior", "link": "http://example.com/1", "salary": 80000, "description": "Python и SQL"},
+            {"title": "Python Senior", "link": "http://example.com/2", "salary": 250000, "description": "Python, Go"},
+            {"title": "Java Middle", "link": "http://example.com/3", "salary": 150000, "description": "Java, Spring"},
+        ]
+    )
+    server = create_server(json_saver, port=0, workers=2)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def request(server: PooledHTTPServer, path: str, body: Optional[Any] = None) -> Tuple[int, Dict[str, Any]]:
+    """Выполняет запрос к сервису и возвращает статус и разобранный JSON."""
+    data = json.dumps(body).encode("utf-8") if body is not None else None
+    url = f"http://127.0.0.1:{server.server_port}{path}"
+    try:
+        with urlopen(Request(url, data=data, method="POST" if data else "GET"), timeout=5) as response:
+            return response.status, json.loads(response.read())
+    except HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def test_latency_histogram() -> None:
+    """Тестирует гистограмму задержек и оценку квантилей."""
+    histogram = LatencyHistogram()
+    for seconds in [0.0005] * 90 + [0.015] * 9 + [10.0]:
+        histogram.record(seconds)
+    result = histogram.to_dict()
+    assert result["count"] == 100
+    assert result["p50_ms"] == 1
+    assert result["p95_ms"] == 20
+    assert result["p99_ms"] == 20
+    assert histogram.quantile(1.0) == float("inf")
+    assert result["buckets"]["le_inf"] == 1
+
+
+def test_health(server: PooledHTTPServer) -> None:
+    """Тестирует проверку состояния сервиса."""
+    assert request(server, "/health") == (200, {"status": "ok", "vacancies": 3})
+
+
+def test_search(server: PooledHTTPServer) -> None:
+    """Тестирует поиск по ключевым словам, зарплате и top-N."""
+    status, result = request(server, "/vacancies?keywords=python")
+    assert status == 200
+    assert [v["title"] for v in result["items"]] == ["Python Junior", "Python Senior"]
+    assert "tokens" not in result["items"][0]
+
+    status, result = request(server, "/vacancies?salary_min=100000&top=1")
+    assert [v["title"] for v in result["items"]] == ["Python Senior"]
+    assert "индексу зарплат" in result["plan"]
+
+
+def test_ingest(monkeypatch: pytest.MonkeyPatch, server: PooledHTTPServer) -> None:
+    """Тестирует добавление вакансий: индекс дополняется без повторного чтения хранилища."""
+    monkeypatch.setattr(server.service._file_handler, "iter_vacancies", lambda: pytest.fail("хранилище перечитано"))
+    vacancy = {"title": "Go Developer", "link": "http://example.com/4", "salary": 300000, "description": "Go"}
+    assert request(server, "/vacancies", [vacancy]) == (200, {"added": 1})
+    _, result = request(server, "/vacancies?top=1")
+    assert result["items"][0]["title"] == "Go Developer"
+    _, result = request(server, "/vacancies?keywords=go&salary_min=200000")
+    assert [v["title"] for v in result["items"]] == ["Python Senior", "Go Developer"]
+
+
+def test_errors_and_metrics(server: PooledHTTPServer) -> None:
+    """Тестирует ответы на ошибочные запросы и сбор задержек."""
+    for query in ("top=abc", "top=inf", "top=1.5", "salary_min=nan", "salary_min=-1", "salary_min=200&salary_max=100"):
+        assert request(server, f"/vacancies?{query}")[0] == 400
+    assert request(server, "/vacancies", {"title": "not a list"})[0] == 400
+    vacancy = {"title": "Go", "link": "http://example.com/4", "salary": 1, "description": 5}
+    assert request(server, "/vacancies", [vacancy])[0] == 400
+    assert request(server, "/unknown")[0] == 404
+
+    status, metrics = request(server, "/metrics")
+    assert status == 200
+    assert metrics["GET /vacancies"]["count"] == 6
+    assert metrics["POST /vacancies"]["count"] == 2
+    assert metrics["unknown"]["count"] == 1
+
+
+def test_internal_error(monkeypatch: pytest.MonkeyPatch, server: PooledHTTPServer) -> None:
+    """Тестирует, что непредвиденная ошибка возвращается ответом 500 в формате JSON."""
+
+    def failing_search(*args: Any) -> None:
+        raise RuntimeError("сбой")
+
+    monkeypatch.setattr(server.service, "search", failing_search)
+    assert request(server, "/vacancies?keywords=python") == (500, {"error": "Внутренняя ошибка сервера."})
@@ -0,0 +1,120 @@
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+import pytest
+
+from src.file_handler import write_temp_json
+from src.sharded_file_handler import ShardedJSONFileHandler, shard_index
+
+
+@pytest.fixture
+def test_vacancies() -> List[Dict[str, Any]]:
+    return [
+        {
+            "title": f"Python Developer {i}",
+            "link": f"https://example.com/vacancy/{i}",
+            "salary": 50000 + i * 10000,
+            "description": "Опыт работы с Python" if i % 2 == 0 else "Опыт работы с Java",
+        }
+        for i in range(10)
+    ]
+
+
+@pytest.fixture
+def sharded_saver(tmp_path: Path, test_vacancies: List[Dict[str, Any]]) -> Iterator[ShardedJSONFileHandler]:
+    """Фикстура для создания шардированного хранилища с тестовыми вакансиями."""
+    saver = ShardedJSONFileHandler(str(tmp_path / "shards"), shard_count=3)
+    for vacancy in test_vacancies:
+        saver.add_vacancy(dict(vacancy))
+    yield saver
+    saver.close()
+
+
+def test_shard_index_is_stable() -> None:
+    """Тестирует, что номер шарда не зависит от запуска и лежит в допустимом диапазоне."""
+    assert shard_index("https://example.com", 4) == shard_index("https://example.com", 4)
+    assert all(0 <= shard_index(f"https://example.com/{i}", 4) < 4 for i in range(100))
+
+
+def test_add_vacancy_distributes_by_link(tmp_path: Path, sharded_saver: ShardedJSONFileHandler) -> None:
+    """Тестирует, что вакансии раскладываются по шардам согласно хешу ссылки."""
+    assert len(list((tmp_path / "shards").glob("shard_*.json"))) == 3
+    for i, shard in enumerate(sharded_saver._shards):
+        for vacancy in shard._load_data():
+            assert shard_index(vacancy["link"], 3) == i
+
+
+def test_filter_vacancies(sharded_saver: ShardedJSONFileHandler) -> None:
+    """Тестирует параллельную фильтрацию по ключевым словам и стабильность порядка."""
+    filtered = sharded_saver.filter_vacancies(["Python"])
+    assert len(filtered) == 5
+    assert all("Python" in v["description"] for v in filtered)
+    assert filtered == sharded_saver.filter_vacancies(["Python"])
+    assert len(sharded_saver.filter_vacancies([])) == 10
+
+
+def test_filter_vacancies_by_salary(sharded_saver: ShardedJSONFileHandler) -> None:
+    """Тестирует параллельную фильтрацию по диапазону зарплат."""
+    filtered = sharded_saver.filter_vacancies_by_salary((80000, 110000))
+    assert sorted(v["salary"] for v in filtered) == [80000, 90000, 100000, 110000]
+
+
+def test_existing_shard_count_is_kept(tmp_path: Path, sharded_saver: ShardedJSONFileHandler) -> None:
+    """Тестирует, что повторное открытие хранилища не меняет число шардов."""
+    reopened = ShardedJSONFileHandler(str(tmp_path / "shards"), shard_count=5)
+    assert reopened.shard_count == 3
+    assert len(reopened.filter_vacancies([])) == 10
+
+
+def test_rebalance(tmp_path: Path, sharded_saver: ShardedJSONFileHandler) -> None:
+    """Тестирует перераспределение вакансий по новому числу шардов."""
+    sharded_saver.rebalance(2)
+    assert sharded_saver.shard_count == 2
+    assert len(list((tmp_path / "shards").glob("shard_*.json"))) == 2
+    assert len(sharded_saver.filter_vacancies([])) == 10
+    for i, shard in enumerate(sharded_saver._shards):
+        assert all(shard_index(v["link"], 2) == i for v in shard._load_data())
+
+
+def test_rebalance_failure_keeps_store(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, sharded_saver: ShardedJSONFileHandler
+) -> None:
+    """Тестирует, что ошибка при записи новых шардов не затрагивает старые и не оставляет временных файлов."""
+    written: List[str] = []
+
+    def failing_write(directory: str, data: List[Dict[str, Any]]) -> str:
+        if written:
+            raise OSError("Диск заполнен")
+        written.append(write_temp_json(directory, data))
+        return written[-1]
+
+    monkeypatch.setattr("src.sharded_file_handler.write_temp_json", failing_write)
+    with pytest.raises(OSError):
+        sharded_saver.rebalance(5)
+    assert sharded_saver.shard_count == 3
+    assert sorted(path.name for path in (tmp_path / "shards").iterdir()) == [f"shard_00{i}.json" for i in range(3)]
+    assert len(ShardedJSONFileHandler(str(tmp_path / "shards")).filter_vacancies([])) == 10
+
+
+def test_add_vacancies(sharded_saver: ShardedJSONFileHandler, test_vacancies: List[Dict[str, Any]]) -> None:
+    """Тестирует пакетное добавление: возвращается число добавленных, повторы ищутся во всех шардах."""
+    repost = dict(test_vacancies[0], link="https://example.com/vacancy/repost")
+    new = {"title": "Go Developer", "link": "https://example.com/go", "salary": 1, "description": "Опыт работы с Go"}
+    added = sharded_saver.add_vacancies([dict(test_vacancies[1]), repost, new], near_duplicates="skip")
+    assert added == 1
+    assert len(sharded_saver.filter_vacancies([])) == 11
+
+
+def test_process_pool_is_reused(monkeypatch: pytest.MonkeyPatch, sharded_saver: ShardedJSONFileHandler) -> None:
+    """Тестирует, что пул процессов создаётся один раз на хранилище, а при одном ядре не создаётся вовсе."""
+    monkeypatch.setattr("src.sharded_file_handler.default_shard_count", lambda: 2)
+    sharded_saver.filter_vacancies(["Python"])
+    executor = sharded_saver._executor
+    sharded_saver.filter_vacancies_by_salary((0, 100000))
+    assert executor is not None and sharded_saver._executor is executor
+    sharded_saver.close()
+    assert sharded_saver._executor is None
+
+    monkeypatch.setattr("src.sharded_file_handler.default_shard_count", lambda: 1)
+    assert len(sharded_saver.filter_vacancies(["Python"])) == 5
+    assert sharded_saver._executor is None
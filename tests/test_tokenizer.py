@@ -0,0 +1,47 @@
+from src.tokenizer import normalize, query_patterns, query_terms, stem, token_set, token_string, tokenize
+
+
+def test_normalize() -> None:
+    """Тестирует приведение к нижнему регистру и замену «ё» на «е»."""
+    assert normalize("Ёжик в ТУМАНЕ") == "ежик в тумане"
+
+
+def test_stem() -> None:
+    """Тестирует стеммер на разных формах одного слова."""
+    assert stem("разработчик") == stem("разработчика") == stem("разработчиков")
+    assert stem("программист") == stem("программистом")
+    assert stem("знания") == stem("знание")
+    # Латинские слова не стеммируются
+    assert stem("javascript") == "javascript"
+    assert stem("java") == "java"
+
+
+def test_tokenize() -> None:
+    """Тестирует разбиение текста на основы слов."""
+    assert tokenize("Знание Python, C++ и C#") == ["знан", "python", "c++", "и", "c#"]
+    assert tokenize("") == []
+    assert tokenize(None) == []
+
+
+def test_token_set() -> None:
+    """Тестирует получение отсортированного списка уникальных основ."""
+    assert token_set("Python python PYTHON") == ["python"]
+    assert token_set("Ищем разработчика, опытного разработчика") == sorted(
+        {stem("ищем"), stem("разработчика"), stem("опытного")}
+    )
+
+
+def test_query_terms() -> None:
+    """Тестирует преобразование ключевых слов запроса в наборы основ."""
+    assert query_terms(("Разработчиков", "data science", "!!!")) == (
+        frozenset({"разработчик"}),
+        frozenset({"data", "science"}),
+    )
+
+
+def test_token_string_and_query_patterns() -> None:
+    """Тестирует строку основ и поиск в ней по подстрокам " основа "."""
+    tokens = token_string("Разработчик на JavaScript")
+    assert tokens == " javascript на разработчик "
+    assert query_patterns(("разработчиков", "data science")) == ((" разработчик ",), (" data ", " science "))
+    assert " java " not in tokens
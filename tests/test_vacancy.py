@@ -1,3 +1,5 @@
+from typing import Any
+
 import pytest
 
 from src.file_handler import JSONFileHandler
@@ -61,22 +63,37 @@ def test_vacancy_to_dict() -> None:
     assert vacancy_dict["description"] == "Требуется опыт работы с Python."
 
 
-def test_validate_salary() -> None:
-    """Тестирует метод _validate_salary."""
-    # Тест с числовым значением
-    assert Vacancy._validate_salary(100000) == 100000
-
-    # Тест со строковым значением
-    assert Vacancy._validate_salary("100 000-150 000 руб.") == 100000.0
-
-    # Тест с None
-    assert Vacancy._validate_salary(None) == "Зарплата не указана"
-
-    # Тест с пустой строкой
-    assert Vacancy._validate_salary("") == "Зарплата не указана"
-
-    # Тест с некорректным форматом
-    assert Vacancy._validate_salary("некорректная зарплата") == "Зарплата не указана"
+def test_vacancy_salary_range() -> None:
+    """Тестирует перевод зарплатной вилки из API в рубли."""
+    vacancy = Vacancy.from_dict(
+        {
+            "title": "Python Developer",
+            "link": "https://example.com/python-dev",
+            "salary": 1000,
+            "salary_range": {"from": 1000, "to": 2000, "currency": "USD", "gross": False},
+            "description": "Python",
+        }
+    )
+    assert vacancy.salary == 92000
+    assert (vacancy.salary_from, vacancy.salary_to) == (92000, 184000)
+    vacancy_dict = vacancy.to_dict()
+    assert vacancy_dict["salary_rub"] == 92000
+    assert vacancy_dict["salary_range"]["currency"] == "USD"
+
+
+@pytest.mark.parametrize(
+    "salary, expected",
+    [
+        (100000, 100000),
+        ("100 000-150 000 руб.", 100000.0),
+        (None, "Зарплата не указана"),
+        ("", "Зарплата не указана"),
+        ("некорректная зарплата", "Зарплата не указана"),
+    ],
+)
+def test_salary_parsing(salary: Any, expected: Any) -> None:
+    """Тестирует разбор зарплаты при создании вакансии."""
+    assert Vacancy("Python Developer", "https://example.com", salary, "Python").salary == expected
 
 
 def test_vacancy_creation() -> None: